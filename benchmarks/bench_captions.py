@@ -0,0 +1,147 @@
+# benchmarks/bench_captions.py - 캡션 생성 벤치마크 (OpenAI 대역 서버 사용)
+"""
+로컬 OpenAI 대역 서버를 띄우고 같은 기사 목록의 캡션을 여러 방식으로 생성해
+API 요청 수, 전체 시간, 폴백 수를 비교합니다.
+
+    per_article  - 기사마다 요청 (batch_size=1)
+    batched      - generate_captions로 CAPTION_BATCH_SIZE개씩 묶어 요청
+    single_calls - generate_viral_caption 단건 호출을 동시에 실행 (모아서 요청)
+    cached       - 같은 기사 재요청 (캡션 캐시 적중)
+
+    python benchmarks/bench_captions.py --articles 40 --latency 0.3
+    python benchmarks/bench_captions.py --rate-limit-rate 0.2 --error-rate 0.1
+"""
+
+import argparse
+import asyncio
+import hashlib
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from common import environment_info, git_revision, prepare_workdir, save_results
+from openai_server import add_server_arguments, server_from_args
+from rss_server import WORDS
+
+def _synthetic_news(count: int, prefix: str) -> list:
+    news_list = []
+    for i in range(count):
+        title = " ".join(WORDS[(i * 7 + j) % len(WORDS)] for j in range(6)) + f" {prefix}{i}"
+        news_list.append({
+            "title": title,
+            "title_hash": hashlib.md5(title.encode("utf-8")).hexdigest(),
+            "summary": f"{title} 관련 기사 요약입니다."
+        })
+    return news_list
+
+async def _run_mode(news_app, server, mode: str, news_list: list, style: str) -> dict:
+    generator = news_app.get_content_generator()
+    server_before = dict(server.stats)
+    fallbacks_before = generator.stats["fallbacks"]
+    started = time.perf_counter()
+
+    if mode == "per_article":
+        captions = await generator.generate_captions(news_list, style, batch_size=1)
+    elif mode == "single_calls":
+        captions = await asyncio.gather(*(generator.generate_viral_caption(news, style) for news in news_list))
+    else:
+        captions = await generator.generate_captions(news_list, style)
+
+    elapsed = time.perf_counter() - started
+    sources = {}
+    for caption in captions:
+        sources[caption["source"]] = sources.get(caption["source"], 0) + 1
+    api_requests = server.stats["requests"] - server_before["requests"]
+
+    return {
+        "articles": len(news_list),
+        "api_requests": api_requests,
+        "articles_per_request": round(len(news_list) / api_requests, 2) if api_requests else None,
+        "elapsed_seconds": round(elapsed, 4),
+        "fallbacks": generator.stats["fallbacks"] - fallbacks_before,
+        "sources": sources,
+        "server": {key: server.stats[key] - server_before[key] for key in ("ok", "errors", "rate_limited")}
+    }
+
+async def run_benchmark(args) -> dict:
+    server = server_from_args(args)
+    url = await server.start()
+    prepare_workdir({
+        "OPENAI_API_KEY": "mock",
+        "OPENAI_BASE_URL": url,
+        "CAPTION_BATCH_SIZE": args.batch_size,
+        "CAPTION_TIMEOUT_SECONDS": args.timeout,
+        "CAPTION_REQUESTS_PER_MINUTE": args.rpm,
+        "CAPTION_RETRY_BASE_SECONDS": 0.05,
+        "CRAWL_SCHEDULER_ENABLED": "false",
+        "TTS_ENGINE": "stub"
+    })
+
+    import clean_news_automation as news_app
+
+    results = {}
+    try:
+        async with news_app.app.router.lifespan_context(news_app.app):
+            # 캐시 적중을 피하도록 방식마다 다른 제목 사용 (cached는 batched와 같은 기사)
+            batched_news = _synthetic_news(args.articles, "b")
+            plan = [
+                ("per_article", _synthetic_news(args.articles, "p")),
+                ("batched", batched_news),
+                ("single_calls", _synthetic_news(args.articles, "s")),
+                ("cached", batched_news)
+            ]
+            for mode, news_list in plan:
+                print(f"⏱️ {mode} 측정 중...")
+                results[mode] = await _run_mode(news_app, server, mode, news_list, args.style)
+    finally:
+        await server.stop()
+
+    return {
+        "benchmark": "captions",
+        "git_revision": git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "environment": environment_info(),
+        "config": {
+            "articles": args.articles,
+            "batch_size": args.batch_size,
+            "style": args.style,
+            "timeout": args.timeout,
+            "rpm": args.rpm,
+            "server": {
+                "latency": args.latency,
+                "error_rate": args.error_rate,
+                "rate_limit_rate": args.rate_limit_rate,
+                "retry_after": args.retry_after,
+                "seed": args.seed
+            }
+        },
+        "results": results
+    }
+
+def print_summary(payload: dict):
+    for mode, result in payload["results"].items():
+        print(
+            f"📊 [{mode}] {result['articles']}개 기사 / 요청 {result['api_requests']}회 "
+            f"({result['articles_per_request']}개/요청) | {result['elapsed_seconds']:.2f}초 | "
+            f"폴백 {result['fallbacks']} | 429={result['server']['rate_limited']} 5xx={result['server']['errors']}"
+        )
+
+def main():
+    parser = argparse.ArgumentParser(description="캡션 생성 벤치마크")
+    parser.add_argument("--articles", type=int, default=40)
+    parser.add_argument("--batch-size", type=int, default=8, help="CAPTION_BATCH_SIZE")
+    parser.add_argument("--style", default="viral")
+    parser.add_argument("--timeout", type=float, default=20, help="CAPTION_TIMEOUT_SECONDS")
+    parser.add_argument("--rpm", type=float, default=600, help="CAPTION_REQUESTS_PER_MINUTE")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: benchmarks/results/captions_<시각>.json)")
+    add_server_arguments(parser)
+    args = parser.parse_args()
+
+    payload = asyncio.run(run_benchmark(args))
+    print_summary(payload)
+    print(f"💾 결과 저장: {save_results('captions', payload, args.output)}")
+
+if __name__ == "__main__":
+    main()
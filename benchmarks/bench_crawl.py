@@ -0,0 +1,190 @@
+# benchmarks/bench_crawl.py - 뉴스 수집 파이프라인 벤치마크
+"""
+로컬 합성 RSS 서버를 띄우고 scrape_latest_news와 /api/scrape-news를 끝까지 실행해
+처리량(기사/초), 호출 지연 p50/p99, 최대 메모리(tracemalloc), 저장된 DB 행 수를 측정합니다.
+결과는 JSON으로 저장되어 실행 간 비교에 사용합니다.
+
+    python benchmarks/bench_crawl.py --rounds 5 --items 30 --latency 0.1
+    python benchmarks/bench_crawl.py --mode api --error-rate 0.2 --no-304 --output bench_crawl.json
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from common import environment_info, git_revision, latency_summary, prepare_workdir, save_results
+from rss_server import add_server_arguments, server_from_args
+
+DUMMY_SOURCE = "뉴스 자동 생성"
+
+def _count_rows(news_app) -> int:
+    return news_app.get_database().fetchone_sync("SELECT COUNT(*) FROM news_articles")[0]
+
+async def _run_stage(news_app, server, categories, args, crawl_once) -> dict:
+    """라운드 x 카테고리 크롤링을 실행하고 지표 집계"""
+    # 단계마다 피드 캐시를 비워 첫 라운드는 항상 전체 다운로드에서 시작
+    scraper = news_app.get_news_scraper()
+    scraper.feed_cache = news_app.FeedCache()
+
+    server_before = dict(server.stats)
+    rows_before = _count_rows(news_app)
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies = []
+    rounds = []
+    articles_total = 0
+    dummy_total = 0
+
+    async def timed(category):
+        async with semaphore:
+            started = time.perf_counter()
+            news = await crawl_once(category)
+            latencies.append(time.perf_counter() - started)
+            return news
+
+    if args.tracemalloc:
+        tracemalloc.reset_peak()
+    stage_started = time.perf_counter()
+
+    for round_index in range(args.rounds):
+        round_started = time.perf_counter()
+        results = await asyncio.gather(*(timed(category) for category in categories))
+        round_elapsed = time.perf_counter() - round_started
+
+        round_articles = sum(len(news) for news in results)
+        round_dummy = sum(1 for news in results for item in news if item.get("source") == DUMMY_SOURCE)
+        articles_total += round_articles
+        dummy_total += round_dummy
+        rounds.append({
+            "round": round_index + 1,
+            "articles": round_articles,
+            "dummy_articles": round_dummy,
+            "elapsed_seconds": round(round_elapsed, 4),
+            "articles_per_second": round(round_articles / round_elapsed, 1) if round_elapsed > 0 else None
+        })
+
+    elapsed = time.perf_counter() - stage_started
+    peak_bytes = tracemalloc.get_traced_memory()[1] if args.tracemalloc else None
+
+    return {
+        "calls": len(latencies),
+        "articles": articles_total,
+        "dummy_articles": dummy_total,
+        "elapsed_seconds": round(elapsed, 4),
+        "articles_per_second": round(articles_total / elapsed, 1) if elapsed > 0 else None,
+        "latency": latency_summary(latencies),
+        "peak_memory_mb": round(peak_bytes / (1024 * 1024), 2) if peak_bytes is not None else None,
+        "db_rows_written": _count_rows(news_app) - rows_before,
+        "feed_cache": dict(scraper.feed_cache.stats),
+        "server": {key: server.stats[key] - server_before[key] for key in server.stats},
+        "rounds": rounds
+    }
+
+async def run_benchmark(args) -> dict:
+    server = server_from_args(args)
+    url = await server.start()
+    prepare_workdir({
+        "GOOGLE_NEWS_RSS_URL": url,
+        "FEED_CACHE_TTL_SECONDS": args.cache_ttl,
+        "CRAWL_SCHEDULER_ENABLED": "false",
+        "TTS_ENGINE": "stub"
+    })
+
+    import clean_news_automation as news_app
+
+    categories = args.categories or list(news_app.NEWS_CATEGORIES.keys())
+    if args.tracemalloc:
+        tracemalloc.start()
+
+    results = {}
+    try:
+        async with news_app.app.router.lifespan_context(news_app.app):
+            if args.mode in ("direct", "both"):
+                scraper = news_app.get_news_scraper()
+
+                async def crawl_direct(category):
+                    news = await scraper.scrape_latest_news(category, args.max_articles)
+                    return await news_app.save_news_articles(news)
+
+                print("⏱️ scrape_latest_news + save_news_articles 측정 중...")
+                results["direct"] = await _run_stage(news_app, server, categories, args, crawl_direct)
+
+            if args.mode in ("api", "both"):
+                import httpx
+
+                transport = httpx.ASGITransport(app=news_app.app)
+                async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+                    async def crawl_api(category):
+                        response = await client.post("/api/scrape-news", json={
+                            "category": category, "max_articles": args.max_articles
+                        })
+                        return response.json().get("news") or []
+
+                    print("⏱️ POST /api/scrape-news 측정 중...")
+                    results["api"] = await _run_stage(news_app, server, categories, args, crawl_api)
+    finally:
+        if args.tracemalloc:
+            tracemalloc.stop()
+        await server.stop()
+
+    return {
+        "benchmark": "crawl",
+        "git_revision": git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "environment": environment_info(),
+        "config": {
+            "mode": args.mode,
+            "rounds": args.rounds,
+            "categories": categories,
+            "max_articles": args.max_articles,
+            "concurrency": args.concurrency,
+            "cache_ttl": args.cache_ttl,
+            "tracemalloc": args.tracemalloc,
+            "feed": {
+                "items": args.items,
+                "latency": args.latency,
+                "error_rate": args.error_rate,
+                "not_modified": not args.no_304,
+                "change_every": args.change_every,
+                "seed": args.seed
+            }
+        },
+        "results": results
+    }
+
+def print_summary(payload: dict):
+    for mode, stage in payload["results"].items():
+        latency = stage["latency"]
+        memory = f"{stage['peak_memory_mb']}MB" if stage["peak_memory_mb"] is not None else "-"
+        print(
+            f"📊 [{mode}] {stage['articles']}개 기사 / {stage['elapsed_seconds']:.2f}초 "
+            f"= {stage['articles_per_second']}개/초 | p50 {latency['p50_ms']}ms p99 {latency['p99_ms']}ms | "
+            f"최대 메모리 {memory} | DB {stage['db_rows_written']}행 | "
+            f"서버 200={stage['server']['ok']} 304={stage['server']['not_modified']} 오류={stage['server']['errors']}"
+        )
+
+def main():
+    parser = argparse.ArgumentParser(description="뉴스 수집 파이프라인 벤치마크")
+    parser.add_argument("--mode", choices=["direct", "api", "both"], default="both")
+    parser.add_argument("--rounds", type=int, default=3, help="카테고리 전체를 반복할 횟수")
+    parser.add_argument("--categories", nargs="*", help="대상 카테고리 (기본: 전체)")
+    parser.add_argument("--max-articles", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=1, help="동시에 실행할 카테고리 수")
+    parser.add_argument("--cache-ttl", type=int, default=0,
+                        help="FEED_CACHE_TTL_SECONDS (0이면 매 라운드 조건부 요청)")
+    parser.add_argument("--no-tracemalloc", dest="tracemalloc", action="store_false",
+                        help="메모리 추적 끄기 (추적 오버헤드 없이 처리량만 측정)")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: benchmarks/results/crawl_<시각>.json)")
+    add_server_arguments(parser)
+    args = parser.parse_args()
+
+    payload = asyncio.run(run_benchmark(args))
+    print_summary(payload)
+    print(f"💾 결과 저장: {save_results('crawl', payload, args.output)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+# benchmarks/bench_render.py - 릴스 렌더링 벤치마크 + 성능 회귀 검사
+"""
+고정된 합성 제목 x 길이(15/30/60초) x 스타일 조합으로 _create_opencv_video와
+create_news_reel을 실행해 프레임/초, 전체 시간, CPU 시간, 최대 RSS, 출력 용량을 기록합니다.
+기준 결과(baseline)와 비교해 설정한 비율 이상 느려지면 종료 코드 1로 실패합니다.
+TTS는 스텁 엔진을 사용하므로 네트워크와 디스플레이 없이 실행됩니다.
+
+    python benchmarks/bench_render.py --update-baseline          # 기준 결과 저장
+    python benchmarks/bench_render.py --threshold 15             # 기준 대비 15% 이상 느려지면 실패
+    python benchmarks/bench_render.py --durations 15 --styles trending --repeat 3
+"""
+
+import argparse
+import asyncio
+import glob
+import json
+import os
+import resource
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from common import REPO_ROOT, environment_info, git_revision, prepare_workdir, save_results
+
+DEFAULT_BASELINE = os.path.join(REPO_ROOT, "benchmarks", "baselines", "render_baseline.json")
+
+# 길이가 다른 제목 (줄바꿈 1~3줄, 50자 초과 시 잘림 경로 포함)
+SYNTHETIC_TITLES = [
+    "Breaking: markets rally 5% after rate decision",
+    "AI startup unveils new chip as investors pile into semiconductor stocks ahead of earnings",
+    "코스피 사상최고가 경신, 반도체 수출 회복에 외국인 순매수 이어져"
+]
+ENTRYPOINTS = ("video", "reel")
+
+def _clock_ticks() -> int:
+    try:
+        return os.sysconf("SC_CLK_TCK")
+    except (ValueError, OSError, AttributeError):
+        return 100
+
+def _worker_pids(news_app) -> list:
+    executor = news_app._render_executor
+    if executor is None or not getattr(executor, "_processes", None):
+        return []
+    return list(executor._processes)
+
+def _process_cpu_seconds(pid: int) -> float:
+    """/proc/<pid>/stat의 utime + stime (리눅스 외에는 0)"""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / _clock_ticks()
+    except (OSError, IndexError, ValueError):
+        return 0.0
+
+def _process_peak_rss_mb(pid: int) -> float:
+    """/proc/<pid>/status의 VmHWM (최대 RSS)"""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except (OSError, ValueError):
+        pass
+    return 0.0
+
+def _self_peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, 리눅스는 KB 단위
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def _cpu_seconds(news_app) -> float:
+    """이 프로세스 + 렌더링 워커 프로세스의 누적 CPU 시간"""
+    return time.process_time() + sum(_process_cpu_seconds(pid) for pid in _worker_pids(news_app))
+
+async def _reset_caches(news_app):
+    """반복 실행이 캐시 적중으로 끝나지 않도록 렌더/TTS 캐시 비우기"""
+    await news_app.get_database().execute("DELETE FROM render_cache")
+    for path in glob.glob(os.path.join(news_app.VIDEO_OUTPUT_DIR, "reel_*.mp4")):
+        os.remove(path)
+    for path in glob.glob(os.path.join(news_app.AUDIO_OUTPUT_DIR, "tts_*.mp3")):
+        os.remove(path)
+
+async def _run_case(news_app, producer, entrypoint: str, title: str, style: str, duration: int) -> dict:
+    await _reset_caches(news_app)
+    news_data = {"id": 0, "title": title, "summary": title, "category": "technology", "viral_score": 0.0}
+
+    cpu_before = _cpu_seconds(news_app)
+    started = time.perf_counter()
+    if entrypoint == "video":
+        result = await producer._create_opencv_video(news_data, duration, style=style)
+    else:
+        result = await producer.create_news_reel(news_data, style, duration)
+    wall = time.perf_counter() - started
+    cpu = _cpu_seconds(news_app) - cpu_before
+
+    if not result.get("success"):
+        raise RuntimeError(f"렌더링 실패 ({entrypoint}/{style}/{duration}s): {result.get('error')}")
+
+    frames = int(duration * news_app.REEL_FPS)
+    return {
+        "wall_seconds": wall,
+        "cpu_seconds": cpu,
+        "fps": frames / wall if wall > 0 else 0.0,
+        "frames": frames,
+        "output_mb": os.path.getsize(result["video_path"]) / (1024 * 1024)
+    }
+
+async def run_benchmark(args) -> dict:
+    prepare_workdir({
+        "TTS_ENGINE": "stub",
+        "RENDER_WORKERS": args.workers,
+        "RENDER_START_METHOD": args.start_method,
+        "CRAWL_SCHEDULER_ENABLED": "false"
+    })
+
+    import clean_news_automation as news_app
+
+    styles = args.styles or list(news_app.REEL_STYLES.keys())
+    titles = SYNTHETIC_TITLES[:args.titles]
+    cases = {}
+
+    async with news_app.app.router.lifespan_context(news_app.app):
+        producer = news_app.get_reels_producer()
+
+        # 워커 프로세스 기동 비용은 측정에서 제외
+        await _reset_caches(news_app)
+        await producer._create_opencv_video({"title": "warmup"}, 1)
+
+        benchmark_started = time.perf_counter()
+        for entrypoint in args.entrypoints:
+            for style in styles:
+                for duration in args.durations:
+                    samples = []
+                    for _ in range(args.repeat):
+                        for title in titles:
+                            samples.append(await _run_case(news_app, producer, entrypoint, title, style, duration))
+
+                    case_id = f"{entrypoint}/{style}/{duration}s"
+                    cases[case_id] = {
+                        "entrypoint": entrypoint,
+                        "style": style,
+                        "duration": duration,
+                        "samples": len(samples),
+                        "fps": round(statistics.median(s["fps"] for s in samples), 1),
+                        "wall_seconds": round(statistics.median(s["wall_seconds"] for s in samples), 4),
+                        "cpu_seconds": round(statistics.median(s["cpu_seconds"] for s in samples), 4),
+                        "output_mb": round(statistics.median(s["output_mb"] for s in samples), 3)
+                    }
+                    print(f"🎬 {case_id}: {cases[case_id]['fps']} fps, {cases[case_id]['wall_seconds']:.2f}초, "
+                          f"CPU {cases[case_id]['cpu_seconds']:.2f}초, {cases[case_id]['output_mb']}MB")
+
+        total_wall = time.perf_counter() - benchmark_started
+        worker_peak_rss = max((_process_peak_rss_mb(pid) for pid in _worker_pids(news_app)), default=0.0)
+
+    return {
+        "benchmark": "render",
+        "git_revision": git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "environment": environment_info(),
+        "config": {
+            "renderer_version": news_app.RENDERER_VERSION,
+            "resolution": [news_app.REEL_WIDTH, news_app.REEL_HEIGHT],
+            "fps": news_app.REEL_FPS,
+            "workers": args.workers,
+            "start_method": args.start_method,
+            "titles": titles,
+            "styles": styles,
+            "durations": args.durations,
+            "entrypoints": args.entrypoints,
+            "repeat": args.repeat
+        },
+        "summary": {
+            "total_wall_seconds": round(total_wall, 3),
+            "total_frames": sum(case["samples"] * case["duration"] * news_app.REEL_FPS for case in cases.values()),
+            "peak_rss_mb": {
+                "main": round(_self_peak_rss_mb(), 1),
+                "render_worker": round(worker_peak_rss, 1)
+            }
+        },
+        "cases": cases
+    }
+
+def compare_with_baseline(payload: dict, baseline: dict, threshold: float) -> list:
+    """기준 대비 fps가 threshold% 이상 떨어진 케이스 목록"""
+    regressions = []
+    for case_id, case in payload["cases"].items():
+        base = baseline.get("cases", {}).get(case_id)
+        if base is None or not base.get("fps"):
+            continue
+        change = (case["fps"] - base["fps"]) / base["fps"] * 100
+        case["baseline_fps"] = base["fps"]
+        case["fps_change_percent"] = round(change, 1)
+        if change < -threshold:
+            regressions.append((case_id, base["fps"], case["fps"], change))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="릴스 렌더링 벤치마크 + 성능 회귀 검사")
+    parser.add_argument("--durations", type=int, nargs="+", default=[15, 30, 60])
+    parser.add_argument("--styles", nargs="*", help="대상 스타일 (기본: REEL_STYLES 전체)")
+    parser.add_argument("--entrypoints", nargs="+", choices=ENTRYPOINTS, default=list(ENTRYPOINTS),
+                        help="video=_create_opencv_video, reel=create_news_reel (스텁 TTS 포함)")
+    parser.add_argument("--titles", type=int, default=len(SYNTHETIC_TITLES), help="사용할 합성 제목 수")
+    parser.add_argument("--repeat", type=int, default=1, help="케이스별 반복 횟수 (중앙값 사용)")
+    parser.add_argument("--workers", type=int, default=1, help="RENDER_WORKERS")
+    parser.add_argument("--start-method", default="spawn", choices=["spawn", "fork", "forkserver"])
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="기준 결과 JSON 경로")
+    parser.add_argument("--threshold", type=float, default=15.0, help="허용 fps 하락 비율 (%%)")
+    parser.add_argument("--update-baseline", action="store_true", help="이번 결과를 기준으로 저장")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: benchmarks/results/render_<시각>.json)")
+    args = parser.parse_args()
+
+    payload = asyncio.run(run_benchmark(args))
+
+    regressions = []
+    if args.update_baseline:
+        print(f"📌 기준 결과 저장: {save_results('render_baseline', payload, args.baseline)}")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_with_baseline(payload, baseline, args.threshold)
+        payload["gate"] = {
+            "baseline": args.baseline,
+            "baseline_revision": baseline.get("git_revision"),
+            "threshold_percent": args.threshold,
+            "passed": not regressions
+        }
+    else:
+        print(f"⚠️ 기준 결과 없음 ({args.baseline}) - 회귀 검사 생략 (--update-baseline으로 생성)")
+
+    print(f"⏱️ 전체 {payload['summary']['total_wall_seconds']}초, "
+          f"최대 RSS {payload['summary']['peak_rss_mb']}")
+    print(f"💾 결과 저장: {save_results('render', payload, args.output)}")
+
+    if regressions:
+        for case_id, base_fps, fps, change in regressions:
+            print(f"❌ 성능 회귀 {case_id}: {base_fps} → {fps} fps ({change:.1f}%)")
+        sys.exit(1)
+    if "gate" in payload:
+        print(f"✅ 성능 회귀 없음 (허용 하락 {args.threshold}%)")
+
+if __name__ == "__main__":
+    main()
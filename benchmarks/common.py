@@ -0,0 +1,70 @@
+# benchmarks/common.py - 벤치마크 공용 도구
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(REPO_ROOT, "benchmarks", "results")
+# prepare_workdir가 작업 디렉토리를 바꾸므로 상대 경로는 실행 위치 기준으로 해석
+INVOCATION_DIR = os.getcwd()
+
+def prepare_workdir(env: dict) -> str:
+    """임시 작업 디렉토리로 이동하고 환경변수 설정 (앱 모듈 import 전에 호출)"""
+    workdir = tempfile.mkdtemp(prefix="news_bench_")
+    os.chdir(workdir)
+    env = {"DATABASE_PATH": os.path.join(workdir, "bench.db"), **env}
+    os.environ.update({key: str(value) for key, value in env.items()})
+    if REPO_ROOT not in sys.path:
+        sys.path.insert(0, REPO_ROOT)
+    return workdir
+
+def percentile(values, q: float) -> float:
+    """선형 보간 백분위수 (q: 0~100)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+def latency_summary(latencies) -> dict:
+    return {
+        "count": len(latencies),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "max_ms": round(max(latencies) * 1000, 2) if latencies else 0.0
+    }
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return "unknown"
+
+def environment_info() -> dict:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count()
+    }
+
+def save_results(name: str, payload: dict, output: str = None) -> str:
+    """결과 JSON 저장 (경로 미지정 시 benchmarks/results/<이름>_<시각>.json)"""
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f"{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    else:
+        output = os.path.join(INVOCATION_DIR, output)
+        os.makedirs(os.path.dirname(output), exist_ok=True)
+
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+    return output
@@ -0,0 +1,145 @@
+# benchmarks/openai_server.py - OpenAI Chat Completions 대역 서버 (캡션 생성 테스트/벤치마크용)
+"""
+/v1/chat/completions 요청을 받아 캡션 JSON을 돌려주는 로컬 aiohttp 서버.
+응답 지연, 5xx 오류율, 429(Retry-After) 비율을 조절할 수 있습니다.
+
+    python benchmarks/openai_server.py --port 8766 --latency 0.3
+    OPENAI_API_KEY=mock OPENAI_BASE_URL=http://127.0.0.1:8766/v1 uvicorn clean_news_automation:app
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from aiohttp import web
+
+class MockOpenAIServer:
+    def __init__(self, latency: float = 0.2, error_rate: float = 0.0, rate_limit_rate: float = 0.0,
+                 retry_after: float = 0.1, seed: int = 20240801):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self._random = random.Random(seed)
+        self._runner = None
+        self.url = None
+        self.stats = {"requests": 0, "ok": 0, "errors": 0, "rate_limited": 0, "items": 0, "max_batch": 0}
+
+    @staticmethod
+    def _items_from_messages(messages: list) -> list:
+        """사용자 메시지 마지막 줄의 JSON 배열 (캡션 대상 기사 목록)"""
+        for message in reversed(messages):
+            if message.get("role") != "user":
+                continue
+            try:
+                items = json.loads(message["content"].rsplit("\n", 1)[-1])
+            except (ValueError, KeyError):
+                return []
+            return items if isinstance(items, list) else []
+        return []
+
+    def _error(self, status: int, message: str, headers: dict = None) -> web.Response:
+        body = {"error": {"message": message, "type": "mock_error", "code": status}}
+        return web.json_response(body, status=status, headers=headers)
+
+    async def handle_completions(self, request: web.Request) -> web.Response:
+        self.stats["requests"] += 1
+        payload = await request.json()
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        roll = self._random.random()
+        if roll < self.rate_limit_rate:
+            self.stats["rate_limited"] += 1
+            return self._error(429, "mock rate limit", {"retry-after": str(self.retry_after)})
+        if roll < self.rate_limit_rate + self.error_rate:
+            self.stats["errors"] += 1
+            return self._error(500, "mock server error")
+
+        items = self._items_from_messages(payload.get("messages", []))
+        captions = [
+            {
+                "id": item.get("id"),
+                "caption": f"🔥 {item.get('title', '')}\n\n여러분 생각은? 👇",
+                "hashtags": ["#뉴스", "#속보"]
+            }
+            for item in items if isinstance(item, dict)
+        ]
+        self.stats["ok"] += 1
+        self.stats["items"] += len(captions)
+        self.stats["max_batch"] = max(self.stats["max_batch"], len(captions))
+
+        content = json.dumps({"captions": captions}, ensure_ascii=False)
+        prompt_tokens = sum(len(message.get("content", "")) for message in payload.get("messages", [])) // 2
+        return web.json_response({
+            "id": f"chatcmpl-mock-{self.stats['requests']}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": payload.get("model", "mock"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop"
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": len(content) // 2,
+                "total_tokens": prompt_tokens + len(content) // 2
+            }
+        })
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """서버 시작 후 base_url 반환 (port=0이면 빈 포트 자동 선택)"""
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", self.handle_completions)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+
+        bound_port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://{host}:{bound_port}/v1"
+        return self.url
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+def add_server_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--latency", type=float, default=0.2, help="응답 지연 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 응답 비율 (0~1)")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="429 응답 비율 (0~1)")
+    parser.add_argument("--retry-after", type=float, default=0.1, help="429 응답의 Retry-After (초)")
+    parser.add_argument("--seed", type=int, default=20240801)
+
+def server_from_args(args) -> MockOpenAIServer:
+    return MockOpenAIServer(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        seed=args.seed
+    )
+
+async def _serve_forever(args):
+    server = server_from_args(args)
+    url = await server.start(args.host, args.port)
+    print(f"🤖 OpenAI 대역 서버 실행 중: {url}")
+    try:
+        while True:
+            await asyncio.sleep(3600)
+    finally:
+        await server.stop()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="OpenAI Chat Completions 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    add_server_arguments(parser)
+    try:
+        asyncio.run(_serve_forever(parser.parse_args()))
+    except KeyboardInterrupt:
+        print("👋 서버 종료")
@@ -0,0 +1,153 @@
+# benchmarks/rss_server.py - Google News RSS 대역 서버 (벤치마크용)
+"""
+Google News 검색 RSS와 같은 모양의 합성 피드를 돌려주는 로컬 aiohttp 서버.
+피드 크기, 응답 지연, 오류율, ETag/304 동작을 조절할 수 있습니다.
+
+    python benchmarks/rss_server.py --port 8765 --items 30 --latency 0.1
+    GOOGLE_NEWS_RSS_URL=http://127.0.0.1:8765/rss/search uvicorn clean_news_automation:app
+"""
+
+import argparse
+import asyncio
+import hashlib
+import random
+from email.utils import formatdate
+from xml.sax.saxutils import escape
+
+from aiohttp import web
+
+# 제목 생성용 단어 (무작위 조합이라 유사 제목 검출에 걸리지 않음)
+WORDS = [
+    "정부", "발표", "시장", "급등", "폭락", "기업", "실적", "전망", "투자자", "주목",
+    "코스피", "나스닥", "금리", "인상", "동결", "환율", "반도체", "수출", "회복", "둔화",
+    "국회", "법안", "통과", "여야", "합의", "대통령", "회담", "외교", "협력", "갈등",
+    "인공지능", "신제품", "공개", "출시", "혁신", "스타트업", "투자", "유치", "개발", "성공",
+    "배우", "드라마", "시청률", "콘서트", "매진", "논란", "해명", "사회", "사건", "조사",
+    "날씨", "폭우", "폭염", "교통", "사고", "병원", "의료", "교육", "입시", "개편"
+]
+SOURCES = ["연합뉴스", "한국경제", "매일경제", "조선일보", "중앙일보", "KBS", "SBS", "MBC"]
+
+class FeedServer:
+    def __init__(self, items: int = 20, latency: float = 0.05, error_rate: float = 0.0,
+                 not_modified: bool = True, change_every: int = 0, seed: int = 20240801):
+        self.items = items
+        self.latency = latency
+        self.error_rate = error_rate
+        self.not_modified = not_modified
+        # 검색어별 N번째 요청마다 피드 내용 변경 (0이면 변경 없음)
+        self.change_every = change_every
+        self.seed = seed
+        self._random = random.Random(seed)
+        self._request_counts = {}
+        self._runner = None
+        self.url = None
+        self.stats = {"requests": 0, "ok": 0, "not_modified": 0, "errors": 0, "bytes": 0}
+
+    def _version(self, query: str) -> int:
+        count = self._request_counts.get(query, 0)
+        self._request_counts[query] = count + 1
+        return count // self.change_every if self.change_every else 0
+
+    def _etag(self, query: str, version: int) -> str:
+        digest = hashlib.md5(f"{query}:{version}:{self.items}".encode("utf-8")).hexdigest()[:16]
+        return f'"{digest}"'
+
+    def render_feed(self, query: str, version: int) -> str:
+        """검색어/버전마다 고정된 합성 피드"""
+        rng = random.Random(f"{self.seed}:{query}:{version}")
+        items = []
+        for i in range(self.items):
+            title = " ".join(rng.sample(WORDS, 6)) + f" {rng.randint(1, 99)}%"
+            source = rng.choice(SOURCES)
+            link = f"https://news.example.com/{hashlib.md5(f'{query}:{version}:{i}'.encode()).hexdigest()}"
+            published = formatdate(1700000000 + version * 3600 + i * 60, usegmt=True)
+            items.append(
+                f"<item><title>{escape(title)} - {source}</title><link>{link}</link>"
+                f"<guid isPermaLink=\"false\">{link}</guid><pubDate>{published}</pubDate>"
+                f"<description>{escape(title)} 관련 기사 요약입니다.</description>"
+                f"<source url=\"https://{source}.example.com\">{source}</source></item>"
+            )
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+            f"<title>\"{escape(query)}\" - Google 뉴스</title><link>https://news.google.com</link>"
+            f"<language>ko</language>{''.join(items)}</channel></rss>"
+        )
+
+    async def handle_search(self, request: web.Request) -> web.Response:
+        self.stats["requests"] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        if self.error_rate and self._random.random() < self.error_rate:
+            self.stats["errors"] += 1
+            return web.Response(status=503, text="synthetic error")
+
+        query = request.query.get("q", "")
+        version = self._version(query)
+        etag = self._etag(query, version)
+
+        if self.not_modified and request.headers.get("If-None-Match") == etag:
+            self.stats["not_modified"] += 1
+            return web.Response(status=304, headers={"ETag": etag})
+
+        body = self.render_feed(query, version)
+        self.stats["ok"] += 1
+        self.stats["bytes"] += len(body.encode("utf-8"))
+        headers = {"ETag": etag} if self.not_modified else {}
+        return web.Response(text=body, content_type="application/rss+xml", charset="utf-8", headers=headers)
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """서버 시작 후 검색 URL 반환 (port=0이면 빈 포트 자동 선택)"""
+        app = web.Application()
+        app.router.add_get("/rss/search", self.handle_search)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+
+        bound_port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://{host}:{bound_port}/rss/search"
+        return self.url
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+def add_server_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--items", type=int, default=20, help="피드당 기사 수")
+    parser.add_argument("--latency", type=float, default=0.05, help="응답 지연 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 응답 비율 (0~1)")
+    parser.add_argument("--no-304", action="store_true", help="ETag/304 응답 비활성화")
+    parser.add_argument("--change-every", type=int, default=0, help="검색어별 N번째 요청마다 피드 변경")
+    parser.add_argument("--seed", type=int, default=20240801)
+
+def server_from_args(args) -> FeedServer:
+    return FeedServer(
+        items=args.items,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        not_modified=not args.no_304,
+        change_every=args.change_every,
+        seed=args.seed
+    )
+
+async def _serve_forever(args):
+    server = server_from_args(args)
+    url = await server.start(args.host, args.port)
+    print(f"📡 합성 RSS 서버 실행 중: {url}")
+    try:
+        while True:
+            await asyncio.sleep(3600)
+    finally:
+        await server.stop()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Google News RSS 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_server_arguments(parser)
+    try:
+        asyncio.run(_serve_forever(parser.parse_args()))
+    except KeyboardInterrupt:
+        print("👋 서버 종료")
@@ -1,49 +1,39 @@
 # clean_news_automation.py - MoviePy 완전 제거 버전
 from fastapi import FastAPI, Request, Depends, HTTPException, Response, UploadFile, File
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, FileResponse
+from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, FileResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, contextmanager
 import hashlib
 import secrets
 import os
+import sys
 import sqlite3
-from datetime import datetime, timedelta
-import uvicorn
+from datetime import datetime, timedelta, timezone
 import json
 from typing import Optional, Dict, Any, List
-import requests
+from collections import OrderedDict
 import asyncio
 import logging
-import jwt
+import importlib
+import importlib.util
 import random
 from pydantic import BaseModel
-import aiohttp
-from bs4 import BeautifulSoup
-import feedparser
 import re
-from urllib.parse import urlparse, urljoin
 import time
-from PIL import Image, ImageDraw, ImageFont, ImageFilter
-import tempfile
 import urllib.parse
-import subprocess
-import cv2
-import numpy as np
-import shutil
-
-# TTS 처리 (안전하게)
-try:
-    import gtts
-    TTS_AVAILABLE = True
-    logger.info("✅ gTTS 사용 가능")
-except ImportError:
-    TTS_AVAILABLE = False
-    logging.warning("⚠️ gTTS 없음 - TTS 기능 비활성화")
-
-from io import BytesIO
-import base64
+import xml.etree.ElementTree as ET
+import zlib
+import bisect
+import heapq
+import queue
+import threading
+import multiprocessing
+import socket
+import uuid
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 # ===== 로깅 설정 =====
 logging.basicConfig(
@@ -62,6 +52,53 @@ except ImportError:
 except Exception as e:
     logger.warning(f"⚠️ 환경변수 로드 오류: {e}")
 
+# ===== 무거운 모듈 지연 로드 =====
+# 첫 속성 접근 시 import - /health가 OpenCV/NumPy 등의 로드를 기다리지 않도록 함
+class _LazyModule:
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+    
+    def _load(self):
+        if self._module is None:
+            started = time.perf_counter()
+            self._module = importlib.import_module(self._name)
+            logger.debug(f"📦 {self._name} 로드 ({(time.perf_counter() - started) * 1000:.0f}ms)")
+        return self._module
+    
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+    
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module '{self._name}' ({state})>"
+
+def _module_available(name: str) -> bool:
+    """import 없이 설치 여부만 확인"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+aiohttp = _LazyModule("aiohttp")
+feedparser = _LazyModule("feedparser")
+cv2 = _LazyModule("cv2")
+np = _LazyModule("numpy")
+gtts = _LazyModule("gtts")
+openai = _LazyModule("openai")
+
+# TTS 처리 (안전하게) - TTS_ENGINE=stub이면 오프라인 스텁 엔진 사용
+TTS_ENGINE = os.getenv('TTS_ENGINE', 'gtts')
+GTTS_AVAILABLE = _module_available("gtts")
+if GTTS_AVAILABLE:
+    logger.info("✅ gTTS 사용 가능")
+else:
+    logger.warning("⚠️ gTTS 없음 - TTS 기능 비활성화")
+TTS_AVAILABLE = GTTS_AVAILABLE or TTS_ENGINE == 'stub'
+TTS_MAX_CONCURRENCY = int(os.getenv('TTS_MAX_CONCURRENCY', '2'))
+TTS_CACHE_MAX_FILES = int(os.getenv('TTS_CACHE_MAX_FILES', '500'))
+TTS_CACHE_MAX_MB = float(os.getenv('TTS_CACHE_MAX_MB', '200'))
+
 # ===== 환경 감지 및 포트 설정 =====
 def get_safe_port():
     """안전한 포트 가져오기"""
@@ -98,18 +135,27 @@ PORT = get_safe_port()
 logger.info(f"🌐 호스트: {HOST}, 포트: {PORT}")
 
 # 파일 경로 설정
+DB_PATH = os.getenv('DATABASE_PATH', 'news_automation.db')
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '4'))
 UPLOAD_DIR = "uploads"
 VIDEO_OUTPUT_DIR = "generated_videos"
 AUDIO_OUTPUT_DIR = "generated_audio"
 TEMP_DIR = "temp"
 
-# 디렉토리 생성
-for directory in [UPLOAD_DIR, VIDEO_OUTPUT_DIR, AUDIO_OUTPUT_DIR, TEMP_DIR]:
-    try:
-        os.makedirs(directory, exist_ok=True)
-        logger.info(f"✅ 디렉토리 생성/확인: {directory}")
-    except Exception as e:
-        logger.warning(f"⚠️ 디렉토리 생성 실패: {directory} - {e}")
+# 디렉토리 생성 (import 시점이 아니라 앱 시작/서비스 생성 시 한 번)
+_directories_ready = False
+
+def ensure_directories():
+    global _directories_ready
+    if _directories_ready:
+        return
+    for directory in [UPLOAD_DIR, VIDEO_OUTPUT_DIR, AUDIO_OUTPUT_DIR, TEMP_DIR]:
+        try:
+            os.makedirs(directory, exist_ok=True)
+            logger.info(f"✅ 디렉토리 생성/확인: {directory}")
+        except Exception as e:
+            logger.warning(f"⚠️ 디렉토리 생성 실패: {directory} - {e}")
+    _directories_ready = True
 
 # JWT 설정
 JWT_SECRET = os.getenv('JWT_SECRET', 'your-secret-key-change-this-in-production')
@@ -119,25 +165,107 @@ JWT_EXPIRATION_HOURS = 24
 # 보안 설정
 security = HTTPBearer(auto_error=False)
 
-# OpenAI 가져오기
-try:
-    import openai
-    openai_version = openai.__version__
-    logger.info(f"📦 OpenAI 버전: {openai_version}")
-    
-    if openai_version.startswith('1.'):
-        OPENAI_V1 = True
-    else:
-        OPENAI_V1 = False
-        
-except ImportError:
+# OpenAI 가져오기 (클라이언트 생성 시 로드)
+OPENAI_AVAILABLE = _module_available("openai")
+if not OPENAI_AVAILABLE:
     logger.warning("❌ OpenAI 라이브러리가 설치되지 않았습니다.")
-    OPENAI_V1 = False
+
+# 캡션 생성 설정 (OPENAI_BASE_URL로 호환 서버나 로컬 목 서버 지정)
+OPENAI_BASE_URL = os.getenv('OPENAI_BASE_URL') or None
+CAPTION_MODEL = os.getenv('CAPTION_MODEL', 'gpt-3.5-turbo')
+CAPTION_BATCH_SIZE = int(os.getenv('CAPTION_BATCH_SIZE', '8'))
+# 단건 요청을 모아 한 번에 보내기 위해 기다리는 시간
+CAPTION_BATCH_WAIT_SECONDS = float(os.getenv('CAPTION_BATCH_WAIT_SECONDS', '0.05'))
+CAPTION_TIMEOUT_SECONDS = float(os.getenv('CAPTION_TIMEOUT_SECONDS', '20'))
+CAPTION_MAX_RETRIES = int(os.getenv('CAPTION_MAX_RETRIES', '3'))
+CAPTION_RETRY_BASE_SECONDS = float(os.getenv('CAPTION_RETRY_BASE_SECONDS', '0.5'))
+CAPTION_REQUESTS_PER_MINUTE = float(os.getenv('CAPTION_REQUESTS_PER_MINUTE', '60'))
+CAPTION_TOKENS_PER_MINUTE = float(os.getenv('CAPTION_TOKENS_PER_MINUTE', '40000'))
+CAPTION_MAX_TOKENS_PER_ITEM = 150
+CAPTION_STYLES = {
+    "viral": "짧고 강한 후킹 문장과 이모지로 호기심을 자극하고, 마지막에 댓글 참여를 유도하세요.",
+    "informative": "핵심 사실을 2~3문장으로 정확하게 요약하고, 과장 표현은 쓰지 마세요.",
+    "casual": "친구에게 말하듯 편안한 반말로 소식을 전하고, 이모지는 1~2개만 쓰세요."
+}
+
+# 크롤링 설정
+GOOGLE_NEWS_RSS_URL = os.getenv('GOOGLE_NEWS_RSS_URL', 'https://news.google.com/rss/search')
+FEED_READ_CHUNK_BYTES = int(os.getenv('FEED_READ_CHUNK_BYTES', '16384'))
+FEED_CACHE_TTL_SECONDS = int(os.getenv('FEED_CACHE_TTL_SECONDS', '300'))
+FEED_CACHE_MAX_ENTRIES = int(os.getenv('FEED_CACHE_MAX_ENTRIES', '256'))
+DEDUP_WINDOW_HOURS = float(os.getenv('DEDUP_WINDOW_HOURS', '6'))
+# 유사 제목 판정: 단어 안에서만 자른 3글자 shingle의 Jaccard 유사도 (짧은 단어는 통째로 하나의 shingle)
+# - 단어 경계를 넘는 shingle은 "전자급"처럼 한 단어만 바뀌어도 여럿이 함께 달라져, 삽입("삼성전자 주가 급등")보다
+#   치환("급등"→"급락")이 더 비슷하게 나오므로 사용하지 않음
+# - 0.7 기준: "삼성전자 급등…"/"삼성전자 주가 급등" 0.75는 중복, "삼성전자 급락…"/"삼성전자 급등…" 0.5와
+#   "서울 아파트값 상승세/하락세 지속" 0.67은 별개 기사로 유지. 낮추면 반대 의미의 짧은 제목이 묶이고,
+#   높이면 단어 한두 개가 추가된 재배포 기사를 놓침 (표현이 많이 다른 같은 기사는 어느 쪽이든 통과)
+NEAR_DUP_THRESHOLD = float(os.getenv('NEAR_DUP_THRESHOLD', '0.7'))
+NEAR_DUP_SHINGLE_SIZE = int(os.getenv('NEAR_DUP_SHINGLE_SIZE', '3'))
+NEAR_DUP_NUM_PERM = 96
+NEAR_DUP_BANDS = 32
+
+# 백그라운드 크롤링 스케줄러 (운영 환경에서만 기본 활성화)
+CRAWL_SCHEDULER_ENABLED = os.getenv('CRAWL_SCHEDULER_ENABLED', str(IS_PRODUCTION)).lower() == 'true'
+CRAWL_CONCURRENCY = int(os.getenv('CRAWL_CONCURRENCY', '2'))
+CRAWL_MAX_ARTICLES = int(os.getenv('CRAWL_MAX_ARTICLES', '10'))
+CRAWL_BASE_INTERVAL_SECONDS = float(os.getenv('CRAWL_BASE_INTERVAL_SECONDS', '900'))
+# 피드 캐시 TTL보다 짧으면 캐시된 응답만 다시 보게 되므로 최소 간격은 TTL 이상
+CRAWL_MIN_INTERVAL_SECONDS = max(float(os.getenv('CRAWL_MIN_INTERVAL_SECONDS', '300')), FEED_CACHE_TTL_SECONDS)
+CRAWL_MAX_INTERVAL_SECONDS = float(os.getenv('CRAWL_MAX_INTERVAL_SECONDS', '3600'))
+CRAWL_JITTER_RATIO = float(os.getenv('CRAWL_JITTER_RATIO', '0.1'))
 
 # MoviePy 완전 제거 - 사용하지 않음
 MOVIEPY_AVAILABLE = False
 logger.info("🎬 MoviePy 제거됨 - OpenCV로 비디오 처리")
 
+# 릴스 렌더링 설정 (9:16 비율, 720x1280으로 가벼움)
+REEL_WIDTH = 720
+REEL_HEIGHT = 1280
+REEL_FPS = 24
+RENDER_WORKERS = int(os.getenv('RENDER_WORKERS', str(os.cpu_count() or 1)))
+RENDER_START_METHOD = os.getenv('RENDER_START_METHOD', 'spawn')
+# 렌더링 결과에 영향을 주는 코드가 바뀌면 올려서 캐시 무효화
+RENDERER_VERSION = "opencv-2"
+
+# 릴스 스타일 (BGR 색상, 배경은 위→아래 세로 그라데이션)
+REEL_STYLES = {
+    "trending": {
+        "gradient_top": (50, 25, 150),
+        "gradient_bottom": (150, 75, 150),
+        "text_color": (255, 255, 255),
+        "shadow_color": (0, 0, 0)
+    },
+    "breaking": {
+        "gradient_top": (20, 20, 120),
+        "gradient_bottom": (40, 40, 220),
+        "text_color": (255, 255, 255),
+        "shadow_color": (0, 0, 0)
+    },
+    "minimal": {
+        "gradient_top": (40, 40, 40),
+        "gradient_bottom": (90, 90, 90),
+        "text_color": (240, 240, 240),
+        "shadow_color": (0, 0, 0)
+    }
+}
+
+# 멀티 워커 설정 - 백그라운드 작업(크롤링/렌더링)은 선출된 워커 하나만 실행
+LEADER_LEASE_SECONDS = float(os.getenv('LEADER_LEASE_SECONDS', '30'))
+DB_LOCK_RETRIES = int(os.getenv('DB_LOCK_RETRIES', '5'))
+
+# 조회 API 설정 (대시보드 폴링 응답은 메모리 캐시에서 처리)
+READ_API_DEFAULT_LIMIT = 20
+READ_API_MAX_LIMIT = 100
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', '512'))
+
+# 렌더링 작업 큐 설정
+RENDER_LEASE_SECONDS = int(os.getenv('RENDER_LEASE_SECONDS', '60'))
+RENDER_MAX_ATTEMPTS = int(os.getenv('RENDER_MAX_ATTEMPTS', '3'))
+RENDER_QUEUE_POLL_SECONDS = float(os.getenv('RENDER_QUEUE_POLL_SECONDS', '2'))
+# 최신성 가중치: 1시간 더 최신인 기사는 바이럴 점수 N점과 동일
+RENDER_FRESHNESS_WEIGHT = float(os.getenv('RENDER_FRESHNESS_WEIGHT', '0.5'))
+
 # 뉴스 카테고리 설정
 NEWS_CATEGORIES = {
     "stock": {
@@ -178,12 +306,30 @@ NEWS_CATEGORIES = {
     }
 }
 
+# 카테고리마다 요청하는 검색어 피드 수
+SEARCH_TERMS_PER_CATEGORY = int(os.getenv('SEARCH_TERMS_PER_CATEGORY', '2'))
+# 동시 피드 요청 수 - 기본값은 "all" 수집 한 번의 피드 수 (모든 피드를 한 라운드에 요청)
+FEED_FETCH_CONCURRENCY = int(os.getenv('FEED_FETCH_CONCURRENCY', str(sum(
+    min(len(info["search_terms"]), SEARCH_TERMS_PER_CATEGORY) for info in NEWS_CATEGORIES.values()
+))))
+
+# 바이럴 점수 설정
+VIRAL_KEYWORDS = [
+    "긴급", "속보", "충격", "논란", "폭등", "폭락", "급등", "급락", 
+    "사상최고", "사상최저", "역대최대", "파격", "깜짝", "반전",
+    "breaking", "urgent", "shock", "surge", "plunge", "exclusive"
+]
+VIRAL_KEYWORD_WEIGHT = 2.0
+# 카테고리별 trending_terms 가중치 (카테고리에 "trending_weight"가 있으면 우선)
+TRENDING_TERM_WEIGHT = float(os.getenv('TRENDING_TERM_WEIGHT', '1.5'))
+
 # 요청 모델들
 class NewsRequest(BaseModel):
     category: str
     max_articles: int = 5
     language: str = "ko"
     auto_post: bool = False
+    top_n: int = 5
 
 class ReelsRequest(BaseModel):
     news_id: int
@@ -193,6 +339,19 @@ class ReelsRequest(BaseModel):
     include_captions: bool = True
     background_music: bool = True
 
+class ReelsBatchRequest(BaseModel):
+    news_ids: Optional[List[int]] = None
+    category: Optional[str] = None
+    top_n: int = 10
+    video_style: str = "trending"
+    duration: int = 15
+
+class CaptionRequest(BaseModel):
+    news_ids: Optional[List[int]] = None
+    category: Optional[str] = None
+    top_n: int = 10
+    style: str = "viral"
+
 class NewsPostRequest(BaseModel):
     news_id: int
     caption_style: str = "viral"
@@ -204,10 +363,681 @@ class MultiImagePostRequest(BaseModel):
     selected_images: List[str]
     hashtags: List[str]
 
+class CrawlRequest(BaseModel):
+    categories: List[str] = ["all"]
+    max_articles: int = 5
+    queue_reels: bool = False
+    reel_style: str = "trending"
+    reel_duration: int = 15
+    generate_captions: bool = False
+    caption_style: str = "viral"
+
+# 메트릭 수집 (Prometheus 텍스트 형식, 외부 의존성 없음)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+FPS_BUCKETS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+def _format_labels(names: tuple, values: tuple) -> str:
+    pairs = []
+    for name, value in zip(names, values):
+        escaped = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        pairs.append(f'{name}="{escaped}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+class MetricCounter:
+    kind = "counter"
+    
+    def __init__(self, name: str, help_text: str, labels: tuple = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self._values: Dict[tuple, float] = {}
+        self._lock = threading.Lock()
+    
+    def inc(self, *label_values, amount: float = 1.0):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+    
+    def render(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{_format_labels(self.labels, key)} {value:g}" for key, value in sorted(items)]
+
+class MetricGauge:
+    kind = "gauge"
+    
+    def __init__(self, name: str, help_text: str, labels: tuple = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self._values: Dict[tuple, float] = {}
+        self._lock = threading.Lock()
+    
+    def set(self, *label_values, value: float):
+        with self._lock:
+            self._values[label_values] = value
+    
+    def replace(self, values: Dict[tuple, float]):
+        """전체 값 교체 (사라진 라벨 제거)"""
+        with self._lock:
+            self._values = dict(values)
+    
+    def render(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{_format_labels(self.labels, key)} {value:g}" for key, value in sorted(items)]
+
+class MetricHistogram:
+    kind = "histogram"
+    
+    def __init__(self, name: str, help_text: str, labels: tuple = (), buckets: tuple = LATENCY_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self.buckets = tuple(sorted(buckets))
+        # 라벨별 [버킷별 개수..., 합계, 총 개수] - 누적은 출력 시 계산
+        self._values: Dict[tuple, List[float]] = {}
+        self._lock = threading.Lock()
+    
+    def observe(self, *label_values, value: float):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(label_values)
+            if series is None:
+                series = [0] * (len(self.buckets) + 1) + [0.0, 0]
+                self._values[label_values] = series
+            series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+    
+    @contextmanager
+    def time(self, *label_values):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(*label_values, value=time.perf_counter() - started)
+    
+    def render(self) -> List[str]:
+        with self._lock:
+            items = [(key, list(series)) for key, series in self._values.items()]
+        lines = []
+        for key, series in sorted(items):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                bucket_labels = _format_labels(self.labels + ("le",), key + (le,))
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labels, key)} {series[-2]:g}")
+            lines.append(f"{self.name}_count{_format_labels(self.labels, key)} {series[-1]}")
+        return lines
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: List = []
+    
+    def counter(self, name: str, help_text: str, labels: tuple = ()) -> MetricCounter:
+        return self._register(MetricCounter(name, help_text, labels))
+    
+    def gauge(self, name: str, help_text: str, labels: tuple = ()) -> MetricGauge:
+        return self._register(MetricGauge(name, help_text, labels))
+    
+    def histogram(self, name: str, help_text: str, labels: tuple = (),
+                  buckets: tuple = LATENCY_BUCKETS) -> MetricHistogram:
+        return self._register(MetricHistogram(name, help_text, labels, buckets))
+    
+    def _register(self, metric):
+        self._metrics.append(metric)
+        return metric
+    
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.help_text}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+METRICS = MetricsRegistry()
+FEED_FETCH_SECONDS = METRICS.histogram(
+    "news_feed_fetch_seconds", "RSS feed fetch latency per search term", ("search_term", "result"))
+FEED_PARSE_SECONDS = METRICS.histogram("news_feed_parse_seconds", "Feed parse time (streaming or feedparser)")
+FEED_PARSES = METRICS.counter(
+    "news_feed_parses_total", "Feed parses by mode (stream, stream_truncated, feedparser)", ("mode",))
+DEDUP_SECONDS = METRICS.histogram("news_dedup_seconds", "Duplicate filtering time per batch")
+SCORE_SECONDS = METRICS.histogram("news_score_seconds", "Viral scoring time per feed")
+DB_INSERT_SECONDS = METRICS.histogram("news_db_insert_seconds", "Bulk article insert time")
+DB_INSERTED_ROWS = METRICS.counter("news_db_inserted_rows_total", "Articles inserted")
+REEL_ENCODE_SECONDS = METRICS.histogram(
+    "reel_encode_seconds", "Frame render and encode time per reel", ("style",))
+REEL_RENDER_FPS = METRICS.histogram(
+    "reel_render_fps", "Frames encoded per second per reel", ("style",), buckets=FPS_BUCKETS)
+REEL_FRAMES = METRICS.counter("reel_frames_total", "Frames encoded", ("style",))
+TTS_SECONDS = METRICS.histogram("tts_synthesis_seconds", "TTS engine latency (cache misses)", ("engine",))
+TTS_REQUESTS = METRICS.counter("tts_requests_total", "TTS requests by outcome", ("result",))
+CAPTION_REQUEST_SECONDS = METRICS.histogram(
+    "caption_request_seconds", "Caption completion request latency", ("result",))
+CAPTION_RESULTS = METRICS.counter("captions_total", "Captions by source (openai, cache, fallback)", ("source",))
+RENDER_QUEUE_DEPTH = METRICS.gauge("render_queue_jobs", "Render jobs by status", ("status",))
+HTTP_REQUEST_SECONDS = METRICS.histogram(
+    "http_request_seconds", "HTTP request latency per route", ("method", "route", "status"))
+
+# 증분 RSS/Atom 파서 (응답 바이트를 받는 대로 파싱, 필요한 개수가 차면 중단)
+class StreamingFeedParser:
+    _ENTRY_TAGS = ("item", "entry")
+    _FIELD_TAGS = {
+        "title": "title",
+        "link": "link",
+        "pubDate": "published",
+        "published": "published",
+        "updated": "published",
+        "description": "summary",
+        "summary": "summary",
+        "content": "summary"
+    }
+    
+    def __init__(self, limit: Optional[int] = None):
+        self.limit = limit
+        self.entries: List[Dict] = []
+        self.bytes_read = 0
+        self.finished = False
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._current: Optional[Dict] = None
+        self._entry_depth = 0
+    
+    @property
+    def done(self) -> bool:
+        return self.finished or (self.limit is not None and len(self.entries) >= self.limit)
+    
+    @staticmethod
+    def _local_name(tag: str) -> str:
+        return tag.rsplit("}", 1)[-1]
+    
+    def feed(self, data: bytes):
+        """바이트 조각 입력 - 형식 오류는 ET.ParseError로 전달"""
+        self.bytes_read += len(data)
+        self._parser.feed(data)
+        self._read_events()
+    
+    def close(self):
+        """스트림 끝 - 문서가 완결되지 않았으면 ET.ParseError"""
+        self._parser.close()
+        self._read_events()
+        self.finished = True
+    
+    def _read_events(self):
+        for event, element in self._parser.read_events():
+            if self.done:
+                return
+            tag = self._local_name(element.tag)
+            
+            if event == "start":
+                if tag in self._ENTRY_TAGS:
+                    self._current = {}
+                    self._entry_depth = 0
+                elif self._current is not None:
+                    self._entry_depth += 1
+                continue
+            
+            if self._current is None:
+                continue
+            
+            if tag in self._ENTRY_TAGS:
+                entry = self._current
+                self._current = None
+                # 처리한 엔트리 요소는 비워 문서 전체가 메모리에 쌓이지 않게 함
+                element.clear()
+                if entry.get("title") and entry.get("link"):
+                    self.entries.append({
+                        "title": entry["title"],
+                        "link": entry["link"],
+                        "published": entry.get("published", ""),
+                        "summary": entry.get("summary", "")
+                    })
+                continue
+            
+            self._entry_depth -= 1
+            field = self._FIELD_TAGS.get(tag)
+            # 엔트리 바로 아래 필드만 사용 (<source> 등 하위 요소의 제목은 무시)
+            if field is None or self._entry_depth != 0 or field in self._current:
+                continue
+            if tag == "link" and element.get("href"):
+                value = element.get("href")
+            else:
+                value = (element.text or "").strip()
+            if value:
+                self._current[field] = value
+
+def _parse_feed_with_feedparser(content) -> List[Dict]:
+    """feedparser 파싱 (형식이 깨진 피드용)"""
+    feed = feedparser.parse(content)
+    entries = []
+    for entry in feed.entries:
+        if not entry.get('title') or not entry.get('link'):
+            continue
+        entries.append({
+            "title": entry.title,
+            "link": entry.link,
+            "published": entry.get('published', ''),
+            "summary": entry.get('summary', '')
+        })
+    return entries
+
+# RSS 피드 캐시 (ETag/Last-Modified 조건부 요청)
+class FeedCache:
+    def __init__(self, ttl_seconds: int = FEED_CACHE_TTL_SECONDS, max_entries: int = FEED_CACHE_MAX_ENTRIES):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self.stats = {"hits": 0, "revalidated": 0, "misses": 0, "evictions": 0}
+    
+    def get(self, url: str) -> Optional[Dict]:
+        """캐시 항목 조회 (LRU 갱신)"""
+        cached = self._entries.get(url)
+        if cached is not None:
+            self._entries.move_to_end(url)
+        return cached
+    
+    def is_fresh(self, cached: Optional[Dict]) -> bool:
+        """TTL 이내인지 확인"""
+        if cached is None:
+            return False
+        return time.monotonic() - cached["fetched_at"] < self.ttl_seconds
+    
+    def conditional_headers(self, cached: Optional[Dict]) -> Dict[str, str]:
+        """조건부 GET 헤더 생성"""
+        headers = {}
+        if cached is None:
+            return headers
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+        return headers
+    
+    def is_sufficient(self, cached: Optional[Dict], limit: Optional[int]) -> bool:
+        """요청한 개수를 채울 수 있는지 (중간에 읽기를 멈춘 항목은 저장된 개수까지만 유효)"""
+        if cached is None:
+            return False
+        if cached["complete"]:
+            return True
+        return limit is not None and len(cached["entries"]) >= limit
+    
+    def store(self, url: str, entries: List[Dict], etag: Optional[str] = None,
+              last_modified: Optional[str] = None, complete: bool = True):
+        """파싱된 엔트리 저장 (complete=False면 문서 끝까지 읽지 않은 일부)"""
+        self._entries[url] = {
+            "entries": entries,
+            "etag": etag,
+            "last_modified": last_modified,
+            "complete": complete,
+            "fetched_at": time.monotonic()
+        }
+        self._entries.move_to_end(url)
+        
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+    
+    def touch(self, url: str):
+        """304 응답 후 TTL 갱신"""
+        cached = self._entries.get(url)
+        if cached is not None:
+            cached["fetched_at"] = time.monotonic()
+
+# 유사 제목 검출 (문자 shingle MinHash + LSH 밴드 인덱스)
+class NearDuplicateIndex:
+    _PRIME = (1 << 31) - 1
+    
+    def __init__(self, threshold: float = NEAR_DUP_THRESHOLD, shingle_size: int = NEAR_DUP_SHINGLE_SIZE,
+                 num_perm: int = NEAR_DUP_NUM_PERM, bands: int = NEAR_DUP_BANDS):
+        if num_perm % bands != 0:
+            raise ValueError("num_perm은 bands의 배수여야 합니다")
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.bands = bands
+        self.rows = num_perm // bands
+        
+        # 고정 시드 - 프로세스 간 동일한 서명 보장
+        rng = np.random.default_rng(20240801)
+        self._perm_a = rng.integers(1, self._PRIME, size=num_perm, dtype=np.uint64)
+        self._perm_b = rng.integers(0, self._PRIME, size=num_perm, dtype=np.uint64)
+        
+        self._items: Dict[int, Dict] = {}
+        self._buckets: Dict[tuple, set] = {}
+        # (epoch, id) 힙 - 다른 워커 기사가 늦게 들어와도 오래된 것부터 만료
+        self._order: List[tuple] = []
+        self._next_id = 0
+    
+    def _shingles(self, title: str) -> frozenset:
+        """제목 단어별 문자 shingle 집합 (shingle_size 이하 단어는 단어 그대로)"""
+        size = self.shingle_size
+        shingles = set()
+        for word in re.findall(r'\w+', title.lower()):
+            if len(word) <= size:
+                shingles.add(word)
+            else:
+                shingles.update(word[i:i + size] for i in range(len(word) - size + 1))
+        return frozenset(shingles)
+    
+    def _signature(self, shingles: frozenset) -> "np.ndarray":
+        """MinHash 서명 계산"""
+        hashes = np.fromiter(
+            (zlib.crc32(shingle.encode('utf-8')) for shingle in shingles),
+            dtype=np.uint64, count=len(shingles)
+        ) % self._PRIME
+        permuted = (self._perm_a[:, None] * hashes[None, :] + self._perm_b[:, None]) % self._PRIME
+        return permuted.min(axis=1)
+    
+    def _band_keys(self, category: str, signature: "np.ndarray") -> List[tuple]:
+        rows = self.rows
+        return [
+            (category, band, signature[band * rows:(band + 1) * rows].tobytes())
+            for band in range(self.bands)
+        ]
+    
+    def query(self, category: str, title: str) -> Optional[Dict]:
+        """임계값 이상 유사한 기존 제목 조회"""
+        shingles = self._shingles(title)
+        if not shingles:
+            return None
+        
+        candidates = set()
+        for key in self._band_keys(category, self._signature(shingles)):
+            bucket = self._buckets.get(key)
+            if bucket:
+                candidates.update(bucket)
+        
+        best = None
+        for item_id in candidates:
+            item = self._items[item_id]
+            # LSH 후보는 실제 Jaccard 유사도로 확인
+            similarity = len(shingles & item["shingles"]) / len(shingles | item["shingles"])
+            if similarity >= self.threshold and (best is None or similarity > best["similarity"]):
+                best = {"title": item["title"], "similarity": round(similarity, 3)}
+        
+        return best
+    
+    def add(self, category: str, title: str, epoch: Optional[float] = None):
+        """제목 추가"""
+        shingles = self._shingles(title)
+        if not shingles:
+            return
+        if epoch is None:
+            epoch = time.time()
+        
+        item_id = self._next_id
+        self._next_id += 1
+        
+        band_keys = self._band_keys(category, self._signature(shingles))
+        self._items[item_id] = {"title": title, "shingles": shingles, "band_keys": band_keys}
+        for key in band_keys:
+            self._buckets.setdefault(key, set()).add(item_id)
+        heapq.heappush(self._order, (epoch, item_id))
+    
+    def expire(self, cutoff: float):
+        """cutoff 이전에 추가된 제목 제거"""
+        while self._order and self._order[0][0] < cutoff:
+            _, item_id = heapq.heappop(self._order)
+            item = self._items.pop(item_id, None)
+            if item is None:
+                continue
+            for key in item["band_keys"]:
+                bucket = self._buckets.get(key)
+                if bucket is not None:
+                    bucket.discard(item_id)
+                    if not bucket:
+                        del self._buckets[key]
+    
+    def __len__(self) -> int:
+        return len(self._items)
+
+# 중복 검사용 인메모리 인덱스 (최근 N시간 title_hash + 유사 제목)
+class DedupIndex:
+    def __init__(self, window_hours: float = DEDUP_WINDOW_HOURS):
+        self.window_seconds = window_hours * 3600
+        self._hashes: Dict[str, Dict[str, float]] = {}
+        # (epoch, 순번, category, title_hash) 힙 - 저장 순서와 무관하게 오래된 것부터 만료
+        self._order: List[tuple] = []
+        self._sequence = 0
+        self.near_index = NearDuplicateIndex()
+        self.warmed = False
+        # 다른 워커가 저장한 기사를 따라잡기 위한 위치
+        self._last_id = 0
+        self._data_version: Optional[int] = None
+    
+    # ----- DB 조회 (읽기 스레드에서 실행 가능, 인덱스는 건드리지 않음) -----
+    def load_window(self) -> Dict:
+        """윈도우 내 기사 일괄 조회 (쿼리 1회)"""
+        database = get_database()
+        # 조회 전에 버전을 기록해 조회 중 커밋된 행은 다음 갱신에서 반영
+        version = database.data_version()
+        rows = database.fetchall_sync("""
+            SELECT id, category, title_hash, title, scraped_epoch FROM news_articles
+            WHERE scraped_epoch >= ? AND title_hash IS NOT NULL
+            ORDER BY scraped_epoch
+        """, (time.time() - self.window_seconds,))
+        if rows:
+            last_id = max(row["id"] for row in rows)
+        else:
+            last_id = database.fetchone_sync("SELECT COALESCE(MAX(id), 0) FROM news_articles")[0]
+        return {"version": version, "rows": rows, "last_id": last_id}
+    
+    def load_changes(self) -> Optional[Dict]:
+        """다른 워커가 저장한 기사 조회 (data_version이 바뀐 경우에만, 없으면 None)"""
+        database = get_database()
+        version = database.data_version()
+        if version == self._data_version:
+            return None
+        rows = database.fetchall_sync("""
+            SELECT id, category, title_hash, title, scraped_epoch FROM news_articles
+            WHERE id > ? AND scraped_epoch >= ? AND title_hash IS NOT NULL
+            ORDER BY id
+        """, (self._last_id, time.time() - self.window_seconds))
+        return {"version": version, "rows": rows, "last_id": rows[-1]["id"] if rows else self._last_id}
+    
+    # ----- 인덱스 반영 (이벤트 루프에서만 - 인덱스는 스레드 안전하지 않음) -----
+    def apply(self, loaded: Optional[Dict]) -> int:
+        """조회 결과 반영 - 이 워커가 저장하면서 이미 추가한 기사는 건너뜀"""
+        if loaded is None:
+            return 0
+        added = 0
+        for news_id, category, title_hash, title, scraped_epoch in loaded["rows"]:
+            if self._hashes.get(category, {}).get(title_hash) != scraped_epoch:
+                self.add(category, title_hash, scraped_epoch, title=title)
+                added += 1
+        self._last_id = max(self._last_id, loaded["last_id"])
+        self._data_version = loaded["version"]
+        return added
+    
+    def warm(self):
+        """DB에서 윈도우 내 해시 일괄 로드 (동기 - 첫 검사 시 워밍 전이면 사용)"""
+        try:
+            added = self.apply(self.load_window())
+            logger.info(f"✅ 중복 인덱스 로드 완료: {added}개 해시")
+        except Exception as e:
+            logger.error(f"중복 인덱스 로드 오류: {e}")
+        finally:
+            self.warmed = True
+    
+    async def refresh(self) -> int:
+        """워밍 또는 다른 워커 기사 반영 - 조회는 읽기 스레드, 반영은 이벤트 루프에서"""
+        database = get_database()
+        if self.warmed:
+            return self.apply(await database.run_read(self.load_changes))
+        try:
+            added = self.apply(await database.run_read(self.load_window))
+            logger.info(f"✅ 중복 인덱스 로드 완료: {added}개 해시")
+            return added
+        except Exception as e:
+            logger.error(f"중복 인덱스 로드 오류: {e}")
+            return 0
+        finally:
+            self.warmed = True
+    
+    def add(self, category: str, title_hash: str, epoch: Optional[float] = None, title: Optional[str] = None):
+        """해시 추가 (제목이 있으면 유사 제목 인덱스에도 추가)"""
+        if epoch is None:
+            epoch = time.time()
+        self._hashes.setdefault(category, {})[title_hash] = epoch
+        self._sequence += 1
+        heapq.heappush(self._order, (epoch, self._sequence, category, title_hash))
+        if title:
+            self.near_index.add(category, title, epoch)
+    
+    def contains(self, category: str, title_hash: str) -> bool:
+        """윈도우 내 중복 여부"""
+        self._expire()
+        return title_hash in self._hashes.get(category, {})
+    
+    def find_near_duplicate(self, category: str, title: str) -> Optional[Dict]:
+        """윈도우 내 유사 제목 조회"""
+        self._expire()
+        return self.near_index.query(category, title)
+    
+    def _expire(self):
+        """윈도우를 벗어난 해시 제거"""
+        cutoff = time.time() - self.window_seconds
+        self.near_index.expire(cutoff)
+        while self._order and self._order[0][0] < cutoff:
+            epoch, _, category, title_hash = heapq.heappop(self._order)
+            category_hashes = self._hashes.get(category)
+            # 이후 다시 추가된 해시는 유지
+            if category_hashes and category_hashes.get(title_hash) == epoch:
+                del category_hashes[title_hash]
+    
+    def __len__(self) -> int:
+        self._expire()
+        return sum(len(hashes) for hashes in self._hashes.values())
+
+# 바이럴 점수 엔진 (키워드 전체를 하나의 정규식으로 컴파일, 피드 단위 일괄 스캔)
+class ViralScoringEngine:
+    _NUMBER_PATTERN = re.compile(r'\d+[%억만$배]')
+    _PUNCT_PATTERN = re.compile(r'[?!]')
+    
+    def __init__(self, keyword_weights: Optional[Dict[str, float]] = None,
+                 trending_weight: float = TRENDING_TERM_WEIGHT):
+        if keyword_weights is None:
+            keyword_weights = {keyword: VIRAL_KEYWORD_WEIGHT for keyword in VIRAL_KEYWORDS}
+        self.keyword_weights = {keyword.lower(): weight for keyword, weight in keyword_weights.items()}
+        self.trending_weight = trending_weight
+        self._matchers: Dict[Optional[str], tuple] = {}
+    
+    def _category_weights(self, category: Optional[str]) -> Dict[str, float]:
+        """기본 키워드 + 카테고리 trending_terms 가중치"""
+        weights = dict(self.keyword_weights)
+        category_info = NEWS_CATEGORIES.get(category) if category else None
+        if category_info:
+            trending_weight = category_info.get("trending_weight", self.trending_weight)
+            for term in category_info.get("trending_terms", []):
+                term = term.lower()
+                weights[term] = weights.get(term, 0.0) + trending_weight
+        return weights
+    
+    def _matcher(self, category: Optional[str]) -> tuple:
+        """카테고리별 컴파일된 매처 (지연 생성 후 캐시)"""
+        matcher = self._matchers.get(category)
+        if matcher is not None:
+            return matcher
+        
+        weights = self._category_weights(category)
+        terms = sorted(weights, key=len, reverse=True)
+        
+        # 위치마다 가장 긴 키워드만 보고되므로 그 안에 포함된 짧은 키워드도 함께 인정
+        implied = {
+            term: frozenset(other for other in terms if other in term)
+            for term in terms
+        }
+        
+        # 전방탐색으로 감싸 위치마다 매칭 - 겹치는 키워드("insurgent"의 "surge"와 "urgent")도 모두 보고
+        pattern = re.compile("(?=(" + self._trie_pattern(terms) + "))")
+        matcher = (pattern, weights, implied)
+        self._matchers[category] = matcher
+        return matcher
+    
+    @staticmethod
+    def _trie_pattern(terms: List[str]) -> str:
+        """공통 접두사를 묶은 정규식 (위치마다 첫 글자에서 바로 실패하도록)"""
+        trie: Dict[str, Dict] = {}
+        for term in terms:
+            node = trie
+            for char in term:
+                node = node.setdefault(char, {})
+            node[""] = {}
+        
+        def build(node: Dict) -> str:
+            branches = []
+            optional = "" in node
+            for char in sorted(key for key in node if key):
+                branches.append(re.escape(char) + build(node[char]))
+            if not branches:
+                return ""
+            body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+            # 더 긴 키워드를 먼저 시도 (greedy ?)
+            if optional:
+                body = ("(?:" + body + ")" if len(branches) == 1 and len(body) > 1 else body) + "?"
+            return body
+        
+        return build(trie)
+    
+    def score(self, title: str, category: Optional[str] = None) -> float:
+        """제목 하나의 바이럴 점수"""
+        return self.score_batch([title], category)[0]
+    
+    def score_batch(self, titles: List[str], category: Optional[str] = None) -> List[float]:
+        """피드 전체를 한 번에 스캔하여 점수 계산"""
+        if not titles:
+            return []
+        
+        pattern, weights, implied = self._matcher(category)
+        
+        # 제목을 줄바꿈으로 이어 붙여 정규식 1회 스캔
+        # lower()는 길이를 바꿀 수 있으므로('İ' → 2글자) 소문자로 바꾼 제목 기준으로 위치 계산
+        lowered = [title.replace("\n", " ").lower() for title in titles]
+        offsets = []
+        position = 0
+        for title in lowered:
+            offsets.append(position)
+            position += len(title) + 1
+        text = "\n".join(lowered)
+        
+        matched_terms: Dict[int, set] = {}
+        number_hits = set()
+        punct_hits = set()
+        
+        for match in pattern.finditer(text):
+            index = bisect.bisect_right(offsets, match.start()) - 1
+            matched_terms.setdefault(index, set()).update(implied[match.group(1)])
+        
+        for match in self._NUMBER_PATTERN.finditer(text):
+            number_hits.add(bisect.bisect_right(offsets, match.start()) - 1)
+        
+        for match in self._PUNCT_PATTERN.finditer(text):
+            punct_hits.add(bisect.bisect_right(offsets, match.start()) - 1)
+        
+        scores = []
+        for index, title in enumerate(titles):
+            score = 1.0
+            terms = matched_terms.get(index)
+            if terms:
+                score += sum(weights[term] for term in terms)
+            if index in number_hits:
+                score += 1.5
+            if index in punct_hits:
+                score += 1.0
+            if 15 <= len(title) <= 60:
+                score += 1.0
+            scores.append(round(score, 2))
+        
+        return scores
+
 # 뉴스 수집 시스템
 class AdvancedNewsScrapingSystem:
     def __init__(self):
         self.session = None
+        self._fetch_semaphore = None
+        self.feed_cache = FeedCache()
+        self.viral_scorer = ViralScoringEngine()
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
@@ -223,6 +1053,8 @@ class AdvancedNewsScrapingSystem:
                     timeout=timeout,
                     headers=self.headers
                 )
+                # 세션과 같은 이벤트 루프에 묶이도록 함께 생성
+                self._fetch_semaphore = asyncio.Semaphore(FEED_FETCH_CONCURRENCY)
         except Exception as e:
             logger.error(f"❌ aiohttp 세션 생성 오류: {e}")
             self.session = None
@@ -238,24 +1070,17 @@ class AdvancedNewsScrapingSystem:
             logger.error(f"해시 생성 오류: {e}")
             return hashlib.md5(title.encode('utf-8', errors='ignore')).hexdigest()
     
-    def _is_duplicate_news(self, title: str, category: str) -> bool:
-        """중복 뉴스 검사"""
+    def _is_duplicate_news(self, title: str, category: str, title_hash: Optional[str] = None) -> bool:
+        """중복 뉴스 검사 (인메모리 인덱스)"""
         try:
-            title_hash = self._generate_title_hash(title)
-            
-            conn = sqlite3.connect("news_automation.db")
-            cursor = conn.cursor()
+            if title_hash is None:
+                title_hash = self._generate_title_hash(title)
             
-            cursor.execute("""
-                SELECT COUNT(*) FROM news_articles 
-                WHERE title_hash = ? AND category = ? 
-                AND datetime(scraped_at) > datetime('now', '-6 hours')
-            """, (title_hash, category))
+            dedup_index = get_dedup_index()
+            if not dedup_index.warmed:
+                dedup_index.warm()
             
-            count = cursor.fetchone()[0]
-            conn.close()
-            
-            return count > 0
+            return dedup_index.contains(category, title_hash)
             
         except Exception as e:
             logger.error(f"중복 검사 오류: {e}")
@@ -264,28 +1089,9 @@ class AdvancedNewsScrapingSystem:
     async def scrape_latest_news(self, category: str, max_articles: int = 10) -> List[Dict]:
         """최신 뉴스 크롤링"""
         try:
-            logger.info(f"🔍 {category} 카테고리 뉴스 수집 시작")
-            all_news = []
-            
-            # Google News 크롤링
-            google_news = await self._scrape_google_news(category, max_articles)
-            logger.info(f"📰 Google News에서 {len(google_news)}개 뉴스 수집")
-            all_news.extend(google_news)
-            
-            if not all_news:
-                logger.warning(f"❌ {category}: 원본 뉴스 수집 실패")
-                return self._create_dummy_news(category, max_articles)
-            
-            # 중복 제거
-            unique_news = self._filter_duplicate_news(all_news, relaxed=True)
-            logger.info(f"🔄 중복 제거 후: {len(unique_news)}개")
-            
-            if not unique_news:
-                logger.warning(f"⚠️ {category}: 중복 제거 후 뉴스 없음")
-                if all_news:
-                    return all_news[:max_articles]
-                else:
-                    return self._create_dummy_news(category, max_articles)
+            unique_news = []
+            async for news_batch in self.stream_latest_news(category, max_articles):
+                unique_news.extend(news_batch)
             
             # 바이럴 점수 기반 정렬
             sorted_news = sorted(unique_news, key=lambda x: x['viral_score'], reverse=True)
@@ -298,6 +1104,32 @@ class AdvancedNewsScrapingSystem:
             logger.error(f"❌ 뉴스 크롤링 오류: {e}")
             return self._create_dummy_news(category, max_articles)
     
+    async def stream_latest_news(self, category: str, max_articles: int = 10):
+        """최신 뉴스 스트리밍 크롤링 (피드가 도착할 때마다 중복 제거 후 묶음 전달)"""
+        logger.info(f"🔍 {category} 카테고리 뉴스 수집 시작")
+        # 다른 워커가 저장한 기사까지 유사 제목 검사에 반영
+        await get_dedup_index().refresh()
+        is_new = self._make_duplicate_filter(relaxed=True)
+        emitted = 0
+        
+        try:
+            async for term_news in self._iter_google_news(category, max_articles):
+                with DEDUP_SECONDS.time():
+                    unique_news = [news for news in term_news if is_new(news)][:max_articles - emitted]
+                if unique_news:
+                    emitted += len(unique_news)
+                    yield unique_news
+                if emitted >= max_articles:
+                    break
+        except Exception as e:
+            logger.error(f"❌ 뉴스 크롤링 오류: {e}")
+        
+        if emitted == 0:
+            logger.warning(f"❌ {category}: 원본 뉴스 수집 실패")
+            yield self._create_dummy_news(category, max_articles)
+        else:
+            logger.info(f"🔄 중복 제거 후: {emitted}개")
+    
     def _create_dummy_news(self, category: str, max_articles: int) -> List[Dict]:
         """테스트용 더미 뉴스 생성"""
         logger.info(f"🤖 {category} 카테고리 더미 뉴스 생성")
@@ -344,140 +1176,437 @@ class AdvancedNewsScrapingSystem:
         logger.info(f"✅ {len(dummy_news)}개 더미 뉴스 생성 완료")
         return dummy_news
     
+    async def scrape_categories(self, categories, max_articles: int = 10) -> Dict:
+        """여러 카테고리 동시 크롤링 (fan-out)"""
+        if categories == "all" or "all" in categories:
+            categories = list(NEWS_CATEGORIES.keys())
+        
+        valid_categories = []
+        for category in categories:
+            if category in NEWS_CATEGORIES and category not in valid_categories:
+                valid_categories.append(category)
+            elif category not in NEWS_CATEGORIES:
+                logger.warning(f"⚠️ 알 수 없는 카테고리 무시: {category}")
+        
+        logger.info(f"🌐 {len(valid_categories)}개 카테고리 동시 크롤링 시작")
+        
+        # 피드 요청 수는 세션 단위 세마포어로 제한됨
+        results = await asyncio.gather(
+            *(self.scrape_latest_news(category, max_articles) for category in valid_categories),
+            return_exceptions=True
+        )
+        
+        per_category = {}
+        merged_news = []
+        seen_hashes = set()
+        
+        for category, news_list in zip(valid_categories, results):
+            if isinstance(news_list, Exception):
+                logger.error(f"❌ {category} 크롤링 실패: {news_list}")
+                per_category[category] = 0
+                continue
+            
+            per_category[category] = len(news_list)
+            for news in news_list:
+                title_hash = news.get('title_hash') or self._generate_title_hash(news['title'])
+                if title_hash in seen_hashes:
+                    continue
+                seen_hashes.add(title_hash)
+                news['title_hash'] = title_hash
+                merged_news.append(news)
+        
+        merged_news.sort(key=lambda x: x['viral_score'], reverse=True)
+        logger.info(f"✅ 동시 크롤링 완료: 총 {len(merged_news)}개 (중복 제거 후)")
+        
+        return {
+            "categories": per_category,
+            "news": merged_news
+        }
+    
     async def _scrape_google_news(self, category: str, max_articles: int) -> List[Dict]:
         """Google News RSS 크롤링"""
         try:
-            category_info = NEWS_CATEGORIES.get(category, NEWS_CATEGORIES["domestic"])
             news_list = []
+            async for term_news in self._iter_google_news(category, max_articles):
+                news_list.extend(term_news)
+            
+            logger.info(f"📊 총 수집된 뉴스: {len(news_list)}개")
+            return news_list
+            
+        except Exception as e:
+            logger.error(f"❌ Google News 크롤링 오류: {e}")
+            return []
+    
+    async def _iter_google_news(self, category: str, max_articles: int):
+        """Google News RSS 크롤링 (검색어별 피드가 도착하는 순서대로 전달)"""
+        category_info = NEWS_CATEGORIES.get(category, NEWS_CATEGORIES["domestic"])
+        
+        session = await self._get_session()
+        if session is None:
+            logger.error("❌ HTTP 세션 생성 실패")
+            return
+        
+        search_terms = category_info["search_terms"][:SEARCH_TERMS_PER_CATEGORY]
+        
+        # 검색어별 피드를 동시에 요청
+        tasks = [
+            asyncio.ensure_future(
+                self._fetch_search_term(session, category, category_info, search_term, max_articles)
+            )
+            for search_term in search_terms
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                term_news = await next_done
+                if term_news:
+                    yield term_news
+        finally:
+            # 소비자가 중간에 멈추면 남은 요청 취소
+            for task in tasks:
+                task.cancel()
+    
+    async def _fetch_search_term(self, session, category: str, category_info: Dict,
+                                 search_term: str, max_articles: int) -> List[Dict]:
+        """검색어 하나의 RSS 피드 수집"""
+        news_list = []
+        try:
+            encoded_term = urllib.parse.quote(search_term)
+            rss_url = f"{GOOGLE_NEWS_RSS_URL}?q={encoded_term}&hl=ko&gl=KR&ceid=KR:ko"
             
-            session = await self._get_session()
-            if session is None:
-                logger.error("❌ HTTP 세션 생성 실패")
-                return []
+            entries = await self._fetch_feed_entries(session, rss_url, search_term, limit=max_articles//2)
             
-            search_terms = category_info["search_terms"][:2]
+            titles = []
+            for entry in entries[:max_articles//2]:
+                title = entry["title"]
+                if ' - ' in title:
+                    title = title.split(' - ')[0]
+                titles.append(title)
             
-            for search_term in search_terms:
+            with SCORE_SECONDS.time():
+                viral_scores = self.viral_scorer.score_batch(titles, category)
+            
+            for entry, title, viral_score in zip(entries, titles, viral_scores):
                 try:
-                    encoded_term = urllib.parse.quote(search_term)
-                    rss_url = f"https://news.google.com/rss/search?q={encoded_term}&hl=ko&gl=KR&ceid=KR:ko"
+                    news_item = {
+                        "title": title.strip(),
+                        "link": entry["link"],
+                        "published": entry["published"],
+                        "summary": entry["summary"] or title,
+                        "source": "Google News",
+                        "category": category,
+                        "keywords": category_info["keywords"],
+                        "viral_score": viral_score,
+                        "scraped_at": datetime.now().isoformat()
+                    }
+                    news_list.append(news_item)
                     
-                    async with session.get(rss_url) as response:
-                        if response.status == 200:
-                            content = await response.text()
-                            
-                            if len(content) < 100:
-                                continue
-                            
-                            feed = feedparser.parse(content)
-                            
-                            if not feed.entries:
-                                continue
-                            
-                            for entry in feed.entries[:max_articles//2]:
-                                try:
-                                    title = entry.title
-                                    if ' - ' in title:
-                                        title = title.split(' - ')[0]
-                                    
-                                    news_item = {
-                                        "title": title.strip(),
-                                        "link": entry.link,
-                                        "published": entry.get('published', ''),
-                                        "summary": entry.get('summary', title),
-                                        "source": "Google News",
-                                        "category": category,
-                                        "keywords": category_info["keywords"],
-                                        "viral_score": self._calculate_viral_score(title),
-                                        "scraped_at": datetime.now().isoformat()
-                                    }
-                                    news_list.append(news_item)
-                                    
-                                except Exception as entry_error:
-                                    logger.warning(f"⚠️ 엔트리 처리 오류: {entry_error}")
-                                    continue
-                                    
-                except Exception as term_error:
-                    logger.warning(f"⚠️ 검색어 '{search_term}' 오류: {term_error}")
+                except Exception as entry_error:
+                    logger.warning(f"⚠️ 엔트리 처리 오류: {entry_error}")
                     continue
+                    
+        except Exception as term_error:
+            logger.warning(f"⚠️ 검색어 '{search_term}' 오류: {term_error}")
+        
+        return news_list
+    
+    async def _fetch_feed_entries(self, session, rss_url: str, search_term: str = "",
+                                  limit: Optional[int] = None) -> List[Dict]:
+        """피드 엔트리 조회 (캐시 + 조건부 GET + 증분 파싱, limit개를 채우면 읽기 중단)"""
+        cached = self.feed_cache.get(rss_url)
+        sufficient = self.feed_cache.is_sufficient(cached, limit)
+        if sufficient and self.feed_cache.is_fresh(cached):
+            self.feed_cache.stats["hits"] += 1
+            return cached["entries"]
+        
+        # 캐시에 일부만 있고 더 많이 필요하면 304를 받아도 쓸 수 없으므로 전체 요청
+        request_headers = self.feed_cache.conditional_headers(cached) if sufficient else {}
+        
+        async with self._fetch_semaphore:
+            # 세마포어 대기 시간은 제외하고 요청 구간만 측정
+            started = time.perf_counter()
+            result = "error"
+            try:
+                async with session.get(rss_url, headers=request_headers) as response:
+                    if response.status == 304 and sufficient:
+                        result = "not_modified"
+                        self.feed_cache.touch(rss_url)
+                        self.feed_cache.stats["revalidated"] += 1
+                        return cached["entries"]
+                    
+                    if response.status != 200:
+                        return []
+                    
+                    etag = response.headers.get("ETag")
+                    last_modified = response.headers.get("Last-Modified")
+                    entries, complete = await self._parse_feed_stream(response, limit)
+                    result = "ok"
+            finally:
+                FEED_FETCH_SECONDS.observe(search_term, result, value=time.perf_counter() - started)
+        
+        self.feed_cache.stats["misses"] += 1
+        
+        if entries is None:
+            return []
+        
+        self.feed_cache.store(rss_url, entries, etag=etag, last_modified=last_modified, complete=complete)
+        return entries
+    
+    async def _parse_feed_stream(self, response, limit: Optional[int]) -> tuple:
+        """응답 본문을 조각 단위로 파싱 - (엔트리, 문서 끝까지 읽었는지), 본문이 너무 짧으면 (None, True)"""
+        parser = StreamingFeedParser(limit)
+        received = []
+        parse_seconds = 0.0
+        
+        try:
+            async for chunk in response.content.iter_chunked(FEED_READ_CHUNK_BYTES):
+                # 형식 오류 시 feedparser로 다시 파싱할 수 있도록 읽은 바이트 보관
+                received.append(chunk)
+                started = time.perf_counter()
+                parser.feed(chunk)
+                parse_seconds += time.perf_counter() - started
+                if parser.done:
+                    break
             
-            logger.info(f"📊 총 수집된 뉴스: {len(news_list)}개")
-            return news_list
+            if not parser.done:
+                if parser.bytes_read < 100:
+                    return None, True
+                started = time.perf_counter()
+                parser.close()
+                parse_seconds += time.perf_counter() - started
+        except ET.ParseError as e:
+            # 깨진 피드는 나머지 본문까지 읽어 feedparser로 처리
+            logger.debug(f"증분 파싱 실패, feedparser로 재시도: {e}")
+            received.append(await response.read())
+            content = b"".join(received)
+            if len(content) < 100:
+                return None, True
             
-        except Exception as e:
-            logger.error(f"❌ Google News 크롤링 오류: {e}")
-            return []
+            with FEED_PARSE_SECONDS.time():
+                entries = _parse_feed_with_feedparser(content)
+            FEED_PARSES.inc("feedparser")
+            return entries, True
+        
+        FEED_PARSE_SECONDS.observe(value=parse_seconds)
+        complete = parser.finished
+        FEED_PARSES.inc("stream" if complete else "stream_truncated")
+        return parser.entries, complete
     
     def _filter_duplicate_news(self, news_list: List[Dict], relaxed: bool = False) -> List[Dict]:
-        """중복 뉴스 필터링"""
-        unique_news = []
+        """중복 뉴스 필터링 (동일 해시 + 유사 제목)"""
+        with DEDUP_SECONDS.time():
+            is_new = self._make_duplicate_filter(relaxed)
+            return [news for news in news_list if is_new(news)]
+    
+    def _make_duplicate_filter(self, relaxed: bool = False):
+        """뉴스를 하나씩 받아 새 뉴스인지 판별하는 필터 (호출 간 상태 유지)
+        
+        relaxed면 이미 저장된 같은 제목은 통과시키고, 저장된 기사와 유사한 다른 제목만 제외
+        """
         seen_hashes = set()
+        batch_near_index = NearDuplicateIndex()
+        dedup_index = get_dedup_index()
         
-        for news in news_list:
+        # 다른 워커가 저장한 기사는 호출 측에서 미리 반영 (await DedupIndex.refresh())
+        if not dedup_index.warmed:
+            dedup_index.warm()
+        
+        def is_new(news: Dict) -> bool:
             title_hash = self._generate_title_hash(news['title'])
             
             if title_hash in seen_hashes:
-                continue
+                return False
             
-            if not relaxed and self._is_duplicate_news(news['title'], news['category']):
-                continue
+            if not relaxed and self._is_duplicate_news(news['title'], news['category'], title_hash):
+                return False
+            
+            near_duplicate = batch_near_index.query(news['category'], news['title'])
+            if near_duplicate is None:
+                near_duplicate = dedup_index.find_near_duplicate(news['category'], news['title'])
+                # relaxed에서 저장된 같은 제목은 정확 일치 검사처럼 통과
+                if (near_duplicate is not None and relaxed
+                        and self._generate_title_hash(near_duplicate['title']) == title_hash):
+                    near_duplicate = None
+            if near_duplicate is not None:
+                logger.info(f"🔁 유사 뉴스 제외 ({near_duplicate['similarity']}): {news['title'][:30]}")
+                return False
             
             seen_hashes.add(title_hash)
+            batch_near_index.add(news['category'], news['title'])
             news['title_hash'] = title_hash
-            unique_news.append(news)
+            return True
         
-        return unique_news
+        return is_new
     
-    def _calculate_viral_score(self, title: str) -> float:
+    def _calculate_viral_score(self, title: str, category: Optional[str] = None) -> float:
         """바이럴 점수 계산"""
-        score = 1.0
-        title_lower = title.lower()
-        
-        viral_keywords = [
-            "긴급", "속보", "충격", "논란", "폭등", "폭락", "급등", "급락", 
-            "사상최고", "사상최저", "역대최대", "파격", "깜짝", "반전",
-            "breaking", "urgent", "shock", "surge", "plunge", "exclusive"
-        ]
-        for keyword in viral_keywords:
-            if keyword in title_lower:
-                score += 2.0
-        
-        if re.search(r'\d+%|\d+억|\d+만|\d+\$|\d+배', title):
-            score += 1.5
-        
-        if '?' in title or '!' in title:
-            score += 1.0
-        
-        if 15 <= len(title) <= 60:
-            score += 1.0
-        
-        return round(score, 2)
+        return self.viral_scorer.score(title, category)
     
     async def close(self):
         """세션 종료"""
         if self.session and not self.session.closed:
             await self.session.close()
 
-# 릴스 제작 시스템 - OpenCV만 사용
-class ReelsProductionSystem:
-    def __init__(self):
-        self.temp_dir = TEMP_DIR
-        self.output_dir = VIDEO_OUTPUT_DIR
-        self.audio_dir = AUDIO_OUTPUT_DIR
+# TTS 엔진
+class GTTSEngine:
+    name = "gtts"
     
-    async def create_news_reel(self, news_data: Dict, style: str = "trending", duration: int = 15) -> Dict:
-        """뉴스 릴스 제작 - OpenCV 전용"""
-        try:
-            logger.info(f"📹 릴스 제작 시작: {news_data['title'][:50]}...")
-            
-            # TTS 음성 생성 (선택적)
-            if TTS_AVAILABLE:
+    def synthesize(self, text: str, lang: str, speed: float, output_path: str):
+        # gTTS는 보통/느림 두 단계만 지원
+        gtts.gTTS(text=text, lang=lang, slow=speed < 1.0).save(output_path)
+
+class StubTTSEngine:
+    """오프라인 테스트용 엔진 - 글자 수에 비례한 무음 MP3 프레임 기록"""
+    name = "stub"
+    # MPEG-1 Layer III, 128kbps, 44.1kHz 프레임 (약 26ms)
+    _FRAME = b"\xff\xfb\x90\x00" + b"\x00" * 413
+    
+    def synthesize(self, text: str, lang: str, speed: float, output_path: str):
+        frames = max(1, int(len(text) * 0.15 / speed / 0.026))
+        with open(output_path, "wb") as f:
+            f.write(self._FRAME * frames)
+
+# TTS 서비스 (제한된 실행기 + 동일 요청 합치기 + 크기 제한 캐시)
+class TTSService:
+    def __init__(self, engine=None, audio_dir: str = AUDIO_OUTPUT_DIR,
+                 max_concurrency: int = TTS_MAX_CONCURRENCY,
+                 max_files: int = TTS_CACHE_MAX_FILES, max_mb: float = TTS_CACHE_MAX_MB):
+        ensure_directories()
+        if engine is None:
+            engine = StubTTSEngine() if TTS_ENGINE == 'stub' or not GTTS_AVAILABLE else GTTSEngine()
+        self.engine = engine
+        self.audio_dir = audio_dir
+        self.max_concurrency = max_concurrency
+        self.max_files = max_files
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="tts")
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0, "evictions": 0}
+    
+    def cache_key(self, text: str, lang: str, speed: float) -> str:
+        payload = json.dumps([self.engine.name, lang, round(speed, 2), text], ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def cache_path(self, cache_key: str) -> str:
+        return os.path.join(self.audio_dir, f"tts_{cache_key[:24]}.mp3")
+    
+    async def synthesize(self, text: str, lang: str = 'ko', speed: float = 1.0) -> Dict:
+        """음성 합성 - 캐시 적중 시 기존 파일, 동일 요청은 하나로 합침"""
+        cache_key = self.cache_key(text, lang, speed)
+        audio_path = self.cache_path(cache_key)
+        
+        if os.path.exists(audio_path):
+            self.stats["hits"] += 1
+            TTS_REQUESTS.inc("hit")
+            # LRU 정리를 위해 접근 시각 갱신
+            os.utime(audio_path)
+            return {"audio_path": audio_path, "cached": True}
+        
+        pending = self._in_flight.get(cache_key)
+        if pending is not None:
+            self.stats["coalesced"] += 1
+            TTS_REQUESTS.inc("coalesced")
+            try:
+                await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # 합성하던 쪽이 취소됐으면 직접 다시 시도 (이 호출 자체가 취소된 경우는 그대로 전파)
+                if not pending.cancelled():
+                    raise
+                return await self.synthesize(text, lang, speed)
+            return {"audio_path": audio_path, "cached": True}
+        
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[cache_key] = future
+        try:
+            if self._semaphore is None:
+                self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            
+            async with self._semaphore:
+                self.stats["misses"] += 1
+                TTS_REQUESTS.inc("miss")
+                loop = asyncio.get_running_loop()
+                with TTS_SECONDS.time(self.engine.name):
+                    await loop.run_in_executor(self._executor, self._synthesize_file, text, lang, speed, audio_path)
+            
+            logger.info(f"✅ TTS 음성 생성 완료: {audio_path}")
+            future.set_result(audio_path)
+        except BaseException as e:
+            # 취소도 기다리는 쪽에 알려야 영원히 대기하지 않음
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                future.exception()
+            raise
+        finally:
+            self._in_flight.pop(cache_key, None)
+        
+        await loop.run_in_executor(self._executor, self._evict)
+        return {"audio_path": audio_path, "cached": False}
+    
+    def _synthesize_file(self, text: str, lang: str, speed: float, audio_path: str):
+        """임시 파일에 합성 후 원자적으로 교체"""
+        temp_path = f"{audio_path}.{uuid.uuid4().hex[:8]}.tmp"
+        try:
+            self.engine.synthesize(text, lang, speed, temp_path)
+            os.replace(temp_path, audio_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+    
+    def _evict(self):
+        """파일 수/용량 제한을 넘으면 오래 사용하지 않은 파일부터 삭제"""
+        entries = []
+        for name in os.listdir(self.audio_dir):
+            if name.startswith("tts_") and name.endswith(".mp3"):
+                path = os.path.join(self.audio_dir, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        
+        entries.sort()
+        total_bytes = sum(size for _, size, _ in entries)
+        while entries and (len(entries) > self.max_files or total_bytes > self.max_bytes):
+            _, size, path = entries.pop(0)
+            try:
+                os.remove(path)
+                self.stats["evictions"] += 1
+            except FileNotFoundError:
+                pass
+            total_bytes -= size
+    
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+# 릴스 제작 시스템 - OpenCV만 사용
+class ReelsProductionSystem:
+    def __init__(self):
+        ensure_directories()
+        self.temp_dir = TEMP_DIR
+        self.output_dir = VIDEO_OUTPUT_DIR
+        self.audio_dir = AUDIO_OUTPUT_DIR
+    
+    async def create_news_reel(self, news_data: Dict, style: str = "trending", duration: int = 15,
+                               reel_id: Optional[int] = None) -> Dict:
+        """뉴스 릴스 제작 - OpenCV 전용 (렌더링은 프로세스 풀에서 실행)"""
+        try:
+            logger.info(f"📹 릴스 제작 시작: {news_data['title'][:50]}...")
+            
+            # TTS 음성 생성 (선택적)
+            audio_result = None
+            if TTS_AVAILABLE:
                 audio_result = await self._generate_tts_audio(news_data, duration)
                 if not audio_result["success"]:
                     logger.warning("⚠️ TTS 실패, 음성 없이 진행")
             
             # 비주얼 생성 (OpenCV 전용)
-            visual_result = await self._create_opencv_video(news_data, duration)
+            visual_result = await self._create_opencv_video(news_data, duration, reel_id=reel_id, style=style)
+            
+            if audio_result and audio_result["success"]:
+                visual_result["audio_path"] = audio_result["audio_path"]
+                visual_result["script"] = audio_result["script"]
             
             return visual_result
             
@@ -489,24 +1618,217 @@ class ReelsProductionSystem:
                 "message": "릴스 제작 중 오류가 발생했습니다."
             }
     
+    async def start_reel_job(self, news_data: Dict, style: str = "trending", duration: int = 15) -> Dict:
+        """릴스 제작 작업을 영속 큐에 등록 후 즉시 작업 id(news_reels.id) 반환"""
+        database = get_database()
+        render_cache = get_render_cache()
+        
+        # 같은 입력으로 이미 렌더링된 릴스가 있으면 바로 반환
+        cache_key = render_cache.key_for(news_data['title'], style, duration)
+        cached = await database.run_read(render_cache.lookup, cache_key)
+        if cached is not None and cached["reel_id"] is not None:
+            render_cache.stats["hits"] += 1
+            await database.run_write(render_cache.record_hit, cache_key)
+            logger.info(f"♻️ 렌더 캐시 적중: 릴스 #{cached['reel_id']} (뉴스 {news_data['id']})")
+            return {"job_id": cached["reel_id"], "cached": True, "created": False}
+        
+        render_queue = get_render_queue()
+        reel_id, created = await database.run_write(render_queue.enqueue, news_data, style, duration)
+        # 리더가 아닌 워커는 등록만 하고, 리더의 디스패처가 폴링으로 가져감
+        render_queue.wake()
+        
+        if created:
+            logger.info(f"🧾 릴스 작업 등록: #{reel_id} (뉴스 {news_data['id']})")
+        else:
+            logger.info(f"🧾 동일 릴스 작업 진행 중: #{reel_id} (뉴스 {news_data['id']})")
+        return {"job_id": reel_id, "cached": False, "created": created}
+    
+    async def create_reels_batch(self, news_list: List[Dict], style: str = "trending", duration: int = 15) -> Dict:
+        """여러 뉴스 릴스 일괄 제작 (캐시 확인 후 워커별로 묶어 렌더링)"""
+        started = time.perf_counter()
+        database = get_database()
+        render_cache = get_render_cache()
+        
+        items = []
+        by_key: Dict[str, Dict] = {}
+        # 렌더링이 끝날 때까지 선점을 유지할 키 (저장/해제 시 제거)
+        claimed_keys = set()
+        async with render_cache.keep_claimed(claimed_keys):
+            for news in news_list:
+                cache_key = render_cache.key_for(news['title'], style, duration)
+                item = {"news_id": news['id'], "cache_key": cache_key, "status": "pending"}
+                items.append(item)
+                
+                if cache_key in by_key:
+                    # 같은 제목은 한 번만 렌더링
+                    item["status"] = "duplicate"
+                    continue
+                by_key[cache_key] = item
+                
+                state, entry = await database.run_write(render_cache.claim, cache_key)
+                if state == "ready":
+                    render_cache.stats["hits"] += 1
+                    item.update(status="cached", reel_id=entry["reel_id"], video_path=entry["video_path"],
+                                file_size_mb=entry["file_size_mb"])
+                elif state == "busy":
+                    item["status"] = "in_progress"
+                else:
+                    render_cache.stats["misses"] += 1
+                    claimed_keys.add(cache_key)
+                    item.update(
+                        news=news,
+                        title=news['title'],
+                        duration=duration,
+                        output_path=os.path.join(self.output_dir, f"reel_{cache_key[:24]}.mp4")
+                    )
+            
+            to_render = [item for item in by_key.values() if item["status"] == "pending"]
+            
+            if to_render:
+                now = datetime.now()
+                reel_ids = await database.insert_many("""
+                    INSERT INTO news_reels (news_id, style, duration, status, total_frames, created_at, created_epoch, started_epoch)
+                    VALUES (?, ?, ?, 'rendering', ?, ?, ?, ?)
+                """, [(item["news_id"], style, duration, int(duration * REEL_FPS), now.isoformat(),
+                       now.timestamp(), now.timestamp()) for item in to_render])
+                for item, reel_id in zip(to_render, reel_ids):
+                    item["reel_id"] = reel_id
+                    item["temp_path"] = item["output_path"][:-len(".mp4")] + f".{uuid.uuid4().hex[:8]}.tmp.mp4"
+                
+                # 워커 수만큼 묶음으로 나눠 각 프로세스가 스타일 에셋을 한 번만 준비
+                chunk_count = min(RENDER_WORKERS, len(to_render))
+                chunks = [to_render[i::chunk_count] for i in range(chunk_count)]
+                payloads = [
+                    [{"title": item["title"], "duration": item["duration"], "output_path": item["temp_path"],
+                      "cache_key": item["cache_key"]} for item in chunk]
+                    for chunk in chunks
+                ]
+                
+                loop = asyncio.get_running_loop()
+                
+                async def render_chunk(payload: List[Dict]) -> List[Dict]:
+                    return await loop.run_in_executor(get_render_executor(), _render_reel_batch_process, payload, style)
+                
+                async def synthesize_all() -> List[Dict]:
+                    # 단건 제작과 같은 스크립트/음성 - 렌더 캐시를 공유하므로 음성 없는 릴스를 남기지 않음
+                    if not TTS_AVAILABLE:
+                        return [{"success": False, "error": "TTS 라이브러리 없음"} for _ in to_render]
+                    return await asyncio.gather(*(self._generate_tts_audio(item["news"], duration) for item in to_render))
+                
+                # 음성은 렌더링과 동시에 생성
+                chunk_results, audio_results = await asyncio.gather(
+                    asyncio.gather(*(render_chunk(payload) for payload in payloads), return_exceptions=True),
+                    synthesize_all()
+                )
+                
+                results_by_key = {}
+                for payload, chunk_result in zip(payloads, chunk_results):
+                    if isinstance(chunk_result, BaseException):
+                        if isinstance(chunk_result, BrokenProcessPool):
+                            shutdown_render_executor()
+                        for entry in payload:
+                            results_by_key[entry["cache_key"]] = {"success": False, "error": str(chunk_result)}
+                    else:
+                        for entry in chunk_result:
+                            results_by_key[entry["cache_key"]] = entry
+                            if entry["success"]:
+                                _record_render_metrics(style, entry["frames"], entry["render_seconds"])
+                
+                for item, audio_result in zip(to_render, audio_results):
+                    # 워커가 일부 항목 결과를 돌려주지 않은 경우도 실패로 처리
+                    result = results_by_key.get(item["cache_key"], {"success": False, "error": "렌더링 결과 누락"})
+                    claimed_keys.discard(item["cache_key"])
+                    if result["success"] and os.path.exists(item["temp_path"]):
+                        os.replace(item["temp_path"], item["output_path"])
+                        file_size = os.path.getsize(item["output_path"]) / (1024 * 1024)
+                        if not audio_result["success"]:
+                            logger.warning(f"⚠️ TTS 실패, 음성 없이 진행: 릴스 #{item['reel_id']}")
+                        # 릴스 행을 먼저 완성한 뒤 캐시에 등록 (캐시 적중 시 음성/스크립트까지 있는 릴스 반환)
+                        await database.execute("""
+                            UPDATE news_reels SET status = 'created', video_path = ?, audio_path = ?, script = ?,
+                                   file_size_mb = ?, frames_written = total_frames, finished_epoch = ?
+                            WHERE id = ?
+                        """, (item["output_path"], audio_result.get("audio_path"), audio_result.get("script"),
+                              round(file_size, 1), time.time(), item["reel_id"]))
+                        await database.run_write(render_cache.store, item["cache_key"], item["output_path"],
+                                                 file_size, item["reel_id"])
+                        item.update(status="created", video_path=item["output_path"], file_size_mb=round(file_size, 1),
+                                    render_seconds=round(result["render_seconds"], 2))
+                    else:
+                        error = result.get("error") or "비디오 파일이 생성되지 않았습니다"
+                        await database.run_write(render_cache.release, item["cache_key"])
+                        await database.execute(
+                            "UPDATE news_reels SET status = 'failed', error = ?, finished_epoch = ? WHERE id = ?",
+                            (error, time.time(), item["reel_id"])
+                        )
+                        item.update(status="failed", error=error)
+        
+        # 중복 항목은 대표 항목 결과를 따름
+        for item in items:
+            if item["status"] == "duplicate":
+                source = by_key[item["cache_key"]]
+                item.update(reel_id=source.get("reel_id"), video_path=source.get("video_path"),
+                            file_size_mb=source.get("file_size_mb"))
+            for field in ("news", "title", "duration", "output_path", "temp_path"):
+                item.pop(field, None)
+        
+        elapsed = time.perf_counter() - started
+        counts: Dict[str, int] = {}
+        for item in items:
+            counts[item["status"]] = counts.get(item["status"], 0) + 1
+        
+        delivered = counts.get("created", 0) + counts.get("cached", 0) + counts.get("duplicate", 0)
+        logger.info(f"🎞️ 일괄 릴스 제작 완료: {counts} ({elapsed:.1f}초)")
+        
+        return {
+            "style": style,
+            "duration": duration,
+            "counts": counts,
+            "elapsed_seconds": round(elapsed, 2),
+            "reels_per_minute": round(delivered / elapsed * 60, 1) if elapsed > 0 else None,
+            "rendered_per_minute": round(counts.get("created", 0) / elapsed * 60, 1) if elapsed > 0 else None,
+            "items": items
+        }
+    
+    async def get_reel_job(self, reel_id: int) -> Optional[Dict]:
+        """릴스 작업 진행 상황 조회"""
+        row = await get_database().fetchone("""
+            SELECT r.id, r.news_id, r.status, r.style, r.duration, r.frames_written, r.total_frames,
+                   r.started_epoch, r.finished_epoch, r.video_path, r.file_size_mb, r.error,
+                   j.priority, j.attempts
+            FROM news_reels r
+            LEFT JOIN render_jobs j ON j.reel_id = r.id
+            WHERE r.id = ?
+            ORDER BY j.id DESC LIMIT 1
+        """, (reel_id,))
+        if row is None:
+            return None
+        
+        job = dict(row)
+        frames_written = job["frames_written"] or 0
+        total_frames = job["total_frames"] or 0
+        job["progress"] = round(frames_written / total_frames * 100, 1) if total_frames else 0.0
+        
+        job["eta_seconds"] = None
+        if job["status"] == "rendering" and job["started_epoch"] and frames_written:
+            elapsed = time.time() - job["started_epoch"]
+            job["eta_seconds"] = round(elapsed / frames_written * (total_frames - frames_written), 1)
+        
+        return job
+    
     async def _generate_tts_audio(self, news_data: Dict, duration: int) -> Dict:
-        """TTS 음성 생성"""
+        """TTS 음성 생성 (스크립트 해시 캐시)"""
         try:
             if not TTS_AVAILABLE:
                 return {"success": False, "error": "TTS 라이브러리 없음"}
             
             script = self._create_news_script(news_data, duration)
-            tts = gtts.gTTS(text=script, lang='ko', slow=False)
-            
-            audio_filename = f"news_{news_data['id']}_{int(time.time())}.mp3"
-            audio_path = os.path.join(self.audio_dir, audio_filename)
-            
-            tts.save(audio_path)
-            logger.info(f"✅ TTS 음성 생성 완료: {audio_path}")
+            result = await get_tts_service().synthesize(script, lang='ko')
             
             return {
                 "success": True,
-                "audio_path": audio_path,
+                "audio_path": result["audio_path"],
+                "cached": result["cached"],
                 "script": script
             }
             
@@ -530,102 +1852,173 @@ class ReelsProductionSystem:
         
         return script
     
-    async def _create_opencv_video(self, news_data: Dict, duration: int) -> Dict:
-        """OpenCV로 비디오 생성"""
+    async def _create_opencv_video(self, news_data: Dict, duration: int, reel_id: Optional[int] = None,
+                                   style: str = "trending") -> Dict:
+        """OpenCV로 비디오 생성 (렌더 캐시 확인 후 프로세스 풀에서 렌더링)"""
         try:
-            # 9:16 비율 (720x1280으로 가벼움)
-            width, height = 720, 1280
-            fps = 24  # 더 가벼운 FPS
-            frames_count = int(duration * fps)
+            render_cache = get_render_cache()
+            cache_key = render_cache.key_for(news_data['title'], style, duration)
+            
+            # 출력 파일 경로 (입력 해시 기반)
+            output_path = os.path.join(self.output_dir, f"reel_{cache_key[:24]}.mp4")
             
-            # 출력 파일 경로
-            output_filename = f"reel_{news_data['id']}_{int(time.time())}.mp4"
-            output_path = os.path.join(self.output_dir, output_filename)
+            async def render() -> float:
+                # 임시 파일에 렌더링 후 원자적으로 교체
+                temp_path = output_path[:-len(".mp4")] + f".{uuid.uuid4().hex[:8]}.tmp.mp4"
+                loop = asyncio.get_running_loop()
+                try:
+                    result = await loop.run_in_executor(
+                        get_render_executor(), _render_reel_process,
+                        news_data['title'], duration, temp_path, reel_id, DB_PATH, style
+                    )
+                    _record_render_metrics(style, result["frames"], result["render_seconds"])
+                except BrokenProcessPool:
+                    # 워커 프로세스가 죽으면 풀을 다시 만들도록 폐기
+                    shutdown_render_executor()
+                    raise
+                
+                if not os.path.exists(temp_path):
+                    raise Exception("비디오 파일이 생성되지 않았습니다")
+                os.replace(temp_path, output_path)
+                return os.path.getsize(output_path) / (1024 * 1024)  # MB
             
-            # VideoWriter 설정
-            fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-            out = cv2.VideoWriter(output_path, fourcc, fps, (width, height))
+            entry = await render_cache.get_or_render(cache_key, output_path, reel_id, render)
+            file_size = entry["file_size_mb"]
             
-            if not out.isOpened():
-                raise Exception("VideoWriter 초기화 실패")
+            if entry["cached"]:
+                logger.info(f"♻️ 렌더 캐시 재사용: {entry['video_path']}")
+            else:
+                logger.info(f"✅ 릴스 제작 완료: {entry['video_path']} ({file_size:.1f}MB)")
             
+            return {
+                "success": True,
+                "video_path": entry["video_path"],
+                "file_size_mb": round(file_size, 1),
+                "duration": duration,
+                "cached": entry["cached"],
+                "message": f"릴스가 성공적으로 제작되었습니다! ({file_size:.1f}MB)"
+            }
+            
+        except Exception as e:
+            logger.error(f"OpenCV 비디오 생성 오류: {e}")
+            return {
+                "success": False,
+                "error": str(e),
+                "message": "비디오 생성 중 오류가 발생했습니다."
+            }
+    
+    def _render_video_file(self, title: str, duration: int, output_path: str,
+                           width: int = REEL_WIDTH, height: int = REEL_HEIGHT, fps: int = REEL_FPS,
+                           progress_callback=None, style: str = "trending") -> int:
+        """프레임 렌더링 및 인코딩 (동기, CPU 작업)"""
+        frames_count = int(duration * fps)
+        
+        # VideoWriter 설정
+        fourcc = cv2.VideoWriter_fourcc(*'mp4v')
+        out = cv2.VideoWriter(output_path, fourcc, fps, (width, height))
+        
+        if not out.isOpened():
+            raise Exception("VideoWriter 초기화 실패")
+        
+        try:
             # 텍스트 준비
-            title_text = news_data['title']
+            title_text = title
             if len(title_text) > 50:
                 title_text = title_text[:47] + "..."
             
+            # 정적 레이어(배경 + 제목)는 한 번만 합성해 미리 할당한 버퍼에 둠
+            frame_buffer = self._compose_static_frame(title_text, width, height, style)
+            
             logger.info(f"🎬 {frames_count}프레임 생성 중...")
+            progress_step = max(1, frames_count // 10)
             
-            # 프레임 생성
+            # 모든 프레임이 동일하므로 버퍼를 그대로 인코더에 전달
             for frame_num in range(frames_count):
-                # 배경 생성 (단색)
-                frame = np.zeros((height, width, 3), dtype=np.uint8)
-                
-                # 그라데이션 효과
-                for y in range(height):
-                    ratio = y / height
-                    color_val = int(50 + ratio * 100)
-                    frame[y, :] = [color_val, color_val//2, 150]
-                
-                # 텍스트 추가 (OpenCV 기본 폰트)
-                text_lines = self._wrap_text(title_text, 25)
-                
-                for i, line in enumerate(text_lines[:3]):
-                    y_pos = height//2 - 60 + i * 80
-                    
-                    # 텍스트 크기 조정
-                    font_scale = 1.5
-                    thickness = 3
-                    
-                    # 텍스트 크기 계산
-                    (text_width, text_height), baseline = cv2.getTextSize(
-                        line, cv2.FONT_HERSHEY_SIMPLEX, font_scale, thickness
-                    )
-                    
-                    # 중앙 정렬 x 좌표
-                    x_pos = (width - text_width) // 2
-                    
-                    # 텍스트 그림자
-                    cv2.putText(frame, line, (x_pos + 3, y_pos + 3), 
-                               cv2.FONT_HERSHEY_SIMPLEX, font_scale, (0, 0, 0), thickness)
-                    
-                    # 메인 텍스트
-                    cv2.putText(frame, line, (x_pos, y_pos), 
-                               cv2.FONT_HERSHEY_SIMPLEX, font_scale, (255, 255, 255), thickness)
-                
-                # 프레임 쓰기
-                out.write(frame)
+                out.write(frame_buffer)
                 
                 # 진행률 로그 (10% 단위)
-                if frame_num % (frames_count // 10) == 0:
+                if frame_num % progress_step == 0:
                     progress = (frame_num / frames_count) * 100
                     logger.info(f"📹 진행률: {progress:.0f}%")
+                    if progress_callback is not None:
+                        progress_callback(frame_num + 1, frames_count)
             
+            if progress_callback is not None:
+                progress_callback(frames_count, frames_count)
+        finally:
             # VideoWriter 해제
             out.release()
+        
+        return frames_count
+    
+    # 프로세스 단위 공유 에셋 (스타일별 배경 판, 제목 레이아웃)
+    _background_plates: Dict[tuple, "np.ndarray"] = {}
+    _title_layouts: "OrderedDict[tuple, List[tuple]]" = OrderedDict()
+    _TITLE_LAYOUT_CACHE_SIZE = 256
+    
+    def _build_background(self, width: int, height: int, style: str = "trending") -> "np.ndarray":
+        """세로 그라데이션 배경 (NumPy 브로드캐스팅)"""
+        style_info = REEL_STYLES.get(style, REEL_STYLES["trending"])
+        top = np.array(style_info["gradient_top"], dtype=np.float64)
+        bottom = np.array(style_info["gradient_bottom"], dtype=np.float64)
+        ratios = np.arange(height) / height
+        
+        column = (top + ratios[:, None] * (bottom - top)).astype(np.uint8)
+        return np.ascontiguousarray(np.broadcast_to(column[:, None, :], (height, width, 3)))
+    
+    def _background_plate(self, width: int, height: int, style: str) -> "np.ndarray":
+        """스타일별 배경 판 (프로세스당 한 번 생성, 읽기 전용)"""
+        key = (style, width, height)
+        plate = self._background_plates.get(key)
+        if plate is None:
+            plate = self._build_background(width, height, style)
+            plate.setflags(write=False)
+            self._background_plates[key] = plate
+        return plate
+    
+    def _title_layout(self, title_text: str, width: int, height: int) -> List[tuple]:
+        """줄 나눔 + 중앙 정렬 좌표 (글꼴 측정 결과 캐시)"""
+        key = (title_text, width, height)
+        layout = self._title_layouts.get(key)
+        if layout is not None:
+            self._title_layouts.move_to_end(key)
+            return layout
+        
+        layout = []
+        for i, line in enumerate(self._wrap_text(title_text, 25)[:3]):
+            y_pos = height//2 - 60 + i * 80
             
-            # 파일 크기 확인
-            if os.path.exists(output_path):
-                file_size = os.path.getsize(output_path) / (1024 * 1024)  # MB
-                logger.info(f"✅ 릴스 제작 완료: {output_path} ({file_size:.1f}MB)")
-                
-                return {
-                    "success": True,
-                    "video_path": output_path,
-                    "file_size_mb": round(file_size, 1),
-                    "duration": duration,
-                    "message": f"릴스가 성공적으로 제작되었습니다! ({file_size:.1f}MB)"
-                }
-            else:
-                raise Exception("비디오 파일이 생성되지 않았습니다")
+            # 텍스트 크기 계산 후 중앙 정렬
+            (text_width, text_height), baseline = cv2.getTextSize(
+                line, cv2.FONT_HERSHEY_SIMPLEX, 1.5, 3
+            )
+            layout.append((line, (width - text_width) // 2, y_pos))
+        
+        self._title_layouts[key] = layout
+        if len(self._title_layouts) > self._TITLE_LAYOUT_CACHE_SIZE:
+            self._title_layouts.popitem(last=False)
+        return layout
+    
+    def _compose_static_frame(self, title_text: str, width: int, height: int,
+                              style: str = "trending") -> "np.ndarray":
+        """배경 + 제목 텍스트 합성"""
+        style_info = REEL_STYLES.get(style, REEL_STYLES["trending"])
+        frame = self._background_plate(width, height, style).copy()
+        
+        # 텍스트 추가 (OpenCV 기본 폰트)
+        font_scale = 1.5
+        thickness = 3
+        
+        for line, x_pos, y_pos in self._title_layout(title_text, width, height):
+            # 텍스트 그림자
+            cv2.putText(frame, line, (x_pos + 3, y_pos + 3), 
+                       cv2.FONT_HERSHEY_SIMPLEX, font_scale, style_info["shadow_color"], thickness)
             
-        except Exception as e:
-            logger.error(f"OpenCV 비디오 생성 오류: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "message": "비디오 생성 중 오류가 발생했습니다."
-            }
+            # 메인 텍스트
+            cv2.putText(frame, line, (x_pos, y_pos), 
+                       cv2.FONT_HERSHEY_SIMPLEX, font_scale, style_info["text_color"], thickness)
+        
+        return frame
     
     def _wrap_text(self, text: str, max_chars: int) -> List[str]:
         """텍스트를 여러 줄로 분할"""
@@ -646,22 +2039,858 @@ class ReelsProductionSystem:
         
         return lines
 
-# AI 콘텐츠 생성 시스템 (기존과 동일)
+def _render_reel_process(title: str, duration: int, output_path: str,
+                         reel_id: Optional[int] = None, db_path: str = DB_PATH,
+                         style: str = "trending") -> Dict:
+    """프로세스 풀 워커에서 릴스 렌더링 (진행률은 news_reels에 기록)"""
+    conn = connect_db(db_path) if reel_id is not None else None
+    
+    def report_progress(frames_written: int, total_frames: int):
+        if conn is None:
+            return
+        try:
+            conn.execute(
+                "UPDATE news_reels SET frames_written = ?, total_frames = ? WHERE id = ?",
+                (frames_written, total_frames, reel_id)
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ 진행률 기록 실패: {e}")
+    
+    try:
+        started = time.perf_counter()
+        frames_count = ReelsProductionSystem()._render_video_file(
+            title, duration, output_path, progress_callback=report_progress, style=style
+        )
+        return {
+            "frames": frames_count,
+            "render_seconds": time.perf_counter() - started
+        }
+    finally:
+        if conn is not None:
+            conn.close()
+
+def _record_render_metrics(style: str, frames: int, render_seconds: float):
+    """워커 프로세스가 돌려준 렌더링 결과를 메트릭에 기록"""
+    REEL_ENCODE_SECONDS.observe(style, value=render_seconds)
+    REEL_FRAMES.inc(style, amount=frames)
+    if render_seconds > 0:
+        REEL_RENDER_FPS.observe(style, value=frames / render_seconds)
+
+def _render_reel_batch_process(items: List[Dict], style: str) -> List[Dict]:
+    """프로세스 풀 워커에서 여러 릴스를 연속 렌더링 (스타일 에셋 공유)"""
+    producer = ReelsProductionSystem()
+    results = []
+    for item in items:
+        started = time.perf_counter()
+        try:
+            frames_count = producer._render_video_file(
+                item["title"], item["duration"], item["output_path"], style=style
+            )
+            results.append({
+                "cache_key": item["cache_key"],
+                "success": True,
+                "frames": frames_count,
+                "render_seconds": time.perf_counter() - started
+            })
+        except Exception as e:
+            results.append({"cache_key": item["cache_key"], "success": False, "error": str(e)})
+    return results
+
+# 렌더 결과 캐시 (입력 해시 기반, 프로세스 간 중복 렌더링 방지)
+class RenderCache:
+    def __init__(self, claim_timeout: float = RENDER_LEASE_SECONDS, poll_interval: float = 0.5):
+        self.claim_timeout = claim_timeout
+        self.poll_interval = poll_interval
+        self.owner = f"{socket.gethostname()}:{os.getpid()}"
+        self._populating: Dict[str, asyncio.Future] = {}
+        self.stats = {"hits": 0, "misses": 0, "waits": 0}
+    
+    @staticmethod
+    def key_for(title: str, style: str, duration: int, width: int = REEL_WIDTH,
+                height: int = REEL_HEIGHT, fps: int = REEL_FPS) -> str:
+        """출력에 영향을 주는 입력값의 해시"""
+        payload = json.dumps(
+            [title, style, duration, width, height, fps, RENDERER_VERSION],
+            ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    # ----- DB 작업 -----
+    def lookup(self, cache_key: str) -> Optional[Dict]:
+        """완료된 캐시 항목 조회 (파일이 사라졌으면 None)"""
+        row = get_database().fetchone_sync(
+            "SELECT * FROM render_cache WHERE cache_key = ? AND status = 'ready'", (cache_key,)
+        )
+        if row is None or not os.path.exists(row["video_path"]):
+            return None
+        return dict(row)
+    
+    def claim(self, cache_key: str) -> tuple:
+        """캐시 항목 선점 - ('ready', 항목) / ('claimed', None) / ('busy', None)"""
+        now = time.time()
+        with get_database().transaction() as conn:
+            row = conn.execute("SELECT * FROM render_cache WHERE cache_key = ?", (cache_key,)).fetchone()
+            
+            if row is not None and row["status"] == "ready":
+                if os.path.exists(row["video_path"]):
+                    conn.execute(
+                        "UPDATE render_cache SET hit_count = hit_count + 1, last_hit_epoch = ? WHERE cache_key = ?",
+                        (now, cache_key)
+                    )
+                    return "ready", dict(row)
+            elif row is not None and row["claimed_epoch"] > now - self.claim_timeout:
+                return "busy", None
+            
+            # 항목 없음, 파일 유실, 또는 오래된 선점 - 새로 선점
+            conn.execute("""
+                INSERT INTO render_cache (cache_key, status, owner, claimed_epoch)
+                VALUES (?, 'rendering', ?, ?)
+                ON CONFLICT (cache_key) DO UPDATE SET
+                    status = 'rendering', owner = excluded.owner, claimed_epoch = excluded.claimed_epoch
+            """, (cache_key, self.owner, now))
+            return "claimed", None
+    
+    def record_hit(self, cache_key: str):
+        """적중 횟수 기록"""
+        with get_database().transaction() as conn:
+            conn.execute(
+                "UPDATE render_cache SET hit_count = hit_count + 1, last_hit_epoch = ? WHERE cache_key = ?",
+                (time.time(), cache_key)
+            )
+    
+    def store(self, cache_key: str, video_path: str, file_size_mb: float, reel_id: Optional[int]):
+        """렌더링 완료 항목 기록"""
+        with get_database().transaction() as conn:
+            conn.execute("""
+                UPDATE render_cache
+                SET status = 'ready', video_path = ?, file_size_mb = ?, reel_id = ?, created_epoch = ?
+                WHERE cache_key = ?
+            """, (video_path, file_size_mb, reel_id, time.time(), cache_key))
+    
+    def heartbeat(self, cache_keys: List[str]):
+        """렌더링 중인 선점 갱신 - 오래 걸려도 다른 프로세스가 가져가지 않도록"""
+        if not cache_keys:
+            return
+        now = time.time()
+        with get_database().transaction() as conn:
+            conn.executemany(
+                "UPDATE render_cache SET claimed_epoch = ? WHERE cache_key = ? AND status = 'rendering' AND owner = ?",
+                [(now, cache_key, self.owner) for cache_key in cache_keys]
+            )
+    
+    def release(self, cache_key: str):
+        """렌더링 실패 시 선점 해제"""
+        with get_database().transaction() as conn:
+            conn.execute(
+                "DELETE FROM render_cache WHERE cache_key = ? AND status = 'rendering' AND owner = ?",
+                (cache_key, self.owner)
+            )
+    
+    def summary(self) -> Dict:
+        row = get_database().fetchone_sync("""
+            SELECT COUNT(*) AS entries, COALESCE(SUM(file_size_mb), 0) AS total_mb,
+                   COALESCE(SUM(hit_count), 0) AS total_hits
+            FROM render_cache WHERE status = 'ready'
+        """)
+        return {**dict(row), **self.stats}
+    
+    # ----- 캐시 채우기 (이벤트 루프) -----
+    @asynccontextmanager
+    async def keep_claimed(self, cache_keys):
+        """블록이 끝날 때까지 선점 만료 시간의 1/3 간격으로 하트비트 (cache_keys는 진행 중 갱신 가능)"""
+        database = get_database()
+        
+        async def beat():
+            while True:
+                await asyncio.sleep(self.claim_timeout / 3)
+                try:
+                    await database.run_write(self.heartbeat, list(cache_keys))
+                except Exception as e:
+                    logger.warning(f"렌더 캐시 하트비트 실패: {e}")
+        
+        task = asyncio.create_task(beat())
+        try:
+            yield
+        finally:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+    
+    async def get_or_render(self, cache_key: str, output_path: str, reel_id: Optional[int], render) -> Dict:
+        """캐시 적중 시 기존 파일 반환, 아니면 한 곳에서만 렌더링"""
+        # 같은 프로세스의 동시 요청은 하나의 렌더링 결과를 공유
+        pending = self._populating.get(cache_key)
+        if pending is not None:
+            self.stats["waits"] += 1
+            entry = await asyncio.shield(pending)
+            return {**entry, "cached": True}
+        
+        future = asyncio.get_running_loop().create_future()
+        self._populating[cache_key] = future
+        try:
+            entry = await self._populate(cache_key, output_path, reel_id, render)
+            future.set_result(entry)
+            return entry
+        except Exception as e:
+            future.set_exception(e)
+            # 기다리는 쪽이 없어도 경고가 남지 않도록 예외 확인 처리
+            future.exception()
+            raise
+        finally:
+            self._populating.pop(cache_key, None)
+    
+    async def _populate(self, cache_key: str, output_path: str, reel_id: Optional[int], render) -> Dict:
+        database = get_database()
+        while True:
+            state, entry = await database.run_write(self.claim, cache_key)
+            
+            if state == "ready":
+                self.stats["hits"] += 1
+                return {"video_path": entry["video_path"], "file_size_mb": entry["file_size_mb"], "cached": True}
+            
+            if state == "busy":
+                # 다른 프로세스가 렌더링 중 - 완료될 때까지 대기
+                self.stats["waits"] += 1
+                await asyncio.sleep(self.poll_interval)
+                continue
+            
+            self.stats["misses"] += 1
+            try:
+                async with self.keep_claimed([cache_key]):
+                    file_size_mb = await render()
+            except BaseException:
+                await database.run_write(self.release, cache_key)
+                raise
+            
+            await database.run_write(self.store, cache_key, output_path, file_size_mb, reel_id)
+            return {"video_path": output_path, "file_size_mb": file_size_mb, "cached": False}
+
+# 영속 렌더링 작업 큐 (SQLite, 우선순위 + 임대/하트비트)
+class RenderQueue:
+    def __init__(self, concurrency: int = RENDER_WORKERS):
+        self.concurrency = concurrency
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._in_flight: Dict[int, asyncio.Task] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+    
+    @staticmethod
+    def _priority(news_data: Dict) -> float:
+        """바이럴 점수 + 최신성 (시간이 지나도 순서가 변하지 않는 형태)"""
+        scraped_epoch = news_data.get("scraped_epoch") or time.time()
+        return (news_data.get("viral_score") or 0.0) + RENDER_FRESHNESS_WEIGHT * scraped_epoch / 3600
+    
+    # ----- DB 작업 (쓰기 스레드에서 실행) -----
+    def enqueue(self, news_data: Dict, style: str, duration: int) -> tuple:
+        """작업 등록 - 같은 뉴스/스타일/길이의 진행 중 작업이 있으면 재사용"""
+        database = get_database()
+        with database.transaction() as conn:
+            existing = conn.execute("""
+                SELECT reel_id FROM render_jobs
+                WHERE news_id = ? AND style = ? AND duration = ? AND status IN ('pending', 'leased')
+            """, (news_data['id'], style, duration)).fetchone()
+            if existing is not None:
+                return existing["reel_id"], False
+            
+            now = datetime.now()
+            reel_id = conn.execute("""
+                INSERT INTO news_reels (news_id, style, duration, status, total_frames, created_at, created_epoch)
+                VALUES (?, ?, ?, 'queued', ?, ?, ?)
+            """, (news_data['id'], style, duration, int(duration * REEL_FPS), now.isoformat(), now.timestamp())).lastrowid
+            
+            conn.execute("""
+                INSERT INTO render_jobs (reel_id, news_id, style, duration, priority, created_epoch)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (reel_id, news_data['id'], style, duration, self._priority(news_data), now.timestamp()))
+            return reel_id, True
+    
+    def enqueue_many(self, news_list: List[Dict], style: str, duration: int) -> List[int]:
+        """여러 작업 등록"""
+        return [self.enqueue(news, style, duration)[0] for news in news_list]
+    
+    def requeue_expired(self) -> int:
+        """임대 만료(워커 중단) 작업을 재시도 대기열로 복귀"""
+        now = time.time()
+        with get_database().transaction() as conn:
+            failed = conn.execute("""
+                UPDATE render_jobs SET status = 'failed', lease_owner = NULL, updated_epoch = ?,
+                       last_error = '임대 만료 - 최대 재시도 초과'
+                WHERE status = 'leased' AND lease_expires_epoch < ? AND attempts >= ?
+                RETURNING reel_id
+            """, (now, now, RENDER_MAX_ATTEMPTS)).fetchall()
+            for row in failed:
+                conn.execute(
+                    "UPDATE news_reels SET status = 'failed', error = '렌더링 워커 중단', finished_epoch = ? WHERE id = ?",
+                    (now, row["reel_id"])
+                )
+            
+            requeued = conn.execute("""
+                UPDATE render_jobs SET status = 'pending', lease_owner = NULL, updated_epoch = ?
+                WHERE status = 'leased' AND lease_expires_epoch < ?
+            """, (now, now)).rowcount
+        
+        if requeued or failed:
+            logger.warning(f"⚠️ 임대 만료 작업: 재시도 {requeued}개, 실패 {len(failed)}개")
+        return requeued
+    
+    def lease(self, limit: int) -> List[Dict]:
+        """우선순위 순으로 작업 임대"""
+        if limit <= 0:
+            return []
+        now = time.time()
+        with get_database().transaction() as conn:
+            rows = conn.execute("""
+                UPDATE render_jobs
+                SET status = 'leased', lease_owner = ?, lease_expires_epoch = ?,
+                    attempts = attempts + 1, updated_epoch = ?
+                WHERE id IN (
+                    SELECT id FROM render_jobs WHERE status = 'pending'
+                    ORDER BY priority DESC, id LIMIT ?
+                )
+                RETURNING id, reel_id, news_id, style, duration, priority, attempts
+            """, (self.owner, now + RENDER_LEASE_SECONDS, now, limit)).fetchall()
+            
+            jobs = []
+            for row in rows:
+                job = dict(row)
+                article = conn.execute(
+                    "SELECT id, title, category, viral_score FROM news_articles WHERE id = ?",
+                    (job["news_id"],)
+                ).fetchone()
+                job["news_data"] = dict(article) if article else None
+                conn.execute(
+                    "UPDATE news_reels SET status = 'rendering', started_epoch = ?, frames_written = 0 WHERE id = ?",
+                    (now, job["reel_id"])
+                )
+                jobs.append(job)
+        
+        jobs.sort(key=lambda job: (-job["priority"], job["id"]))
+        return jobs
+    
+    def heartbeat(self, job_ids: List[int]):
+        """보유 중인 작업 임대 연장"""
+        if not job_ids:
+            return
+        expires = time.time() + RENDER_LEASE_SECONDS
+        with get_database().transaction() as conn:
+            conn.executemany(
+                "UPDATE render_jobs SET lease_expires_epoch = ? WHERE id = ? AND lease_owner = ? AND status = 'leased'",
+                [(expires, job_id, self.owner) for job_id in job_ids]
+            )
+    
+    def complete(self, job: Dict, result: Dict):
+        """작업 완료 기록"""
+        now = time.time()
+        with get_database().transaction() as conn:
+            conn.execute(
+                "UPDATE render_jobs SET status = 'done', lease_owner = NULL, updated_epoch = ? WHERE id = ? AND lease_owner = ?",
+                (now, job["id"], self.owner)
+            )
+            conn.execute("""
+                UPDATE news_reels
+                SET status = 'created', video_path = ?, audio_path = ?, script = ?,
+                    file_size_mb = ?, frames_written = total_frames, finished_epoch = ?, error = NULL
+                WHERE id = ?
+            """, (result["video_path"], result.get("audio_path"), result.get("script"),
+                  result["file_size_mb"], now, job["reel_id"]))
+    
+    def fail(self, job: Dict, error: str):
+        """작업 실패 기록 - 재시도 횟수가 남아 있으면 대기열로 복귀"""
+        now = time.time()
+        retry = job["attempts"] < RENDER_MAX_ATTEMPTS
+        with get_database().transaction() as conn:
+            conn.execute("""
+                UPDATE render_jobs SET status = ?, lease_owner = NULL, last_error = ?, updated_epoch = ?
+                WHERE id = ? AND lease_owner = ?
+            """, ('pending' if retry else 'failed', error, now, job["id"], self.owner))
+            conn.execute(
+                "UPDATE news_reels SET status = ?, error = ?, finished_epoch = ? WHERE id = ?",
+                ('queued' if retry else 'failed', error, None if retry else now, job["reel_id"])
+            )
+    
+    def in_flight(self) -> List[int]:
+        """이 프로세스에서 렌더링 중인 작업 id"""
+        return sorted(self._in_flight)
+    
+    def depth(self) -> Dict[str, int]:
+        """상태별 작업 수"""
+        rows = get_database().fetchall_sync("SELECT status, COUNT(*) AS count FROM render_jobs GROUP BY status")
+        return {row["status"]: row["count"] for row in rows}
+    
+    # ----- 디스패처 (이벤트 루프) -----
+    def start(self):
+        """디스패처 시작 (이미 실행 중이면 무시)"""
+        if self._dispatcher is None or self._dispatcher.done():
+            self._wakeup = asyncio.Event()
+            self._dispatcher = asyncio.create_task(self._dispatch_loop())
+            logger.info(f"🚚 렌더링 큐 디스패처 시작 (동시 {self.concurrency}개, {self.owner})")
+    
+    def wake(self):
+        if self._wakeup is not None:
+            self._wakeup.set()
+    
+    async def stop(self):
+        """디스패처 중지 - 진행 중 작업은 임대 만료 후 다른 워커가 재시도"""
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            try:
+                await self._dispatcher
+            except asyncio.CancelledError:
+                pass
+            self._dispatcher = None
+        for task in list(self._in_flight.values()):
+            task.cancel()
+        self._in_flight.clear()
+    
+    async def _dispatch_loop(self):
+        database = get_database()
+        while True:
+            try:
+                await database.run_write(self.requeue_expired)
+                await database.run_write(self.heartbeat, list(self._in_flight))
+                
+                jobs = await database.run_write(self.lease, self.concurrency - len(self._in_flight))
+                for job in jobs:
+                    task = asyncio.create_task(self._run_job(job))
+                    self._in_flight[job["id"]] = task
+                    task.add_done_callback(lambda _, job_id=job["id"]: self._in_flight.pop(job_id, None))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"렌더링 큐 디스패처 오류: {e}")
+            
+            # 새 작업 등록 시 즉시 깨어나고, 아니면 주기적으로 폴링/하트비트
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=RENDER_QUEUE_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+    
+    async def _run_job(self, job: Dict):
+        """임대한 작업 렌더링"""
+        database = get_database()
+        try:
+            if job["news_data"] is None:
+                raise Exception(f"뉴스를 찾을 수 없습니다: {job['news_id']}")
+            
+            producer = get_reels_producer()
+            result = await producer.create_news_reel(
+                job["news_data"], job["style"], job["duration"], reel_id=job["reel_id"]
+            )
+            
+            if result.get("success"):
+                await database.run_write(self.complete, job, result)
+                logger.info(f"✅ 렌더링 작업 #{job['id']} 완료 (릴스 {job['reel_id']})")
+            else:
+                await database.run_write(self.fail, job, result.get("error") or "렌더링 실패")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"렌더링 작업 #{job['id']} 오류: {e}")
+            await database.run_write(self.fail, job, str(e))
+        finally:
+            self.wake()
+
+# 적응형 백그라운드 크롤링 스케줄러 (카테고리별 간격, 변화율에 따라 조정)
+class CrawlScheduler:
+    def __init__(self, categories: Optional[List[str]] = None, concurrency: int = CRAWL_CONCURRENCY,
+                 max_articles: int = CRAWL_MAX_ARTICLES, base_interval: float = CRAWL_BASE_INTERVAL_SECONDS,
+                 min_interval: float = CRAWL_MIN_INTERVAL_SECONDS, max_interval: float = CRAWL_MAX_INTERVAL_SECONDS,
+                 jitter_ratio: float = CRAWL_JITTER_RATIO):
+        self.concurrency = concurrency
+        self.max_articles = max_articles
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.jitter_ratio = jitter_ratio
+        
+        # 첫 실행은 지터만큼 흩어서 모든 카테고리가 동시에 몰리지 않게 함
+        now = time.time()
+        base_interval = min(max(base_interval, min_interval), max_interval)
+        self.schedule: Dict[str, Dict] = {}
+        for category in categories or list(NEWS_CATEGORIES.keys()):
+            self.schedule[category] = {
+                "interval": base_interval,
+                "next_run": now + random.uniform(0, base_interval * jitter_ratio),
+                "last_run": None,
+                "last_fetched": 0,
+                "last_new": 0,
+                "runs": 0,
+                "total_new": 0,
+                "last_error": None
+            }
+        
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+    
+    def start(self):
+        """스케줄러 시작 (이미 실행 중이면 무시)"""
+        if self._dispatcher is None or self._dispatcher.done():
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._wakeup = asyncio.Event()
+            self._dispatcher = asyncio.create_task(self._dispatch_loop())
+            logger.info(f"⏰ 크롤링 스케줄러 시작 ({len(self.schedule)}개 카테고리, 동시 {self.concurrency}개)")
+    
+    def wake(self):
+        if self._wakeup is not None:
+            self._wakeup.set()
+    
+    def run_now(self, category: str) -> bool:
+        """다음 실행을 즉시로 당김"""
+        state = self.schedule.get(category)
+        if state is None:
+            return False
+        state["next_run"] = time.time()
+        self.wake()
+        return True
+    
+    async def stop(self):
+        """스케줄러 및 진행 중 크롤링 중지"""
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            try:
+                await self._dispatcher
+            except asyncio.CancelledError:
+                pass
+            self._dispatcher = None
+        for task in list(self._in_flight.values()):
+            task.cancel()
+        self._in_flight.clear()
+    
+    @property
+    def running(self) -> bool:
+        return self._dispatcher is not None and not self._dispatcher.done()
+    
+    def _next_interval(self, interval: float, fetched: int, new_count: int) -> float:
+        """새 기사가 절반 이상이면 간격 절반, 새 기사가 없으면 두 배, 그 외 유지"""
+        if fetched > 0 and new_count * 2 >= fetched:
+            interval /= 2
+        elif new_count == 0:
+            interval *= 2
+        return min(max(interval, self.min_interval), self.max_interval)
+    
+    def _jittered(self, interval: float) -> float:
+        return interval * (1 + random.uniform(-self.jitter_ratio, self.jitter_ratio))
+    
+    async def _dispatch_loop(self):
+        while True:
+            now = time.time()
+            for category, state in self.schedule.items():
+                if category not in self._in_flight and state["next_run"] <= now:
+                    task = asyncio.create_task(self._crawl_category(category))
+                    self._in_flight[category] = task
+                    task.add_done_callback(lambda _, category=category: self._in_flight.pop(category, None))
+            
+            # 가장 가까운 예정 시각까지 대기 (일정 변경 시 즉시 깨어남)
+            pending = [state["next_run"] for category, state in self.schedule.items()
+                       if category not in self._in_flight]
+            timeout = max(0.0, min(pending) - time.time()) if pending else self.max_interval
+            
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+    
+    async def _crawl_category(self, category: str):
+        """카테고리 하나 크롤링 후 다음 실행 시각 계산"""
+        state = self.schedule[category]
+        fetched = 0
+        new_count = 0
+        
+        try:
+            async with self._semaphore:
+                scraper = get_news_scraper()
+                news_list = await scraper._scrape_google_news(category, self.max_articles)
+                fetched = len(news_list)
+                
+                # 최근 수집 이력과 비교해 새 기사만 저장
+                await get_dedup_index().refresh()
+                unique_news = scraper._filter_duplicate_news(news_list, relaxed=False)
+                unique_news.sort(key=lambda x: x['viral_score'], reverse=True)
+                
+                if unique_news:
+                    saved_news = await save_news_articles(unique_news[:self.max_articles])
+                    new_count = len(saved_news)
+            state["last_error"] = None
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"❌ {category} 예약 크롤링 오류: {e}")
+            state["last_error"] = str(e)
+        finally:
+            now = time.time()
+            state["interval"] = self._next_interval(state["interval"], fetched, new_count)
+            state["next_run"] = now + self._jittered(state["interval"])
+            state["last_run"] = now
+            state["last_fetched"] = fetched
+            state["last_new"] = new_count
+            state["runs"] += 1
+            state["total_new"] += new_count
+            self.wake()
+        
+        logger.info(f"⏰ {category}: 새 기사 {new_count}/{fetched}개, 다음 간격 {state['interval']:.0f}초")
+    
+    def snapshot(self) -> Dict:
+        """현재 일정 조회"""
+        now = time.time()
+        categories = {}
+        for category, state in sorted(self.schedule.items(), key=lambda item: item[1]["next_run"]):
+            categories[category] = {
+                "interval_seconds": round(state["interval"], 1),
+                "next_run_in_seconds": round(max(0.0, state["next_run"] - now), 1),
+                "running": category in self._in_flight,
+                "last_run_at": datetime.fromtimestamp(state["last_run"]).isoformat() if state["last_run"] else None,
+                "last_fetched": state["last_fetched"],
+                "last_new": state["last_new"],
+                "runs": state["runs"],
+                "total_new": state["total_new"],
+                "last_error": state["last_error"]
+            }
+        return {
+            "enabled": CRAWL_SCHEDULER_ENABLED,
+            "running": self.running,
+            "concurrency": self.concurrency,
+            "min_interval_seconds": self.min_interval,
+            "max_interval_seconds": self.max_interval,
+            "categories": categories
+        }
+
+# 백그라운드 작업 리더 선출 (SQLite 임대 - 여러 워커 중 하나만 크롤링/렌더링 디스패처 실행)
+class LeaderElection:
+    def __init__(self, name: str = "background", lease_seconds: float = LEADER_LEASE_SECONDS):
+        self.name = name
+        self.lease_seconds = lease_seconds
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.is_leader = False
+        self._on_elected = None
+        self._on_demoted = None
+        self._task: Optional[asyncio.Task] = None
+    
+    # ----- DB 작업 (쓰기 스레드에서 실행) -----
+    def try_acquire(self) -> bool:
+        """임대 획득/갱신 - 비어 있거나 만료됐거나 이미 내 것이면 성공"""
+        now = time.time()
+        with get_database().transaction() as conn:
+            conn.execute("""
+                INSERT INTO leader_lease (name, owner, acquired_epoch, expires_epoch)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (name) DO UPDATE SET
+                    owner = excluded.owner,
+                    acquired_epoch = CASE WHEN leader_lease.owner = excluded.owner
+                                          THEN leader_lease.acquired_epoch ELSE excluded.acquired_epoch END,
+                    expires_epoch = excluded.expires_epoch
+                WHERE leader_lease.owner = excluded.owner OR leader_lease.expires_epoch < ?
+            """, (self.name, self.owner, now, now + self.lease_seconds, now))
+            row = conn.execute("SELECT owner FROM leader_lease WHERE name = ?", (self.name,)).fetchone()
+        return row is not None and row["owner"] == self.owner
+    
+    def release(self):
+        """임대 반납 (다른 워커가 바로 이어받을 수 있게)"""
+        with get_database().transaction() as conn:
+            conn.execute("DELETE FROM leader_lease WHERE name = ? AND owner = ?", (self.name, self.owner))
+    
+    def current(self) -> Optional[Dict]:
+        row = get_database().fetchone_sync("SELECT * FROM leader_lease WHERE name = ?", (self.name,))
+        return dict(row) if row is not None else None
+    
+    # ----- 선출 루프 (이벤트 루프) -----
+    async def start(self, on_elected, on_demoted):
+        """첫 선출을 즉시 시도한 뒤 임대 기간의 1/3마다 갱신"""
+        self._on_elected = on_elected
+        self._on_demoted = on_demoted
+        await self._campaign()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._campaign_loop())
+    
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self.is_leader:
+            await self._set_leader(False)
+            try:
+                await get_database().run_write(self.release)
+            except Exception as e:
+                logger.warning(f"⚠️ 리더 임대 반납 실패: {e}")
+    
+    async def _campaign_loop(self):
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            await self._campaign()
+    
+    async def _campaign(self):
+        try:
+            elected = await get_database().run_write(self.try_acquire)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # 갱신에 실패하면 임대가 만료되기 전에 스스로 물러남
+            logger.error(f"리더 임대 갱신 오류: {e}")
+            elected = False
+        if elected != self.is_leader:
+            await self._set_leader(elected)
+    
+    async def _set_leader(self, elected: bool):
+        self.is_leader = elected
+        if elected:
+            logger.info(f"👑 백그라운드 작업 리더로 선출됨 ({self.owner})")
+            await self._on_elected()
+        else:
+            logger.info(f"🔕 백그라운드 작업 리더 해제 ({self.owner})")
+            await self._on_demoted()
+    
+    def snapshot(self) -> Dict:
+        return {
+            "owner": self.owner,
+            "is_leader": self.is_leader,
+            "lease_seconds": self.lease_seconds
+        }
+
+# 조회 API 응답 캐시 (직렬화된 본문 + ETag, DB가 바뀌면 무효화)
+class ResponseCache:
+    def __init__(self, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._content_version: Optional[int] = None
+        self.stats = {"hits": 0, "misses": 0, "invalidations": 0, "evictions": 0}
+    
+    @staticmethod
+    def make_etag(body: bytes) -> str:
+        return '"' + hashlib.md5(body).hexdigest() + '"'
+    
+    def sync(self, version: int):
+        """기사/릴스가 바뀌었으면(다른 워커 포함) 전체 무효화 (version은 read_content_version 값)"""
+        if version != self._content_version:
+            if self._content_version is not None:
+                self.invalidate()
+            self._content_version = version
+    
+    def get(self, key: tuple) -> Optional[tuple]:
+        """(본문, ETag) 조회"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return entry
+    
+    def store(self, key: tuple, body: bytes) -> tuple:
+        entry = (body, self.make_etag(body))
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+        return entry
+    
+    def invalidate(self, scope: Optional[str] = None):
+        """scope(키의 첫 항목)에 해당하는 응답 제거, 없으면 전체 제거"""
+        if scope is None:
+            self._entries.clear()
+        else:
+            for key in [key for key in self._entries if key[0] == scope]:
+                del self._entries[key]
+        self.stats["invalidations"] += 1
+    
+    def summary(self) -> Dict:
+        return {"entries": len(self._entries), **self.stats}
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 비교 (여러 값, 약한 ETag, * 허용)"""
+    if not if_none_match:
+        return False
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    return "*" in candidates or any(value.removeprefix("W/") == etag for value in candidates)
+
+# 분당 요청/토큰 한도 (토큰 버킷 두 개 - 부족하면 채워질 때까지 순서대로 대기)
+class RateLimiter:
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float):
+        self.request_capacity = requests_per_minute
+        self.token_capacity = tokens_per_minute
+        self._requests = requests_per_minute
+        self._tokens = tokens_per_minute
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+        self.stats = {"acquired": 0, "waited_seconds": 0.0}
+    
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._requests = min(self.request_capacity, self._requests + elapsed * self.request_capacity / 60)
+        self._tokens = min(self.token_capacity, self._tokens + elapsed * self.token_capacity / 60)
+    
+    async def acquire(self, tokens: int):
+        # 한도보다 큰 요청은 영원히 통과하지 못하므로 한도로 제한
+        tokens = min(tokens, self.token_capacity)
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._requests >= 1 and self._tokens >= tokens:
+                    self._requests -= 1
+                    self._tokens -= tokens
+                    self.stats["acquired"] += 1
+                    return
+                
+                wait = max(
+                    (1 - self._requests) * 60 / self.request_capacity,
+                    (tokens - self._tokens) * 60 / self.token_capacity
+                )
+                self.stats["waited_seconds"] += wait
+                await asyncio.sleep(wait)
+
+# AI 콘텐츠 생성 시스템 (기사 여러 건을 한 번의 요청으로 처리, 결과는 title_hash + 스타일로 캐시)
 class AdvancedContentGenerator:
     def __init__(self):
+        self.openai_client = None
+        # 구버전(0.x) 클라이언트는 비동기 일괄 처리를 지원하지 않아 폴백만 사용
+        self.async_capable = False
+        self.rate_limiter = RateLimiter(CAPTION_REQUESTS_PER_MINUTE, CAPTION_TOKENS_PER_MINUTE)
+        self._pending: Dict[str, List[tuple]] = {}
+        self._flush_handles: Dict[str, asyncio.TimerHandle] = {}
+        self._in_flight: Dict[tuple, asyncio.Future] = {}
+        self._tasks = set()
+        self.stats = {"requests": 0, "batched_items": 0, "retries": 0, "cache_hits": 0, "fallbacks": 0, "coalesced": 0}
+        
         api_key = os.getenv('OPENAI_API_KEY')
         
         if not api_key:
             logger.warning("⚠️ OPENAI_API_KEY가 설정되지 않았습니다.")
-            self.openai_client = None
+            return
+        
+        if not OPENAI_AVAILABLE:
             return
         
         try:
-            if OPENAI_V1:
-                self.openai_client = openai.OpenAI(api_key=api_key)
+            openai_version = openai.__version__
+            logger.info(f"📦 OpenAI 버전: {openai_version}")
+            
+            if hasattr(openai, "AsyncOpenAI"):
+                # 재시도/백오프는 rate limiter와 함께 직접 관리
+                self.openai_client = openai.AsyncOpenAI(
+                    api_key=api_key,
+                    base_url=OPENAI_BASE_URL,
+                    timeout=CAPTION_TIMEOUT_SECONDS,
+                    max_retries=0
+                )
+                self.async_capable = True
             else:
-                openai.api_key = api_key
-                self.openai_client = openai
+                legacy_openai = importlib.import_module("openai")
+                legacy_openai.api_key = api_key
+                self.openai_client = legacy_openai
             
             logger.info(f"✅ OpenAI 클라이언트 초기화 완료")
             
@@ -670,22 +2899,238 @@ class AdvancedContentGenerator:
             self.openai_client = None
     
     async def generate_viral_caption(self, news_data: Dict, style: str = "viral") -> Dict:
-        """바이럴 캡션 생성"""
-        if not self.openai_client:
+        """바이럴 캡션 생성 (동시에 들어온 단건 요청은 모아서 한 번에 요청)"""
+        if not self.openai_client or not self.async_capable:
             return self._generate_fallback_caption(news_data)
         
-        # OpenAI API 사용 로직 (기존과 동일)
-        return self._generate_fallback_caption(news_data)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self._pending.setdefault(style, [])
+        pending.append((news_data, future))
+        
+        if len(pending) >= CAPTION_BATCH_SIZE:
+            self._flush_pending(style)
+        elif style not in self._flush_handles:
+            self._flush_handles[style] = loop.call_later(CAPTION_BATCH_WAIT_SECONDS, self._flush_pending, style)
+        return await future
+    
+    def _flush_pending(self, style: str):
+        handle = self._flush_handles.pop(style, None)
+        if handle is not None:
+            handle.cancel()
+        batch = self._pending.pop(style, [])
+        if batch:
+            task = asyncio.ensure_future(self._resolve_pending(batch, style))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def _resolve_pending(self, batch: List[tuple], style: str):
+        try:
+            results = await self.generate_captions([news_data for news_data, _ in batch], style)
+        except Exception as e:
+            logger.error(f"❌ 캡션 일괄 생성 오류: {e}")
+            results = [self._generate_fallback_caption(news_data) for news_data, _ in batch]
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+    
+    async def generate_captions(self, news_list: List[Dict], style: str = "viral",
+                                batch_size: int = CAPTION_BATCH_SIZE) -> List[Dict]:
+        """여러 기사 캡션 생성 - 캐시 조회 후 나머지를 batch_size개씩 묶어 요청"""
+        if not self.openai_client or not self.async_capable:
+            return [self._generate_fallback_caption(news_data) for news_data in news_list]
+        
+        hashes = [self._title_hash(news_data) for news_data in news_list]
+        cached = await get_database().run_read(self._lookup_cached, list(set(hashes)), style)
+        self.stats["cache_hits"] += sum(1 for title_hash in hashes if title_hash in cached)
+        
+        # 같은 제목은 한 번만, 다른 호출이 이미 요청 중인 제목은 그 결과를 기다림
+        owned = {}
+        waiting = {}
+        for news_data, title_hash in zip(news_list, hashes):
+            if title_hash in cached or title_hash in owned or title_hash in waiting:
+                continue
+            in_flight = self._in_flight.get((title_hash, style))
+            if in_flight is not None:
+                waiting[title_hash] = in_flight
+                self.stats["coalesced"] += 1
+            else:
+                owned[title_hash] = news_data
+                self._in_flight[(title_hash, style)] = asyncio.get_running_loop().create_future()
+        
+        generated = {}
+        try:
+            items = list(owned.items())
+            batches = [items[i:i + batch_size] for i in range(0, len(items), max(batch_size, 1))]
+            for batch_result in await asyncio.gather(*(self._caption_batch(batch, style) for batch in batches)):
+                generated.update(batch_result)
+        finally:
+            for title_hash in owned:
+                future = self._in_flight.pop((title_hash, style))
+                future.set_result(generated.get(title_hash))
+        
+        for title_hash, future in waiting.items():
+            generated[title_hash] = await asyncio.shield(future)
+        
+        results = []
+        for news_data, title_hash in zip(news_list, hashes):
+            if title_hash in cached:
+                CAPTION_RESULTS.inc("cache")
+                results.append(cached[title_hash])
+            elif generated.get(title_hash) is not None:
+                results.append(generated[title_hash])
+            else:
+                results.append(self._generate_fallback_caption(news_data))
+        return results
+    
+    async def _caption_batch(self, batch: List[tuple], style: str) -> Dict[str, Dict]:
+        """기사 묶음 하나를 한 번의 요청으로 처리 (시간 초과나 오류 시 폴백, 폴백은 캐시하지 않음)"""
+        captions = {}
+        try:
+            captions = await asyncio.wait_for(self._request_captions(batch, style), CAPTION_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            logger.warning(f"⏱️ 캡션 생성 시간 초과 ({len(batch)}건) - 폴백 캡션 사용")
+        except Exception as e:
+            logger.warning(f"⚠️ 캡션 생성 실패 ({len(batch)}건) - 폴백 캡션 사용: {e}")
+        
+        results = {}
+        rows = []
+        for title_hash, news_data in batch:
+            caption = captions.get(title_hash)
+            if caption is None:
+                results[title_hash] = self._generate_fallback_caption(news_data)
+                continue
+            CAPTION_RESULTS.inc("openai")
+            results[title_hash] = caption
+            rows.append((title_hash, style, caption["caption"], json.dumps(caption["hashtags"], ensure_ascii=False),
+                         CAPTION_MODEL, time.time()))
+        
+        if rows:
+            try:
+                await get_database().run_write(self._store_cached, rows)
+            except Exception as e:
+                logger.warning(f"⚠️ 캡션 캐시 저장 실패: {e}")
+        return results
+    
+    async def _request_captions(self, batch: List[tuple], style: str) -> Dict[str, Dict]:
+        """완료 요청 (429/5xx/연결 오류는 지수 백오프 후 재시도)"""
+        items = [
+            {"id": index, "title": news_data["title"], "summary": (news_data.get("summary") or "")[:200]}
+            for index, (_, news_data) in enumerate(batch)
+        ]
+        instruction = CAPTION_STYLES.get(style, CAPTION_STYLES["viral"])
+        messages = [
+            {"role": "system", "content": "당신은 한국어 뉴스 인스타그램 릴스 캡션 작가입니다."},
+            {"role": "user", "content": (
+                f"아래 JSON 배열의 각 뉴스마다 캡션을 작성하세요. {instruction}\n"
+                '응답은 {"captions": [{"id": 번호, "caption": "캡션", "hashtags": ["#태그"]}]} '
+                "형식의 JSON만 출력하세요.\n"
+                + json.dumps(items, ensure_ascii=False)
+            )}
+        ]
+        max_tokens = CAPTION_MAX_TOKENS_PER_ITEM * len(batch)
+        # 한국어는 대략 2자당 1토큰으로 추정
+        estimated_tokens = sum(len(message["content"]) for message in messages) // 2 + max_tokens
+        
+        for attempt in range(CAPTION_MAX_RETRIES + 1):
+            await self.rate_limiter.acquire(estimated_tokens)
+            self.stats["requests"] += 1
+            started = time.perf_counter()
+            try:
+                response = await self.openai_client.chat.completions.create(
+                    model=CAPTION_MODEL,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=0.8
+                )
+                CAPTION_REQUEST_SECONDS.observe("ok", value=time.perf_counter() - started)
+                self.stats["batched_items"] += len(batch)
+                return self._parse_captions(response.choices[0].message.content or "", batch, style)
+            except (openai.RateLimitError, openai.APITimeoutError, openai.APIConnectionError,
+                    openai.InternalServerError) as e:
+                CAPTION_REQUEST_SECONDS.observe("retry", value=time.perf_counter() - started)
+                if attempt == CAPTION_MAX_RETRIES:
+                    raise
+                
+                delay = CAPTION_RETRY_BASE_SECONDS * 2 ** attempt + random.uniform(0, CAPTION_RETRY_BASE_SECONDS)
+                retry_after = getattr(getattr(e, "response", None), "headers", {}).get("retry-after")
+                if retry_after:
+                    try:
+                        delay = max(delay, float(retry_after))
+                    except ValueError:
+                        pass
+                self.stats["retries"] += 1
+                logger.warning(f"🔁 캡션 요청 재시도 {attempt + 1}/{CAPTION_MAX_RETRIES} ({delay:.1f}초 후): {e}")
+                await asyncio.sleep(delay)
+    
+    @staticmethod
+    def _parse_captions(content: str, batch: List[tuple], style: str) -> Dict[str, Dict]:
+        """응답 JSON에서 id별 캡션 추출 (누락/형식 오류 항목은 제외해 폴백 처리)"""
+        try:
+            payload = json.loads(content[content.index("{"):content.rindex("}") + 1])
+        except ValueError:
+            logger.warning("⚠️ 캡션 응답이 JSON 형식이 아닙니다")
+            return {}
+        
+        captions = {}
+        for item in payload.get("captions", []):
+            if not isinstance(item, dict):
+                continue
+            index = item.get("id")
+            caption = item.get("caption")
+            if not isinstance(index, int) or not 0 <= index < len(batch) or not isinstance(caption, str) or not caption.strip():
+                continue
+            hashtags = [tag for tag in item.get("hashtags") or [] if isinstance(tag, str)]
+            captions[batch[index][0]] = {
+                "caption": caption.strip(),
+                "hashtags": hashtags,
+                "style": style,
+                "source": "openai"
+            }
+        return captions
+    
+    @staticmethod
+    def _title_hash(news_data: Dict) -> str:
+        return news_data.get('title_hash') or get_news_scraper()._generate_title_hash(news_data['title'])
+    
+    # ----- 캡션 캐시 (DB - 재시작/다른 워커와 공유) -----
+    def _lookup_cached(self, title_hashes: List[str], style: str) -> Dict[str, Dict]:
+        if not title_hashes:
+            return {}
+        placeholders = ",".join("?" for _ in title_hashes)
+        rows = get_database().fetchall_sync(f"""
+            SELECT title_hash, caption, hashtags FROM caption_cache
+            WHERE style = ? AND title_hash IN ({placeholders})
+        """, (style, *title_hashes))
+        return {
+            row["title_hash"]: {
+                "caption": row["caption"],
+                "hashtags": json.loads(row["hashtags"]) if row["hashtags"] else [],
+                "style": style,
+                "source": "cache"
+            }
+            for row in rows
+        }
+    
+    def _store_cached(self, rows: List[tuple]):
+        with get_database().transaction() as conn:
+            conn.executemany("""
+                INSERT OR REPLACE INTO caption_cache (title_hash, style, caption, hashtags, model, created_epoch)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, rows)
     
     def _generate_fallback_caption(self, news_data: Dict) -> Dict:
         """폴백 캡션 생성"""
         title = news_data['title']
         hooks = ["🚨 긴급 속보!", "😱 이거 실화인가요?", "🔥 지금 화제!", "⚡ 방금 터진 소식!"]
         hook = random.choice(hooks)
+        self.stats["fallbacks"] += 1
+        CAPTION_RESULTS.inc("fallback")
         
         return {
             'caption': f"{hook}\n\n{title}\n\n여러분 생각은? 👇",
-            'style': 'viral'
+            'style': 'viral',
+            'source': 'fallback'
         }
 
 # Instagram 서비스 클래스 (기존과 동일하지만 간소화)
@@ -712,71 +3157,929 @@ class AdvancedInstagramService:
             "message": "Instagram 연결 설정 완료"
         }
 
-# 데이터베이스 초기화 (기존과 동일)
-def init_enhanced_db():
-    """데이터베이스 초기화"""
+# 데이터베이스 연결 설정
+SQLITE_PRAGMAS = [
+    ("journal_mode", "WAL"),
+    ("synchronous", "NORMAL"),
+    ("busy_timeout", "5000"),
+    ("temp_store", "MEMORY"),
+    ("cache_size", "-20000"),
+    ("mmap_size", "134217728"),
+]
+
+def connect_db(db_path: str = DB_PATH, check_same_thread: bool = True) -> sqlite3.Connection:
+    """튜닝된 SQLite 연결 생성"""
+    conn = sqlite3.connect(db_path, timeout=5, check_same_thread=check_same_thread)
+    for name, value in SQLITE_PRAGMAS:
+        conn.execute(f"PRAGMA {name}={value}")
+    return conn
+
+# 공용 DB 접근 계층 (연결 풀 + 이벤트 루프 밖 실행)
+class Database:
+    def __init__(self, db_path: str = DB_PATH, pool_size: int = DB_POOL_SIZE):
+        self.db_path = db_path
+        self.pool_size = pool_size
+        self._readers: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._reader_count = 0
+        self._pool_lock = threading.Lock()
+        self._writer: Optional[sqlite3.Connection] = None
+        self._writer_lock = threading.RLock()
+        self._version_conn: Optional[sqlite3.Connection] = None
+        self._version_lock = threading.Lock()
+        # 읽기는 풀 크기만큼 병렬, 쓰기는 단일 스레드에서 직렬화
+        self._read_executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="db-read")
+        self._write_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-write")
+    
+    def _connect(self) -> sqlite3.Connection:
+        conn = connect_db(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        # 트랜잭션은 BEGIN/COMMIT으로 직접 관리
+        conn.isolation_level = None
+        return conn
+    
+    @contextmanager
+    def connection(self):
+        """읽기 연결 대여"""
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            with self._pool_lock:
+                create = self._reader_count < self.pool_size
+                if create:
+                    self._reader_count += 1
+            conn = self._connect() if create else self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+    
+    @contextmanager
+    def writer(self):
+        """쓰기 연결 대여 (트랜잭션은 호출자가 관리)"""
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = self._connect()
+            yield self._writer
+    
+    @contextmanager
+    def transaction(self):
+        """쓰기 연결로 IMMEDIATE 트랜잭션 실행"""
+        with self.writer() as conn:
+            self._begin_immediate(conn)
+            try:
+                yield conn
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+    
+    def _begin_immediate(self, conn: sqlite3.Connection):
+        """쓰기 잠금 획득 - 다른 워커 프로세스와 경합해 busy_timeout을 넘기면 백오프 후 재시도"""
+        for attempt in range(DB_LOCK_RETRIES + 1):
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                return
+            except sqlite3.OperationalError as e:
+                if "locked" not in str(e) and "busy" not in str(e) or attempt == DB_LOCK_RETRIES:
+                    raise
+                logger.warning(f"⚠️ DB 쓰기 잠금 대기 재시도 ({attempt + 1}/{DB_LOCK_RETRIES})")
+                time.sleep(0.05 * 2 ** attempt + random.uniform(0, 0.05))
+    
+    def data_version(self) -> int:
+        """PRAGMA data_version - 다른 연결(다른 워커 포함)이 커밋하면 값이 바뀜"""
+        # 값은 연결마다 독립적이므로 전용 연결 하나로만 비교
+        with self._version_lock:
+            if self._version_conn is None:
+                self._version_conn = self._connect()
+            return self._version_conn.execute("PRAGMA data_version").fetchone()[0]
+    
+    # ----- 동기 API (스레드/시작 단계용) -----
+    def fetchall_sync(self, sql: str, params: tuple = ()) -> List[sqlite3.Row]:
+        with self.connection() as conn:
+            return conn.execute(sql, params).fetchall()
+    
+    def fetchone_sync(self, sql: str, params: tuple = ()) -> Optional[sqlite3.Row]:
+        with self.connection() as conn:
+            return conn.execute(sql, params).fetchone()
+    
+    def execute_sync(self, sql: str, params: tuple = ()) -> int:
+        """쓰기 쿼리 실행 후 lastrowid 반환"""
+        with self.transaction() as conn:
+            return conn.execute(sql, params).lastrowid
+    
+    def insert_many_sync(self, sql: str, rows: List[tuple]) -> List[int]:
+        """executemany 일괄 삽입 후 새 id 목록 반환"""
+        if not rows:
+            return []
+        with self.transaction() as conn:
+            # rowcount(sqlite3_changes)는 트리거가 만든 변경(FTS 색인 등)을 제외
+            inserted = conn.executemany(sql, rows).rowcount
+            last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+        
+        if inserted != len(rows):
+            raise sqlite3.IntegrityError(f"일괄 삽입 행 수 불일치: {inserted}/{len(rows)}")
+        # 쓰기 잠금을 쥔 단일 트랜잭션 안의 AUTOINCREMENT id는 연속
+        return list(range(last_id - len(rows) + 1, last_id + 1))
+    
+    # ----- 비동기 API (이벤트 루프에서 사용) -----
+    async def run_read(self, func, *args):
+        """읽기 스레드에서 함수 실행"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._read_executor, lambda: func(*args))
+    
+    async def run_write(self, func, *args):
+        """쓰기 스레드에서 함수 실행"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._write_executor, lambda: func(*args))
+    
+    async def fetchall(self, sql: str, params: tuple = ()) -> List[sqlite3.Row]:
+        return await self.run_read(self.fetchall_sync, sql, params)
+    
+    async def fetchone(self, sql: str, params: tuple = ()) -> Optional[sqlite3.Row]:
+        return await self.run_read(self.fetchone_sync, sql, params)
+    
+    async def execute(self, sql: str, params: tuple = ()) -> int:
+        return await self.run_write(self.execute_sync, sql, params)
+    
+    async def insert_many(self, sql: str, rows: List[tuple]) -> List[int]:
+        return await self.run_write(self.insert_many_sync, sql, rows)
+    
+    def close(self):
+        """모든 연결 종료"""
+        self._read_executor.shutdown(wait=True)
+        self._write_executor.shutdown(wait=True)
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+        with self._writer_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+        with self._version_lock:
+            if self._version_conn is not None:
+                self._version_conn.close()
+                self._version_conn = None
+
+def _to_epoch(iso_time: Optional[str]) -> Optional[float]:
+    """ISO 시각 문자열을 epoch 초로 변환"""
+    try:
+        return datetime.fromisoformat(iso_time).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+# 스키마 마이그레이션 (PRAGMA user_version으로 버전 관리)
+def _migration_base_tables(cursor):
+    # 뉴스 테이블
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS news_articles (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            title_hash TEXT,
+            link TEXT,
+            summary TEXT,
+            content TEXT,
+            source TEXT,
+            category TEXT,
+            keywords TEXT,
+            viral_score REAL,
+            scraped_at TEXT,
+            published_at TEXT,
+            is_processed BOOLEAN DEFAULT FALSE,
+            view_count INTEGER DEFAULT 0
+        )
+    """)
+    
+    # 릴스 테이블
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS news_reels (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            news_id INTEGER,
+            video_path TEXT,
+            audio_path TEXT,
+            script TEXT,
+            style TEXT,
+            duration INTEGER,
+            file_size_mb REAL,
+            created_at TEXT,
+            status TEXT DEFAULT 'created',
+            view_count INTEGER DEFAULT 0,
+            like_count INTEGER DEFAULT 0,
+            FOREIGN KEY (news_id) REFERENCES news_articles (id)
+        )
+    """)
+
+def _migration_scraped_epoch(cursor):
+    cursor.execute("ALTER TABLE news_articles ADD COLUMN scraped_epoch REAL")
+    
+    # 기존 ISO 문자열을 epoch으로 백필
+    cursor.execute("SELECT id, scraped_at FROM news_articles")
+    while True:
+        rows = cursor.fetchmany(5000)
+        if not rows:
+            break
+        cursor.connection.executemany(
+            "UPDATE news_articles SET scraped_epoch = ? WHERE id = ?",
+            [(_to_epoch(scraped_at), article_id) for article_id, scraped_at in rows]
+        )
+    
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_articles_dedup
+        ON news_articles (category, title_hash, scraped_epoch)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_articles_scraped_epoch
+        ON news_articles (scraped_epoch)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_articles_category_viral
+        ON news_articles (category, viral_score)
+    """)
+
+def _migration_reels_news_index(cursor):
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_reels_news_id ON news_reels (news_id)")
+
+def _migration_reel_jobs(cursor):
+    for column in ("frames_written INTEGER DEFAULT 0", "total_frames INTEGER", "created_epoch REAL",
+                   "started_epoch REAL", "finished_epoch REAL", "error TEXT"):
+        cursor.execute(f"ALTER TABLE news_reels ADD COLUMN {column}")
+    
+    cursor.execute("SELECT id, created_at FROM news_reels")
+    rows = cursor.fetchall()
+    cursor.connection.executemany(
+        "UPDATE news_reels SET created_epoch = ? WHERE id = ?",
+        [(_to_epoch(created_at), reel_id) for reel_id, created_at in rows]
+    )
+
+def _migration_render_queue(cursor):
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS render_jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            reel_id INTEGER NOT NULL,
+            news_id INTEGER NOT NULL,
+            style TEXT NOT NULL,
+            duration INTEGER NOT NULL,
+            priority REAL NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            lease_owner TEXT,
+            lease_expires_epoch REAL,
+            last_error TEXT,
+            created_epoch REAL NOT NULL,
+            updated_epoch REAL,
+            FOREIGN KEY (reel_id) REFERENCES news_reels (id),
+            FOREIGN KEY (news_id) REFERENCES news_articles (id)
+        )
+    """)
+    # 같은 뉴스/스타일/길이의 진행 중 작업은 하나만 허용
+    cursor.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_render_jobs_active
+        ON render_jobs (news_id, style, duration) WHERE status IN ('pending', 'leased')
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_render_jobs_pending ON render_jobs (status, priority DESC, id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_render_jobs_lease ON render_jobs (status, lease_expires_epoch)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_render_jobs_reel ON render_jobs (reel_id)")
+
+def _migration_render_cache(cursor):
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS render_cache (
+            cache_key TEXT PRIMARY KEY,
+            status TEXT NOT NULL,
+            video_path TEXT,
+            file_size_mb REAL,
+            reel_id INTEGER,
+            owner TEXT,
+            claimed_epoch REAL,
+            created_epoch REAL,
+            hit_count INTEGER NOT NULL DEFAULT 0,
+            last_hit_epoch REAL
+        )
+    """)
+
+def _migration_leader_lease(cursor):
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS leader_lease (
+            name TEXT PRIMARY KEY,
+            owner TEXT NOT NULL,
+            acquired_epoch REAL NOT NULL,
+            expires_epoch REAL NOT NULL
+        )
+    """)
+
+def _migration_read_api_indexes(cursor):
+    # 인덱스에 rowid(id)가 포함되므로 (viral_score, id) / (status, id) 키셋 정렬을 그대로 사용
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_articles_viral ON news_articles (viral_score)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_reels_status ON news_reels (status)")
+
+def _fts5_trigram_available(cursor) -> bool:
+    """FTS5 + trigram 토크나이저(SQLite 3.34+) 지원 여부"""
     try:
-        conn = sqlite3.connect("news_automation.db")
-        cursor = conn.cursor()
-        
-        # 뉴스 테이블
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS news_articles (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                title_hash TEXT,
-                link TEXT,
-                summary TEXT,
-                content TEXT,
-                source TEXT,
-                category TEXT,
-                keywords TEXT,
-                viral_score REAL,
-                scraped_at TEXT,
-                published_at TEXT,
-                is_processed BOOLEAN DEFAULT FALSE,
-                view_count INTEGER DEFAULT 0
+        cursor.execute("CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(x, tokenize='trigram')")
+        cursor.execute("DROP TABLE temp.fts5_probe")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+def _migration_articles_fts(cursor):
+    if not _fts5_trigram_available(cursor):
+        # 버전은 올라가므로 SQLite 업그레이드 후에는 시작 시 ensure_articles_fts가 생성
+        logger.warning(f"⚠️ SQLite {sqlite3.sqlite_version}에 FTS5 trigram 없음 - 뉴스 검색은 LIKE로 동작")
+        return
+    _create_articles_fts(cursor)
+
+def _create_articles_fts(cursor):
+    # 한국어는 공백 단위 토큰화가 맞지 않으므로 3글자 단위(trigram) 인덱스 - 부분 문자열 검색 가능
+    cursor.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS news_articles_fts USING fts5(
+            title, summary, content='news_articles', content_rowid='id', tokenize='trigram'
+        )
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS news_articles_fts_insert AFTER INSERT ON news_articles BEGIN
+            INSERT INTO news_articles_fts (rowid, title, summary) VALUES (new.id, new.title, new.summary);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS news_articles_fts_delete AFTER DELETE ON news_articles BEGIN
+            INSERT INTO news_articles_fts (news_articles_fts, rowid, title, summary)
+            VALUES ('delete', old.id, old.title, old.summary);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS news_articles_fts_update AFTER UPDATE OF title, summary ON news_articles BEGIN
+            INSERT INTO news_articles_fts (news_articles_fts, rowid, title, summary)
+            VALUES ('delete', old.id, old.title, old.summary);
+            INSERT INTO news_articles_fts (rowid, title, summary) VALUES (new.id, new.title, new.summary);
+        END
+    """)
+    # 기존 기사 백필
+    cursor.execute("INSERT INTO news_articles_fts (news_articles_fts) VALUES ('rebuild')")
+
+# 분석 롤업 (카테고리 x 시간/일 단위, 트리거로 증분 갱신, 버킷은 UTC 기준 epoch)
+ANALYTICS_ROLLUPS = {
+    "hourly": ("analytics_hourly", 3600),
+    "daily": ("analytics_daily", 86400)
+}
+
+def _rollup_upsert(table: str, bucket_seconds: int, epoch: str, category: str, values: Dict[str, str],
+                   condition: str) -> str:
+    """롤업 행에 값을 더하는 UPSERT (트리거 본문용)"""
+    columns = ", ".join(values)
+    selected = ", ".join(values.values())
+    updates = ", ".join(
+        # MAX(a, b)는 인자 중 NULL이 있으면 NULL이므로 있는 값으로 대체
+        f"{column} = COALESCE(MAX({column}, excluded.{column}), {column}, excluded.{column})"
+        if column.endswith("_max") else f"{column} = {column} + excluded.{column}"
+        for column in values
+    )
+    return f"""
+        INSERT INTO {table} (bucket_epoch, category, {columns})
+        SELECT CAST({epoch} / {bucket_seconds} AS INTEGER) * {bucket_seconds}, COALESCE({category}, 'unknown'), {selected}
+        WHERE {epoch} IS NOT NULL AND {condition}
+        ON CONFLICT (bucket_epoch, category) DO UPDATE SET {updates};
+    """
+
+def _rollup_subtract(table: str, bucket_seconds: int, epoch: str, category: str, values: Dict[str, str],
+                     condition: str, max_source: Optional[str] = None) -> str:
+    """롤업 행에서 값을 빼는 UPDATE (최대값은 빠지는 행이 최대였을 때만 원본에서 다시 계산)"""
+    bucket = f"CAST({epoch} / {bucket_seconds} AS INTEGER) * {bucket_seconds}"
+    where = f"bucket_epoch = {bucket} AND category = COALESCE({category}, 'unknown')"
+    updates = ", ".join(f"{column} = {column} - {value}" for column, value in values.items() if not column.endswith("_max"))
+    statements = f"UPDATE {table} SET {updates} WHERE {where} AND {epoch} IS NOT NULL AND {condition};"
+    if max_source:
+        statements += f"""
+            UPDATE {table} SET viral_score_max = (
+                SELECT MAX(viral_score) FROM news_articles
+                WHERE COALESCE(category, 'unknown') = {table}.category
+                  AND scraped_epoch >= {table}.bucket_epoch AND scraped_epoch < {table}.bucket_epoch + {bucket_seconds}
             )
+            WHERE {where} AND {epoch} IS NOT NULL AND {max_source} >= viral_score_max;
+        """
+    return statements
+
+def _article_rollup_values(row: str) -> Dict[str, str]:
+    return {
+        "article_count": "1",
+        "viral_score_sum": f"COALESCE({row}.viral_score, 0)",
+        "viral_score_max": f"{row}.viral_score",
+        "article_views": f"COALESCE({row}.view_count, 0)"
+    }
+
+def _reel_rollup_values(row: str) -> Dict[str, str]:
+    return {
+        "reels_created": "1",
+        "reel_size_mb": f"COALESCE({row}.file_size_mb, 0)",
+        "reel_views": f"COALESCE({row}.view_count, 0)",
+        "reel_likes": f"COALESCE({row}.like_count, 0)"
+    }
+
+def _rollup_move_reels(table: str, bucket_seconds: int, from_category: str, to_category: str) -> str:
+    """기사의 카테고리가 바뀌거나 삭제되면 그 기사의 완료된 릴스 집계를 옮김"""
+    bucket = f"CAST(created_epoch / {bucket_seconds} AS INTEGER) * {bucket_seconds}"
+    reels = f"""
+        SELECT {bucket} AS bucket_epoch, COUNT(*) AS reels_created, SUM(COALESCE(file_size_mb, 0)) AS reel_size_mb,
+               SUM(COALESCE(view_count, 0)) AS reel_views, SUM(COALESCE(like_count, 0)) AS reel_likes
+        FROM news_reels
+        WHERE news_id = old.id AND status = 'created' AND created_epoch IS NOT NULL
+        GROUP BY 1
+    """
+    return f"""
+        UPDATE {table} SET
+            reels_created = {table}.reels_created - moved.reels_created,
+            reel_size_mb = {table}.reel_size_mb - moved.reel_size_mb,
+            reel_views = {table}.reel_views - moved.reel_views,
+            reel_likes = {table}.reel_likes - moved.reel_likes
+        FROM ({reels}) AS moved
+        WHERE {table}.bucket_epoch = moved.bucket_epoch AND {table}.category = COALESCE({from_category}, 'unknown');
+        INSERT INTO {table} (bucket_epoch, category, reels_created, reel_size_mb, reel_views, reel_likes)
+        SELECT bucket_epoch, COALESCE({to_category}, 'unknown'), reels_created, reel_size_mb, reel_views, reel_likes
+        FROM ({reels}) WHERE 1
+        ON CONFLICT (bucket_epoch, category) DO UPDATE SET
+            reels_created = reels_created + excluded.reels_created,
+            reel_size_mb = reel_size_mb + excluded.reel_size_mb,
+            reel_views = reel_views + excluded.reel_views,
+            reel_likes = reel_likes + excluded.reel_likes;
+    """
+
+def _create_rollup_triggers(cursor, table: str, bucket_seconds: int):
+    # 기사: scraped_epoch 버킷 / 릴스: 완료('created')된 릴스만 created_epoch 버킷, 카테고리는 원본 기사 기준
+    def reel_category(row):
+        return f"(SELECT category FROM news_articles WHERE id = {row}.news_id)"
+    
+    article_add = _rollup_upsert(table, bucket_seconds, "new.scraped_epoch", "new.category",
+                                 _article_rollup_values("new"), "1")
+    article_remove = _rollup_subtract(table, bucket_seconds, "old.scraped_epoch", "old.category",
+                                      _article_rollup_values("old"), "1", max_source="old.viral_score")
+    reel_add = _rollup_upsert(table, bucket_seconds, "new.created_epoch", reel_category("new"),
+                              _reel_rollup_values("new"), "new.status = 'created'")
+    reel_remove = _rollup_subtract(table, bucket_seconds, "old.created_epoch", reel_category("old"),
+                                   _reel_rollup_values("old"), "old.status = 'created'")
+    
+    triggers = {
+        f"{table}_article_insert": f"AFTER INSERT ON news_articles BEGIN {article_add} END",
+        f"{table}_article_delete": f"AFTER DELETE ON news_articles BEGIN {article_remove} END",
+        f"{table}_article_update": (
+            "AFTER UPDATE OF category, viral_score, view_count, scraped_epoch ON news_articles "
+            f"BEGIN {article_remove} {article_add} END"
+        ),
+        f"{table}_article_recategorize": (
+            "AFTER UPDATE OF category ON news_articles WHEN old.category IS NOT new.category "
+            f"BEGIN {_rollup_move_reels(table, bucket_seconds, 'old.category', 'new.category')} END"
+        ),
+        # 원본 기사가 없는 릴스는 'unknown'으로 집계
+        f"{table}_article_reels_orphan": (
+            "AFTER DELETE ON news_articles "
+            f"BEGIN {_rollup_move_reels(table, bucket_seconds, 'old.category', 'NULL')} END"
+        ),
+        f"{table}_reel_insert": f"AFTER INSERT ON news_reels BEGIN {reel_add} END",
+        f"{table}_reel_delete": f"AFTER DELETE ON news_reels BEGIN {reel_remove} END",
+        # 진행률(frames_written) 등 잦은 갱신에는 실행되지 않도록 집계 컬럼만 지정
+        f"{table}_reel_update": (
+            "AFTER UPDATE OF status, news_id, file_size_mb, view_count, like_count, created_epoch ON news_reels "
+            f"BEGIN {reel_remove} {reel_add} END"
+        )
+    }
+    for trigger_name, body in triggers.items():
+        cursor.execute(f"CREATE TRIGGER IF NOT EXISTS {trigger_name} {body}")
+
+def rebuild_analytics_rollups(cursor) -> Dict[str, int]:
+    """원본 테이블에서 롤업 전체 재계산 (호출자가 트랜잭션 관리)"""
+    counts = {}
+    for name, (table, bucket_seconds) in ANALYTICS_ROLLUPS.items():
+        cursor.execute(f"DELETE FROM {table}")
+        cursor.execute(f"""
+            INSERT INTO {table} (bucket_epoch, category, article_count, viral_score_sum, viral_score_max, article_views)
+            SELECT CAST(scraped_epoch / {bucket_seconds} AS INTEGER) * {bucket_seconds}, COALESCE(category, 'unknown'),
+                   COUNT(*), SUM(COALESCE(viral_score, 0)), MAX(viral_score), SUM(COALESCE(view_count, 0))
+            FROM news_articles
+            WHERE scraped_epoch IS NOT NULL
+            GROUP BY 1, 2
         """)
-        
-        # 릴스 테이블
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS news_reels (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                news_id INTEGER,
-                video_path TEXT,
-                audio_path TEXT,
-                script TEXT,
-                style TEXT,
-                duration INTEGER,
-                file_size_mb REAL,
-                created_at TEXT,
-                status TEXT DEFAULT 'created',
-                view_count INTEGER DEFAULT 0,
-                like_count INTEGER DEFAULT 0,
-                FOREIGN KEY (news_id) REFERENCES news_articles (id)
-            )
+        cursor.execute(f"""
+            INSERT INTO {table} (bucket_epoch, category, reels_created, reel_size_mb, reel_views, reel_likes)
+            SELECT CAST(r.created_epoch / {bucket_seconds} AS INTEGER) * {bucket_seconds}, COALESCE(a.category, 'unknown'),
+                   COUNT(*), SUM(COALESCE(r.file_size_mb, 0)), SUM(COALESCE(r.view_count, 0)), SUM(COALESCE(r.like_count, 0))
+            FROM news_reels r
+            LEFT JOIN news_articles a ON a.id = r.news_id
+            WHERE r.status = 'created' AND r.created_epoch IS NOT NULL
+            GROUP BY 1, 2
+            ON CONFLICT (bucket_epoch, category) DO UPDATE SET
+                reels_created = excluded.reels_created, reel_size_mb = excluded.reel_size_mb,
+                reel_views = excluded.reel_views, reel_likes = excluded.reel_likes
+        """)
+        counts[name] = cursor.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    return counts
+
+def _migration_analytics_rollups(cursor):
+    for table, bucket_seconds in ANALYTICS_ROLLUPS.values():
+        cursor.execute(f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                bucket_epoch INTEGER NOT NULL,
+                category TEXT NOT NULL,
+                article_count INTEGER NOT NULL DEFAULT 0,
+                viral_score_sum REAL NOT NULL DEFAULT 0,
+                viral_score_max REAL,
+                article_views INTEGER NOT NULL DEFAULT 0,
+                reels_created INTEGER NOT NULL DEFAULT 0,
+                reel_size_mb REAL NOT NULL DEFAULT 0,
+                reel_views INTEGER NOT NULL DEFAULT 0,
+                reel_likes INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (bucket_epoch, category)
+            ) WITHOUT ROWID
         """)
+        _create_rollup_triggers(cursor, table, bucket_seconds)
+    # 기존 데이터 백필
+    rebuild_analytics_rollups(cursor)
+
+def _migration_caption_cache(cursor):
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS caption_cache (
+            title_hash TEXT NOT NULL,
+            style TEXT NOT NULL,
+            caption TEXT NOT NULL,
+            hashtags TEXT,
+            model TEXT,
+            created_epoch REAL NOT NULL,
+            PRIMARY KEY (title_hash, style)
+        ) WITHOUT ROWID
+    """)
+
+def _migration_content_version(cursor):
+    # 조회 API 응답 캐시 무효화용 변경 카운터 - 임대 갱신/하트비트/캡션 캐시 등 다른 쓰기에는 바뀌지 않음
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value INTEGER NOT NULL
+        ) WITHOUT ROWID
+    """)
+    cursor.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('content_version', 0)")
+    
+    bump = "UPDATE meta SET value = value + 1 WHERE key = 'content_version';"
+    # 릴스는 완료('created') 상태가 관련된 변경만 반영 (진행률/대기열 상태 갱신 제외)
+    reel_visible = "old.status = 'created' OR new.status = 'created'"
+    triggers = {
+        "content_version_article_insert": f"AFTER INSERT ON news_articles BEGIN {bump} END",
+        "content_version_article_update": f"AFTER UPDATE ON news_articles BEGIN {bump} END",
+        "content_version_article_delete": f"AFTER DELETE ON news_articles BEGIN {bump} END",
+        "content_version_reel_insert": f"AFTER INSERT ON news_reels WHEN new.status = 'created' BEGIN {bump} END",
+        "content_version_reel_update": f"AFTER UPDATE ON news_reels WHEN {reel_visible} BEGIN {bump} END",
+        "content_version_reel_delete": f"AFTER DELETE ON news_reels WHEN old.status = 'created' BEGIN {bump} END"
+    }
+    for trigger_name, body in triggers.items():
+        cursor.execute(f"CREATE TRIGGER IF NOT EXISTS {trigger_name} {body}")
+
+SCHEMA_MIGRATIONS = [
+    (1, "기본 테이블 생성", _migration_base_tables),
+    (2, "scraped_epoch 컬럼 및 뉴스 인덱스", _migration_scraped_epoch),
+    (3, "릴스 news_id 인덱스", _migration_reels_news_index),
+    (4, "릴스 작업 진행률 컬럼", _migration_reel_jobs),
+    (5, "영속 렌더링 작업 큐", _migration_render_queue),
+    (6, "렌더 결과 캐시", _migration_render_cache),
+    (7, "백그라운드 작업 리더 임대", _migration_leader_lease),
+    (8, "조회 API 키셋 인덱스", _migration_read_api_indexes),
+    (9, "뉴스 전문 검색 (FTS5 trigram)", _migration_articles_fts),
+    (10, "분석 롤업 테이블", _migration_analytics_rollups),
+    (11, "캡션 캐시", _migration_caption_cache),
+    (12, "조회 API 변경 카운터", _migration_content_version),
+]
+
+def migrate_db(conn: sqlite3.Connection) -> int:
+    """미적용 마이그레이션 순차 실행"""
+    previous_isolation = conn.isolation_level
+    conn.isolation_level = None
+    try:
+        for version, description, migration in SCHEMA_MIGRATIONS:
+            if conn.execute("PRAGMA user_version").fetchone()[0] >= version:
+                continue
+
+            # 다른 프로세스와 동시에 실행되지 않도록 쓰기 잠금 후 버전 재확인
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                current = conn.execute("PRAGMA user_version").fetchone()[0]
+                if current >= version:
+                    conn.execute("COMMIT")
+                    continue
+                
+                migration(conn.cursor())
+                conn.execute(f"PRAGMA user_version = {version}")
+                conn.execute("COMMIT")
+                logger.info(f"🗄️ 마이그레이션 v{version} 적용: {description}")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
         
-        conn.commit()
-        conn.close()
-        logger.info("✅ 데이터베이스 초기화 완료")
+        return conn.execute("PRAGMA user_version").fetchone()[0]
+    finally:
+        conn.isolation_level = previous_isolation
+
+def ensure_articles_fts(conn: sqlite3.Connection) -> bool:
+    """뉴스 검색 인덱스가 없고 지금 SQLite가 trigram을 지원하면 생성 (v9 적용 후 SQLite 업그레이드 대비)"""
+    exists_sql = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'news_articles_fts'"
+    if conn.execute(exists_sql).fetchone() is not None:
+        return True
+    if not _fts5_trigram_available(conn.cursor()):
+        return False
+    
+    previous_isolation = conn.isolation_level
+    conn.isolation_level = None
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # 다른 프로세스가 먼저 만들었으면 건너뜀
+            if conn.execute(exists_sql).fetchone() is None:
+                _create_articles_fts(conn.cursor())
+                logger.info("🔎 뉴스 검색 인덱스 생성 (FTS5 trigram)")
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return True
+    finally:
+        conn.isolation_level = previous_isolation
+
+# 데이터베이스 초기화
+def init_enhanced_db():
+    """데이터베이스 초기화 및 마이그레이션"""
+    try:
+        with get_database().writer() as conn:
+            version = migrate_db(conn)
+            ensure_articles_fts(conn)
+        logger.info(f"✅ 데이터베이스 초기화 완료 (스키마 v{version})")
         return True
     except Exception as e:
         logger.error(f"❌ DB 초기화 오류: {e}")
         return False
 
+async def save_news_articles(news_list: List[Dict]) -> List[Dict]:
+    """수집된 뉴스 DB 일괄 저장"""
+    saved_news = []
+    try:
+        rows = []
+        for news in news_list:
+            rows.append((
+                news['title'],
+                news['title_hash'],
+                news['link'],
+                news['summary'],
+                news['source'],
+                news['category'],
+                json.dumps(news['keywords']),
+                news['viral_score'],
+                news['scraped_at'],
+                _to_epoch(news['scraped_at']) or time.time()
+            ))
+        
+        with DB_INSERT_SECONDS.time():
+            news_ids = await get_database().insert_many("""
+                INSERT INTO news_articles 
+                (title, title_hash, link, summary, source, category, keywords, viral_score, scraped_at, scraped_epoch)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+        DB_INSERTED_ROWS.inc(amount=len(news_ids))
+        if news_ids:
+            get_response_cache().invalidate("news")
+        
+        dedup_index = get_dedup_index()
+        for news, news_id, row in zip(news_list, news_ids, rows):
+            news['id'] = news_id
+            news['scraped_epoch'] = row[-1]
+            saved_news.append(news)
+            dedup_index.add(news['category'], news['title_hash'], row[-1], title=news['title'])
+        
+    except Exception as db_error:
+        logger.error(f"❌ DB 저장 오류: {db_error}")
+    
+    return saved_news
+
+def read_content_version() -> int:
+    """기사/릴스 변경 카운터 (meta 테이블, 트리거로 증가)"""
+    row = get_database().fetchone_sync("SELECT value FROM meta WHERE key = 'content_version'")
+    return row[0] if row is not None else 0
+
+# 조회 API 쿼리 (키셋 페이지네이션 - OFFSET 없이 마지막 행 기준으로 다음 페이지 조회)
+def query_trending_news(category: Optional[str], limit: int, after: Optional[tuple] = None) -> Dict:
+    """viral_score 내림차순 뉴스 (after: 이전 페이지 마지막 (viral_score, id))"""
+    conditions = ["viral_score IS NOT NULL"]
+    params = []
+    if category:
+        conditions.append("category = ?")
+        params.append(category)
+    if after is not None:
+        conditions.append("(viral_score, id) < (?, ?)")
+        params.extend(after)
+    
+    rows = get_database().fetchall_sync(f"""
+        SELECT id, title, link, summary, source, category, keywords, viral_score, scraped_at, view_count
+        FROM news_articles
+        WHERE {" AND ".join(conditions)}
+        ORDER BY viral_score DESC, id DESC
+        LIMIT ?
+    """, (*params, limit + 1))
+    
+    news = []
+    for row in rows[:limit]:
+        item = dict(row)
+        item["keywords"] = json.loads(item["keywords"]) if item["keywords"] else []
+        news.append(item)
+    
+    next_cursor = None
+    if len(rows) > limit:
+        last = news[-1]
+        next_cursor = f"{last['viral_score']!r}:{last['id']}"
+    return {"news": news, "next_cursor": next_cursor}
+
+def query_recent_reels(category: Optional[str], limit: int, before_id: Optional[int] = None) -> Dict:
+    """완료된 릴스 최신순 (before_id: 이전 페이지 마지막 릴스 id)"""
+    conditions = ["r.status = 'created'"]
+    params = []
+    if category:
+        conditions.append("a.category = ?")
+        params.append(category)
+    if before_id is not None:
+        conditions.append("r.id < ?")
+        params.append(before_id)
+    
+    rows = get_database().fetchall_sync(f"""
+        SELECT r.id, r.news_id, r.style, r.duration, r.video_path, r.file_size_mb, r.created_at,
+               r.view_count, r.like_count, a.title, a.category, a.viral_score
+        FROM news_reels r
+        LEFT JOIN news_articles a ON a.id = r.news_id
+        WHERE {" AND ".join(conditions)}
+        ORDER BY r.id DESC
+        LIMIT ?
+    """, (*params, limit + 1))
+    
+    reels = []
+    for row in rows[:limit]:
+        item = dict(row)
+        item["video_url"] = f"/generated_videos/{os.path.basename(item['video_path'])}" if item["video_path"] else None
+        reels.append(item)
+    
+    next_cursor = str(reels[-1]["id"]) if len(rows) > limit else None
+    return {"reels": reels, "next_cursor": next_cursor}
+
+# trigram은 3글자 미만 검색어를 색인으로 찾을 수 없어 LIKE로 보완
+FTS_MIN_TERM_LENGTH = 3
+
+def _like_pattern(term: str) -> str:
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+def search_news(query: str, category: Optional[str] = None, since_epoch: Optional[float] = None,
+                until_epoch: Optional[float] = None, limit: int = READ_API_DEFAULT_LIMIT) -> Dict:
+    """제목/요약 전문 검색 (FTS5 bm25 순위, 3글자 미만 검색어만 있으면 LIKE + 최신순)"""
+    database = get_database()
+    terms = query.split()
+    fts_terms = [term for term in terms if len(term) >= FTS_MIN_TERM_LENGTH]
+    like_terms = [term for term in terms if len(term) < FTS_MIN_TERM_LENGTH]
+    use_fts = bool(fts_terms) and database.fetchone_sync(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'news_articles_fts'"
+    ) is not None
+    if not use_fts:
+        like_terms = terms
+    
+    conditions = []
+    params = []
+    for term in like_terms:
+        conditions.append("(a.title LIKE ? ESCAPE '\\' OR a.summary LIKE ? ESCAPE '\\')")
+        params.extend([_like_pattern(term)] * 2)
+    if category:
+        conditions.append("a.category = ?")
+        params.append(category)
+    if since_epoch is not None:
+        conditions.append("a.scraped_epoch >= ?")
+        params.append(since_epoch)
+    if until_epoch is not None:
+        conditions.append("a.scraped_epoch < ?")
+        params.append(until_epoch)
+    
+    columns = "a.id, a.title, a.link, a.summary, a.source, a.category, a.viral_score, a.scraped_at"
+    if use_fts and since_epoch is not None:
+        # 기간 내 최소 id로 FTS 조회 범위를 좁힘 (id가 저장 순서라 최근 기간일수록 적은 색인만 읽음)
+        # +id: MIN 최적화가 rowid 전체 스캔을 고르지 않고 scraped_epoch 인덱스를 쓰도록 함
+        min_id = database.fetchone_sync(
+            "SELECT MIN(+id) FROM news_articles WHERE scraped_epoch >= ?", (since_epoch,)
+        )[0]
+        if min_id is None:
+            return {"mode": "fts", "news": []}
+        conditions.append("news_articles_fts.rowid >= ?")
+        params.append(min_id)
+    
+    if use_fts:
+        # 각 검색어를 구문으로 감싸 FTS 연산자로 해석되지 않게 함 (모든 검색어 포함 = AND)
+        match = " ".join('"' + term.replace('"', '""') + '"' for term in fts_terms)
+        where = " AND ".join(["news_articles_fts MATCH ?"] + conditions)
+        rows = database.fetchall_sync(f"""
+            SELECT {columns}, -bm25(news_articles_fts, 2.0, 1.0) AS score
+            FROM news_articles_fts
+            JOIN news_articles a ON a.id = news_articles_fts.rowid
+            WHERE {where}
+            ORDER BY bm25(news_articles_fts, 2.0, 1.0)
+            LIMIT ?
+        """, (match, *params, limit))
+    else:
+        rows = database.fetchall_sync(f"""
+            SELECT {columns}, NULL AS score
+            FROM news_articles a
+            WHERE {" AND ".join(conditions) or "1"}
+            ORDER BY a.scraped_epoch DESC
+            LIMIT ?
+        """, (*params, limit))
+    
+    results = []
+    for row in rows:
+        item = dict(row)
+        if item["score"] is not None:
+            item["score"] = round(item["score"], 4)
+        results.append(item)
+    return {"mode": "fts" if use_fts else "like", "news": results}
+
+def query_analytics(granularity: str, since_epoch: int, category: Optional[str] = None) -> Dict:
+    """롤업 테이블만 읽어 카테고리별 합계와 구간별 추이 계산"""
+    table, _ = ANALYTICS_ROLLUPS[granularity]
+    conditions = ["bucket_epoch >= ?"]
+    params = [since_epoch]
+    if category:
+        conditions.append("category = ?")
+        params.append(category)
+    
+    rows = get_database().fetchall_sync(f"""
+        SELECT * FROM {table}
+        WHERE {" AND ".join(conditions)}
+        ORDER BY bucket_epoch, category
+    """, tuple(params))
+    
+    def summarize(items) -> Dict:
+        article_count = sum(item["article_count"] for item in items)
+        max_scores = [item["viral_score_max"] for item in items if item["viral_score_max"] is not None]
+        return {
+            "articles": article_count,
+            "viral_score_avg": round(sum(item["viral_score_sum"] for item in items) / article_count, 2) if article_count else None,
+            "viral_score_max": max(max_scores) if max_scores else None,
+            "article_views": sum(item["article_views"] for item in items),
+            "reels_created": sum(item["reels_created"] for item in items),
+            "reel_size_mb": round(sum(item["reel_size_mb"] for item in items), 2),
+            "reel_views": sum(item["reel_views"] for item in items),
+            "reel_likes": sum(item["reel_likes"] for item in items)
+        }
+    
+    by_category: Dict[str, List] = {}
+    by_bucket: Dict[int, List] = {}
+    for row in rows:
+        by_category.setdefault(row["category"], []).append(row)
+        by_bucket.setdefault(row["bucket_epoch"], []).append(row)
+    
+    return {
+        "totals": summarize(rows),
+        "categories": {name: summarize(items) for name, items in by_category.items()},
+        "series": [
+            {"bucket": datetime.fromtimestamp(bucket, timezone.utc).isoformat().replace("+00:00", "Z"), **summarize(items)}
+            for bucket, items in by_bucket.items()
+        ]
+    }
+
+async def _start_background_duties():
+    # 재시작 전에 남은 렌더링 작업 이어서 처리
+    get_render_queue().start()
+    if CRAWL_SCHEDULER_ENABLED:
+        get_crawl_scheduler().start()
+
+async def _stop_background_duties():
+    if _crawl_scheduler is not None:
+        await _crawl_scheduler.stop()
+    if _render_queue is not None:
+        await _render_queue.stop()
+
 # FastAPI 앱 초기화
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("🚀 ADVANCED NEWS AUTOMATION 시작 (MoviePy 제거)")
+    ensure_directories()
     
     try:
-        init_enhanced_db()
+        database = get_database()
+        await database.run_write(init_enhanced_db)
+        await get_dedup_index().refresh()
     except Exception as e:
         logger.error(f"DB 초기화 실패: {e}")
     
+    # 워커가 여러 개여도 크롤링 스케줄러/렌더링 디스패처는 선출된 워커 하나에서만 실행
+    try:
+        await get_leader_election().start(_start_background_duties, _stop_background_duties)
+    except Exception as e:
+        logger.error(f"리더 선출 시작 실패: {e}")
+    
     yield
+    
+    await get_leader_election().stop()
+    await _stop_background_duties()
+    if _news_scraper is not None:
+        await _news_scraper.close()
+    shutdown_render_executor()
+    if _tts_service is not None:
+        _tts_service.shutdown()
+    close_database()
 
 app = FastAPI(
     title="ADVANCED NEWS AUTOMATION", 
@@ -794,9 +4097,24 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 라우트별 요청 지연 시간 (경로 템플릿 단위로 집계해 라벨 수 제한)
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        route_path = getattr(route, "path", None) or "unmatched"
+        HTTP_REQUEST_SECONDS.observe(request.method, route_path, status, value=time.perf_counter() - started)
+
 # 정적 파일 서빙
 try:
-    app.mount("/generated_videos", StaticFiles(directory=VIDEO_OUTPUT_DIR), name="videos")
+    # 디렉토리는 lifespan에서 생성되므로 마운트 시점 확인은 생략
+    app.mount("/generated_videos", StaticFiles(directory=VIDEO_OUTPUT_DIR, check_dir=False), name="videos")
     logger.info("✅ 정적 파일 마운트 완료")
 except Exception as e:
     logger.warning(f"⚠️ 정적 파일 마운트 실패: {e}")
@@ -810,6 +4128,85 @@ _news_scraper = None
 _content_generator = None
 _instagram_service = None
 _reels_producer = None
+_dedup_index = None
+_database = None
+_render_executor = None
+_render_queue = None
+_render_cache = None
+_tts_service = None
+_crawl_scheduler = None
+_leader_election = None
+_response_cache = None
+
+def get_database():
+    global _database
+    if _database is None:
+        _database = Database()
+    return _database
+
+def get_render_executor():
+    global _render_executor
+    if _render_executor is None:
+        _render_executor = ProcessPoolExecutor(
+            max_workers=RENDER_WORKERS,
+            mp_context=multiprocessing.get_context(RENDER_START_METHOD)
+        )
+        logger.info(f"🧵 렌더링 프로세스 풀 시작: {RENDER_WORKERS}개 워커")
+    return _render_executor
+
+def get_render_queue():
+    global _render_queue
+    if _render_queue is None:
+        _render_queue = RenderQueue()
+    return _render_queue
+
+def get_leader_election():
+    global _leader_election
+    if _leader_election is None:
+        _leader_election = LeaderElection()
+    return _leader_election
+
+def get_response_cache():
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache()
+    return _response_cache
+
+def get_crawl_scheduler():
+    global _crawl_scheduler
+    if _crawl_scheduler is None:
+        _crawl_scheduler = CrawlScheduler()
+    return _crawl_scheduler
+
+def get_render_cache():
+    global _render_cache
+    if _render_cache is None:
+        _render_cache = RenderCache()
+    return _render_cache
+
+def get_tts_service():
+    global _tts_service
+    if _tts_service is None:
+        _tts_service = TTSService()
+    return _tts_service
+
+def shutdown_render_executor():
+    global _render_executor
+    if _render_executor is not None:
+        _render_executor.shutdown(wait=False, cancel_futures=True)
+        _render_executor = None
+
+def close_database():
+    global _database
+    if _database is not None:
+        _database.close()
+        _database = None
+
+def get_dedup_index():
+    global _dedup_index
+    if _dedup_index is None:
+        _dedup_index = DedupIndex()
+    return _dedup_index
 
 def get_news_scraper():
     global _news_scraper
@@ -961,37 +4358,7 @@ async def scrape_news_api(request: NewsRequest):
             }
         
         # DB에 저장
-        saved_news = []
-        try:
-            conn = sqlite3.connect("news_automation.db")
-            cursor = conn.cursor()
-            
-            for news in news_list:
-                cursor.execute("""
-                    INSERT INTO news_articles 
-                    (title, title_hash, link, summary, source, category, keywords, viral_score, scraped_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    news['title'],
-                    news['title_hash'],
-                    news['link'],
-                    news['summary'],
-                    news['source'],
-                    news['category'],
-                    json.dumps(news['keywords']),
-                    news['viral_score'],
-                    news['scraped_at']
-                ))
-                
-                news_id = cursor.lastrowid
-                news['id'] = news_id
-                saved_news.append(news)
-            
-            conn.commit()
-            conn.close()
-            
-        except Exception as db_error:
-            logger.error(f"❌ DB 저장 오류: {db_error}")
+        saved_news = await save_news_articles(news_list)
         
         return {
             "success": True,
@@ -1007,7 +4374,585 @@ async def scrape_news_api(request: NewsRequest):
             "message": "뉴스 수집 중 오류가 발생했습니다"
         }
 
+@app.post("/api/scrape-news/stream")
+async def scrape_news_stream_api(request: NewsRequest):
+    """뉴스 수집 스트리밍 API (NDJSON - 저장된 뉴스를 즉시 전달 후 요약)"""
+    logger.info(f"📰 뉴스 스트리밍 수집 요청: {request.category}")
+    scraper = get_news_scraper()
+    
+    async def event_stream():
+        started = time.perf_counter()
+        first_article_seconds = None
+        saved_count = 0
+        top_heap = []
+        
+        try:
+            async for news_batch in scraper.stream_latest_news(request.category, request.max_articles):
+                saved_news = await save_news_articles(news_batch)
+                
+                for news in saved_news:
+                    if first_article_seconds is None:
+                        first_article_seconds = time.perf_counter() - started
+                    saved_count += 1
+                    
+                    # 상위 N개만 유지하는 최소 힙
+                    entry = (news['viral_score'], news['id'], {
+                        "id": news['id'],
+                        "title": news['title'],
+                        "link": news['link'],
+                        "viral_score": news['viral_score']
+                    })
+                    if len(top_heap) < request.top_n:
+                        heapq.heappush(top_heap, entry)
+                    elif request.top_n > 0 and entry[:2] > top_heap[0][:2]:
+                        heapq.heapreplace(top_heap, entry)
+                    
+                    yield json.dumps({"type": "article", "news": news}, ensure_ascii=False) + "\n"
+            
+            summary = {
+                "type": "summary",
+                "success": saved_count > 0,
+                "category": request.category,
+                "saved": saved_count,
+                "elapsed_seconds": round(time.perf_counter() - started, 2),
+                "first_article_seconds": round(first_article_seconds, 3) if first_article_seconds is not None else None,
+                "top": [item for _, _, item in sorted(top_heap, key=lambda x: x[:2], reverse=True)]
+            }
+        except Exception as e:
+            logger.error(f"❌ 뉴스 스트리밍 API 오류: {e}")
+            summary = {
+                "type": "summary",
+                "success": False,
+                "error": str(e),
+                "message": "뉴스 수집 중 오류가 발생했습니다"
+            }
+        
+        yield json.dumps(summary, ensure_ascii=False) + "\n"
+    
+    return StreamingResponse(event_stream(), media_type="application/x-ndjson")
+
+@app.post("/api/news/crawl")
+async def crawl_news_api(request: CrawlRequest):
+    """여러 카테고리 동시 뉴스 수집 API"""
+    try:
+        logger.info(f"🌐 동시 크롤링 요청: {request.categories}")
+        started = time.perf_counter()
+        
+        scraper = get_news_scraper()
+        result = await scraper.scrape_categories(request.categories, request.max_articles)
+        
+        if not result["news"]:
+            return {
+                "success": False,
+                "categories": result["categories"],
+                "message": "수집된 뉴스가 없습니다"
+            }
+        
+        saved_news = await save_news_articles(result["news"])
+        elapsed = time.perf_counter() - started
+        
+        queued_reels = []
+        if request.queue_reels and saved_news:
+            render_queue = get_render_queue()
+            queued_reels = await get_database().run_write(
+                render_queue.enqueue_many, saved_news, request.reel_style, request.reel_duration
+            )
+            render_queue.wake()
+        
+        if request.generate_captions and saved_news:
+            # 기사 수가 아니라 묶음 수만큼 요청
+            captions = await get_content_generator().generate_captions(saved_news, request.caption_style)
+            for news, caption in zip(saved_news, captions):
+                news['caption'] = caption
+        
+        return {
+            "success": True,
+            "message": f"{len(result['categories'])}개 카테고리에서 {len(saved_news)}개의 뉴스를 수집했습니다",
+            "categories": result["categories"],
+            "elapsed_seconds": round(elapsed, 2),
+            "queued_reels": queued_reels,
+            "news": saved_news
+        }
+        
+    except Exception as e:
+        logger.error(f"❌ 동시 크롤링 API 오류: {e}")
+        return {
+            "success": False, 
+            "error": str(e), 
+            "message": "동시 크롤링 중 오류가 발생했습니다"
+        }
+
+async def _cached_read_response(request: Request, key: tuple, build) -> Response:
+    """조회 API 공통 응답 - 캐시된 본문 재사용, If-None-Match가 일치하면 304"""
+    cache = get_response_cache()
+    database = get_database()
+    cache.sync(await database.run_read(read_content_version))
+    entry = cache.get(key)
+    if entry is None:
+        payload = {"success": True, **await database.run_read(build)}
+        entry = cache.store(key, json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+    
+    body, etag = entry
+    # 매번 재검증하도록 no-cache (변경이 없으면 304로 본문 생략)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def _read_limit(limit: int) -> int:
+    return max(1, min(limit, READ_API_MAX_LIMIT))
+
+@app.get("/api/news/trending")
+async def trending_news_api(request: Request, category: Optional[str] = None,
+                            limit: int = READ_API_DEFAULT_LIMIT, cursor: Optional[str] = None):
+    """트렌딩 뉴스 조회 API (viral_score 순, cursor로 다음 페이지)"""
+    limit = _read_limit(limit)
+    after = None
+    if cursor:
+        try:
+            score, news_id = cursor.rsplit(":", 1)
+            after = (float(score), int(news_id))
+        except ValueError:
+            return {
+                "success": False,
+                "message": f"잘못된 cursor: {cursor}"
+            }
+    
+    try:
+        return await _cached_read_response(
+            request, ("news", category, limit, after),
+            lambda: query_trending_news(category, limit, after)
+        )
+    except Exception as e:
+        logger.error(f"❌ 트렌딩 뉴스 조회 오류: {e}")
+        return {
+            "success": False,
+            "error": str(e),
+            "message": "트렌딩 뉴스 조회 중 오류가 발생했습니다"
+        }
+
+@app.get("/api/news/search")
+async def search_news_api(q: str, category: Optional[str] = None, days: Optional[float] = None,
+                          since: Optional[str] = None, until: Optional[str] = None,
+                          limit: int = READ_API_DEFAULT_LIMIT):
+    """뉴스 검색 API (since/until: ISO 날짜, days: 최근 N일)"""
+    if not q.strip():
+        return {
+            "success": False,
+            "message": "검색어를 입력하세요"
+        }
+    
+    since_epoch = _to_epoch(since) if since else None
+    until_epoch = _to_epoch(until) if until else None
+    if (since and since_epoch is None) or (until and until_epoch is None):
+        return {
+            "success": False,
+            "message": "since/until은 ISO 날짜 형식이어야 합니다 (예: 2024-08-01)"
+        }
+    if days is not None:
+        since_epoch = max(since_epoch or 0, time.time() - days * 86400)
+    
+    try:
+        started = time.perf_counter()
+        result = await get_database().run_read(
+            lambda: search_news(q, category, since_epoch, until_epoch, _read_limit(limit))
+        )
+        return {
+            "success": True,
+            "query": q,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+            **result
+        }
+    except Exception as e:
+        logger.error(f"❌ 뉴스 검색 오류: {e}")
+        return {
+            "success": False,
+            "error": str(e),
+            "message": "뉴스 검색 중 오류가 발생했습니다"
+        }
+
+@app.get("/api/analytics/performance")
+async def analytics_performance_api(request: Request, granularity: str = "daily", days: int = 7,
+                                    category: Optional[str] = None):
+    """성과 분석 API (롤업 테이블 기반, granularity: hourly/daily)"""
+    if granularity not in ANALYTICS_ROLLUPS:
+        return {
+            "success": False,
+            "message": f"지원하지 않는 granularity: {granularity} (hourly, daily)"
+        }
+    
+    _, bucket_seconds = ANALYTICS_ROLLUPS[granularity]
+    days = max(1, min(days, 365))
+    # 버킷 경계로 맞춰 같은 구간 안의 반복 요청은 같은 캐시 키 사용
+    since_epoch = int(time.time() - days * 86400) // bucket_seconds * bucket_seconds
+    
+    try:
+        return await _cached_read_response(
+            request, ("analytics", granularity, category, since_epoch),
+            lambda: {
+                "granularity": granularity,
+                "since": datetime.fromtimestamp(since_epoch, timezone.utc).isoformat().replace("+00:00", "Z"),
+                **query_analytics(granularity, since_epoch, category)
+            }
+        )
+    except Exception as e:
+        logger.error(f"❌ 성과 분석 API 오류: {e}")
+        return {
+            "success": False,
+            "error": str(e),
+            "message": "성과 분석 조회 중 오류가 발생했습니다"
+        }
+
+@app.get("/metrics")
+async def metrics():
+    """Prometheus 메트릭"""
+    try:
+        depth = await get_database().run_read(get_render_queue().depth)
+        RENDER_QUEUE_DEPTH.replace({(status,): count for status, count in depth.items()})
+    except Exception as e:
+        logger.warning(f"⚠️ 렌더링 큐 깊이 조회 실패: {e}")
+    
+    return Response(content=METRICS.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+@app.get("/api/crawl/schedule")
+async def crawl_schedule_api():
+    """백그라운드 크롤링 일정 조회 API"""
+    return {
+        "success": True,
+        "leader": get_leader_election().snapshot(),
+        **get_crawl_scheduler().snapshot()
+    }
+
+@app.post("/api/crawl/schedule/{category}/run")
+async def crawl_schedule_run_api(category: str):
+    """카테고리 즉시 크롤링 예약 API"""
+    scheduler = get_crawl_scheduler()
+    if not scheduler.running:
+        leader = await get_database().run_read(get_leader_election().current)
+        return {
+            "success": False,
+            "leader": leader,
+            "message": "이 워커에서는 크롤링 스케줄러가 실행 중이 아닙니다 (CRAWL_SCHEDULER_ENABLED 또는 리더 워커 확인)"
+        }
+    if not scheduler.run_now(category):
+        return {
+            "success": False,
+            "message": f"알 수 없는 카테고리: {category}"
+        }
+    return {
+        "success": True,
+        "message": f"{category} 크롤링을 즉시 실행합니다"
+    }
+
+@app.post("/api/reels/generate")
+async def generate_reel_api(request: ReelsRequest):
+    """릴스 제작 작업 등록 API (작업 id 즉시 반환)"""
+    try:
+        row = await get_database().fetchone(
+            "SELECT id, title, category, viral_score, scraped_epoch FROM news_articles WHERE id = ?",
+            (request.news_id,)
+        )
+        if row is None:
+            return {
+                "success": False,
+                "message": f"뉴스를 찾을 수 없습니다: {request.news_id}"
+            }
+        
+        producer = get_reels_producer()
+        job = await producer.start_reel_job(dict(row), request.video_style, request.duration)
+        job_id = job["job_id"]
+        
+        return {
+            "success": True,
+            "job_id": job_id,
+            "cached": job["cached"],
+            "status_url": f"/api/reels/jobs/{job_id}",
+            "message": "캐시된 릴스를 반환합니다" if job["cached"] else "릴스 제작 작업이 등록되었습니다"
+        }
+        
+    except Exception as e:
+        logger.error(f"❌ 릴스 작업 등록 오류: {e}")
+        return {
+            "success": False,
+            "error": str(e),
+            "message": "릴스 작업 등록 중 오류가 발생했습니다"
+        }
+
+@app.post("/api/reels/batch")
+async def generate_reels_batch_api(request: ReelsBatchRequest):
+    """릴스 일괄 제작 API (뉴스 id 목록 또는 카테고리 상위 N개)"""
+    try:
+        database = get_database()
+        if request.news_ids:
+            placeholders = ",".join("?" for _ in request.news_ids)
+            rows = await database.fetchall(
+                f"SELECT id, title, category, viral_score FROM news_articles WHERE id IN ({placeholders})",
+                tuple(request.news_ids)
+            )
+            order = {news_id: index for index, news_id in enumerate(request.news_ids)}
+            news_list = sorted((dict(row) for row in rows), key=lambda news: order[news['id']])
+        elif request.category:
+            rows = await database.fetchall("""
+                SELECT id, title, category, viral_score FROM news_articles
+                WHERE category = ? ORDER BY viral_score DESC, id DESC LIMIT ?
+            """, (request.category, request.top_n))
+            news_list = [dict(row) for row in rows]
+        else:
+            return {
+                "success": False,
+                "message": "news_ids 또는 category를 지정하세요"
+            }
+        
+        if not news_list:
+            return {
+                "success": False,
+                "message": "릴스를 만들 뉴스가 없습니다"
+            }
+        
+        producer = get_reels_producer()
+        result = await producer.create_reels_batch(news_list, request.video_style, request.duration)
+        
+        return {
+            "success": True,
+            "message": f"{len(news_list)}개 뉴스 릴스 일괄 처리 완료",
+            **result
+        }
+        
+    except Exception as e:
+        logger.error(f"❌ 릴스 일괄 제작 오류: {e}")
+        return {
+            "success": False,
+            "error": str(e),
+            "message": "릴스 일괄 제작 중 오류가 발생했습니다"
+        }
+
+@app.post("/api/captions/generate")
+async def generate_captions_api(request: CaptionRequest):
+    """캡션 일괄 생성 API (뉴스 id 목록 또는 카테고리 상위 N개)"""
+    try:
+        database = get_database()
+        if request.news_ids:
+            placeholders = ",".join("?" for _ in request.news_ids)
+            rows = await database.fetchall(
+                f"SELECT id, title, title_hash, summary FROM news_articles WHERE id IN ({placeholders})",
+                tuple(request.news_ids)
+            )
+            order = {news_id: index for index, news_id in enumerate(request.news_ids)}
+            news_list = sorted((dict(row) for row in rows), key=lambda news: order[news['id']])
+        elif request.category:
+            rows = await database.fetchall("""
+                SELECT id, title, title_hash, summary FROM news_articles
+                WHERE category = ? ORDER BY viral_score DESC, id DESC LIMIT ?
+            """, (request.category, request.top_n))
+            news_list = [dict(row) for row in rows]
+        else:
+            return {
+                "success": False,
+                "message": "news_ids 또는 category를 지정하세요"
+            }
+        
+        if not news_list:
+            return {
+                "success": False,
+                "message": "캡션을 만들 뉴스가 없습니다"
+            }
+        
+        generator = get_content_generator()
+        requests_before = generator.stats["requests"]
+        started = time.perf_counter()
+        captions = await generator.generate_captions(news_list, request.style)
+        
+        sources = {}
+        for caption in captions:
+            sources[caption["source"]] = sources.get(caption["source"], 0) + 1
+        
+        return {
+            "success": True,
+            "message": f"{len(captions)}개 캡션 생성 완료",
+            "elapsed_seconds": round(time.perf_counter() - started, 2),
+            "api_requests": generator.stats["requests"] - requests_before,
+            "sources": sources,
+            "captions": [{"news_id": news["id"], **caption} for news, caption in zip(news_list, captions)]
+        }
+        
+    except Exception as e:
+        logger.error(f"❌ 캡션 일괄 생성 API 오류: {e}")
+        return {
+            "success": False,
+            "error": str(e),
+            "message": "캡션 생성 중 오류가 발생했습니다"
+        }
+
+@app.get("/api/reels/queue")
+async def reel_queue_status_api():
+    """렌더링 큐 상태 API"""
+    render_queue = get_render_queue()
+    depth = await get_database().run_read(render_queue.depth)
+    return {
+        "success": True,
+        "owner": render_queue.owner,
+        "leader": get_leader_election().snapshot(),
+        "in_flight": render_queue.in_flight(),
+        "jobs": depth
+    }
+
+@app.get("/api/reels/cache")
+async def render_cache_status_api():
+    """렌더 캐시 상태 API"""
+    summary = await get_database().run_read(get_render_cache().summary)
+    return {
+        "success": True,
+        "cache": summary
+    }
+
+@app.get("/api/reels/jobs/{job_id}")
+async def reel_job_status_api(job_id: int):
+    """릴스 작업 진행 상황 API"""
+    job = await get_reels_producer().get_reel_job(job_id)
+    if job is None:
+        return {
+            "success": False,
+            "message": f"작업을 찾을 수 없습니다: {job_id}"
+        }
+    return {
+        "success": True,
+        "job": job
+    }
+
+@app.get("/api/reels/recent")
+async def recent_reels_api(request: Request, category: Optional[str] = None,
+                           limit: int = READ_API_DEFAULT_LIMIT, cursor: Optional[str] = None):
+    """최근 릴스 조회 API (완료된 릴스 최신순, cursor로 다음 페이지)"""
+    limit = _read_limit(limit)
+    before_id = None
+    if cursor:
+        try:
+            before_id = int(cursor)
+        except ValueError:
+            return {
+                "success": False,
+                "message": f"잘못된 cursor: {cursor}"
+            }
+    
+    try:
+        return await _cached_read_response(
+            request, ("reels", category, limit, before_id),
+            lambda: query_recent_reels(category, limit, before_id)
+        )
+    except Exception as e:
+        logger.error(f"❌ 최근 릴스 조회 오류: {e}")
+        return {
+            "success": False,
+            "error": str(e),
+            "message": "최근 릴스 조회 중 오류가 발생했습니다"
+        }
+
+# ===== 시작 시간 진단 (CLI) =====
+STARTUP_HEALTH_BUDGET_SECONDS = float(os.getenv('STARTUP_HEALTH_BUDGET_SECONDS', '5'))
+
+def print_import_report(top: int = 20):
+    """-X importtime으로 새 프로세스에서 모듈을 import해 누적 시간 상위 모듈 출력"""
+    import subprocess
+    
+    module_dir = os.path.dirname(os.path.abspath(__file__))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import clean_news_automation"],
+        cwd=module_dir, capture_output=True, text=True
+    )
+    
+    # 자식 import가 부모보다 먼저 출력되므로, 모듈 줄이 나올 때까지 쌓인 1단계 항목이 직접 import
+    entries = []
+    children = []
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip())) // 2
+        entry = (int(cumulative_us), int(self_us), name.strip())
+        entries.append(entry)
+        if depth == 1:
+            children.append(entry)
+        elif depth == 0:
+            if entry[2] == "clean_news_automation":
+                total = entry[0]
+                break
+            children = []
+    
+    print(f"📦 clean_news_automation import 시간: {total / 1000:.0f}ms")
+    print(f"{'누적(ms)':>10} {'자체(ms)':>10}  모듈")
+    for cumulative, self_us, name in sorted(children, reverse=True)[:top]:
+        print(f"{cumulative / 1000:>10.1f} {self_us / 1000:>10.1f}  {name}")
+    
+    loaded = [name for name in ("cv2", "numpy", "aiohttp", "feedparser", "openai", "gtts", "PIL", "bs4")
+              if any(entry[2] == name for entry in entries)]
+    print(f"⚠️ import 시 로드된 무거운 모듈: {', '.join(loaded)}" if loaded else "✅ 무거운 모듈은 첫 사용 시 로드됨")
+
+def check_startup_budget(budget: float = STARTUP_HEALTH_BUDGET_SECONDS) -> bool:
+    """uvicorn 프로세스를 띄우고 /health가 응답할 때까지의 시간을 예산과 비교"""
+    import subprocess
+    import tempfile
+    import urllib.request
+    
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    
+    # 빈 작업 디렉토리에서 실행해 실제 배포의 첫 기동(DB 생성/마이그레이션 포함)을 재현
+    module_dir = os.path.dirname(os.path.abspath(__file__))
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [module_dir, os.getenv("PYTHONPATH")]))}
+    env.pop("DATABASE_PATH", None)
+    
+    # 프로세스 종료 후 작업 디렉토리(DB, 캐시 파일) 삭제
+    with tempfile.TemporaryDirectory(prefix="startup_check_") as workdir:
+        started = time.perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "clean_news_automation:app", "--host", "127.0.0.1", "--port", str(port)],
+            cwd=workdir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        elapsed = None
+        try:
+            deadline = started + max(budget * 3, 30)
+            while time.perf_counter() < deadline and process.poll() is None:
+                try:
+                    with urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1) as response:
+                        if response.status == 200:
+                            elapsed = time.perf_counter() - started
+                            break
+                except OSError:
+                    time.sleep(0.05)
+        finally:
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+    
+    if elapsed is None:
+        print(f"❌ /health 응답 없음 (프로세스 종료 코드: {process.returncode})")
+        return False
+    
+    passed = elapsed <= budget
+    print(f"{'✅' if passed else '❌'} 프로세스 시작 후 /health 응답까지 {elapsed:.2f}초 (예산 {budget:.1f}초)")
+    return passed
+
 if __name__ == "__main__":
+    if "--import-report" in sys.argv:
+        print_import_report()
+        sys.exit(0)
+    if "--startup-check" in sys.argv:
+        sys.exit(0 if check_startup_budget() else 1)
+    if "--rebuild-analytics" in sys.argv:
+        init_enhanced_db()
+        with get_database().transaction() as conn:
+            counts = rebuild_analytics_rollups(conn.cursor())
+        print(f"📊 분석 롤업 재계산 완료: {counts}")
+        close_database()
+        sys.exit(0)
+    
+    import uvicorn
+    
     env_name = "Railway" if IS_RAILWAY else "Render" if IS_RENDER else "Local"
     print(f"🚀 NEWS AUTOMATION 시작 ({env_name})")
     print("🎯 MoviePy 완전 제거 - HTTP 502 오류 해결!")
@@ -20,6 +20,14 @@ def main():
         print(f"❌ 잘못된 포트 값: {port}, 기본값 8000 사용")
         port_int = 8000
     
+    # 워커 수 (백그라운드 크롤링/렌더링은 DB 리더 임대로 워커 하나만 실행)
+    workers = os.environ.get('WEB_CONCURRENCY', '1')
+    try:
+        workers_int = max(1, int(workers))
+    except ValueError:
+        print(f"❌ 잘못된 WEB_CONCURRENCY 값: {workers}, 기본값 1 사용")
+        workers_int = 1
+    
     # Railway 환경 설정
     os.environ['RAILWAY'] = 'true'
     os.environ['ENVIRONMENT'] = 'production'
@@ -27,6 +35,7 @@ def main():
     print("🚀 Railway에서 News Automation 시작...")
     print(f"📍 포트: {port_int}")
     print(f"🌐 호스트: 0.0.0.0")
+    print(f"👷 워커: {workers_int}")
     
     # uvicorn 명령어 구성
     cmd = [
@@ -34,7 +43,7 @@ def main():
         'clean_news_automation:app',
         '--host', '0.0.0.0',
         '--port', str(port_int),
-        '--workers', '1'
+        '--workers', str(workers_int)
     ]
     
     print(f"🔧 실행 명령어: {' '.join(cmd)}")
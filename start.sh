@@ -10,6 +10,9 @@ else
     echo "✅ PORT 환경변수 설정됨: $PORT"
 fi
 
+# 워커 수 (백그라운드 크롤링/렌더링은 DB 리더 임대로 워커 하나만 실행)
+WEB_CONCURRENCY=${WEB_CONCURRENCY:-1}
+
 # Railway 환경 설정
 export RAILWAY=true
 export ENVIRONMENT=production
@@ -17,6 +20,7 @@ export ENVIRONMENT=production
 echo "🚀 Railway에서 앱 시작 중..."
 echo "📍 포트: $PORT"
 echo "🌐 호스트: 0.0.0.0"
+echo "👷 워커: $WEB_CONCURRENCY"
 
 # uvicorn으로 앱 실행
-exec uvicorn clean_news_automation:app --host 0.0.0.0 --port $PORT
\ No newline at end of file
+exec uvicorn clean_news_automation:app --host 0.0.0.0 --port $PORT --workers $WEB_CONCURRENCY
\ No newline at end of file
@@ -0,0 +1,32 @@
+# tests/conftest.py - 앱 모듈 import 전에 임시 작업 디렉토리와 환경변수 설정
+import atexit
+import os
+import shutil
+import sys
+import tempfile
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WORKDIR = tempfile.mkdtemp(prefix="news_test_")
+atexit.register(shutil.rmtree, WORKDIR, True)
+
+os.chdir(WORKDIR)
+os.environ.update({
+    "DATABASE_PATH": os.path.join(WORKDIR, "test.db"),
+    "CRAWL_SCHEDULER_ENABLED": "false",
+    "TTS_ENGINE": "stub"
+})
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, os.path.join(REPO_ROOT, "benchmarks"))
+
+@pytest.fixture
+def temp_database(tmp_path, monkeypatch):
+    """테스트 하나만 쓰는 빈 DB (마이그레이션 적용 후 get_database()가 반환)"""
+    import clean_news_automation as news_app
+
+    database = news_app.Database(str(tmp_path / "isolated.db"))
+    monkeypatch.setattr(news_app, "_database", database)
+    assert news_app.init_enhanced_db()
+    yield database
+    database.close()
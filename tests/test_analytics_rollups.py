@@ -0,0 +1,119 @@
+# tests/test_analytics_rollups.py - 트리거로 갱신한 롤업과 전체 재계산 결과 비교
+import random
+import time
+
+import clean_news_automation as news_app
+
+CATEGORIES = ["stock", "politics", "technology", None]
+REEL_STATUSES = ["queued", "rendering", "created", "failed"]
+
+def _snapshot(conn) -> dict:
+    """롤업 테이블 상태 (값이 모두 0인 행은 재계산 시 생기지 않으므로 제외)"""
+    state = {}
+    for table, _ in news_app.ANALYTICS_ROLLUPS.values():
+        for row in conn.execute(f"SELECT * FROM {table}").fetchall():
+            row = dict(row)
+            if not row["article_count"] and not row["reels_created"]:
+                continue
+            key = (table, row.pop("bucket_epoch"), row.pop("category"))
+            state[key] = {name: round(value, 6) if isinstance(value, float) else value for name, value in row.items()}
+    return state
+
+def _assert_matches_rebuild(database):
+    with database.transaction() as conn:
+        incremental = _snapshot(conn)
+        news_app.rebuild_analytics_rollups(conn.cursor())
+        rebuilt = _snapshot(conn)
+    assert incremental == rebuilt
+
+def _random_operation(conn, rng: random.Random, base_epoch: float):
+    article_ids = [row[0] for row in conn.execute("SELECT id FROM news_articles").fetchall()]
+    reel_ids = [row[0] for row in conn.execute("SELECT id FROM news_reels").fetchall()]
+    epoch = base_epoch + rng.uniform(0, 3 * 86400)
+    score = rng.choice([None, round(rng.uniform(0, 100), 2)])
+    roll = rng.random()
+
+    if roll < 0.25 or not article_ids:
+        conn.execute(
+            "INSERT INTO news_articles (title, category, viral_score, view_count, scraped_epoch) VALUES (?, ?, ?, ?, ?)",
+            (f"기사 {rng.random()}", rng.choice(CATEGORIES), score, rng.randint(0, 50), epoch)
+        )
+    elif roll < 0.45:
+        conn.execute(
+            "INSERT INTO news_reels (news_id, style, duration, status, file_size_mb, view_count, like_count, created_epoch) "
+            "VALUES (?, 'trending', 15, ?, ?, ?, ?, ?)",
+            (rng.choice(article_ids + [999999]), rng.choice(REEL_STATUSES), round(rng.uniform(0.5, 9), 2),
+             rng.randint(0, 500), rng.randint(0, 50), epoch)
+        )
+    elif roll < 0.55:
+        # 카테고리 변경 - 완료된 릴스 집계도 따라 이동
+        conn.execute("UPDATE news_articles SET category = ? WHERE id = ?",
+                     (rng.choice(CATEGORIES), rng.choice(article_ids)))
+    elif roll < 0.65:
+        # 최고 점수 기사의 점수를 낮추면 viral_score_max 재계산
+        conn.execute("UPDATE news_articles SET viral_score = ?, view_count = view_count + ? WHERE id = ?",
+                     (score, rng.randint(0, 10), rng.choice(article_ids)))
+    elif roll < 0.72:
+        conn.execute("UPDATE news_articles SET scraped_epoch = ? WHERE id = ?", (epoch, rng.choice(article_ids)))
+    elif roll < 0.8:
+        # 원본 기사 삭제 - 릴스는 'unknown'으로 집계
+        conn.execute("DELETE FROM news_articles WHERE id = ?", (rng.choice(article_ids),))
+    elif reel_ids and roll < 0.9:
+        conn.execute(
+            "UPDATE news_reels SET status = ?, file_size_mb = ?, view_count = view_count + ?, like_count = like_count + ? "
+            "WHERE id = ?",
+            (rng.choice(REEL_STATUSES), round(rng.uniform(0.5, 9), 2), rng.randint(0, 20), rng.randint(0, 5),
+             rng.choice(reel_ids))
+        )
+    elif reel_ids and roll < 0.95:
+        conn.execute("UPDATE news_reels SET news_id = ?, created_epoch = ? WHERE id = ?",
+                     (rng.choice(article_ids), epoch, rng.choice(reel_ids)))
+    elif reel_ids:
+        conn.execute("DELETE FROM news_reels WHERE id = ?", (rng.choice(reel_ids),))
+
+def test_randomized_operations_match_rebuild(temp_database):
+    base_epoch = time.time() - 3 * 86400
+    for seed in range(4):
+        rng = random.Random(seed)
+        for _ in range(10):
+            with temp_database.transaction() as conn:
+                for _ in range(30):
+                    _random_operation(conn, rng, base_epoch)
+            _assert_matches_rebuild(temp_database)
+
+def test_recategorize_orphan_and_max_recompute(temp_database):
+    epoch = 1_700_000_000
+    bucket = epoch // 3600 * 3600
+
+    def hourly(category):
+        row = temp_database.fetchone_sync(
+            "SELECT * FROM analytics_hourly WHERE bucket_epoch = ? AND category = ?", (bucket, category)
+        )
+        return dict(row) if row else None
+
+    top_id = temp_database.execute_sync(
+        "INSERT INTO news_articles (title, category, viral_score, scraped_epoch) VALUES ('최고', 'stock', 90, ?)", (epoch,)
+    )
+    other_id = temp_database.execute_sync(
+        "INSERT INTO news_articles (title, category, viral_score, scraped_epoch) VALUES ('보통', 'stock', 40, ?)", (epoch,)
+    )
+    temp_database.execute_sync(
+        "INSERT INTO news_reels (news_id, style, duration, status, file_size_mb, created_epoch) "
+        "VALUES (?, 'trending', 15, 'created', 2.5, ?)", (other_id, epoch)
+    )
+    assert hourly("stock")["viral_score_max"] == 90 and hourly("stock")["reels_created"] == 1
+
+    # 최고 점수 기사 삭제 - 남은 기사로 최고 점수 재계산
+    temp_database.execute_sync("DELETE FROM news_articles WHERE id = ?", (top_id,))
+    assert hourly("stock")["viral_score_max"] == 40
+
+    # 카테고리 변경 - 기사와 완료된 릴스 모두 이동
+    temp_database.execute_sync("UPDATE news_articles SET category = 'politics' WHERE id = ?", (other_id,))
+    assert hourly("stock")["article_count"] == 0 and hourly("stock")["reels_created"] == 0
+    assert hourly("politics")["article_count"] == 1 and hourly("politics")["reels_created"] == 1
+
+    # 원본 기사 삭제 - 릴스는 'unknown'으로
+    temp_database.execute_sync("DELETE FROM news_articles WHERE id = ?", (other_id,))
+    assert hourly("politics")["reels_created"] == 0
+    assert hourly("unknown")["reels_created"] == 1 and hourly("unknown")["reel_size_mb"] == 2.5
+    _assert_matches_rebuild(temp_database)
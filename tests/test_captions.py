@@ -0,0 +1,84 @@
+# tests/test_captions.py - OpenAI 대역 서버로 캡션 묶음 요청/캐시/재시도/폴백 확인
+import asyncio
+import math
+
+import pytest
+
+import clean_news_automation as news_app
+from openai_server import MockOpenAIServer
+
+def _news(prefix: str, count: int) -> list:
+    return [{"title": f"{prefix} 캡션 테스트 기사 {i}", "summary": f"{prefix} 요약 {i}"} for i in range(count)]
+
+@pytest.fixture
+def caption_env(monkeypatch):
+    """대역 서버를 띄우고 그 주소를 쓰는 캡션 생성기를 만들어 코루틴 실행"""
+    assert news_app.init_enhanced_db()
+    monkeypatch.setenv("OPENAI_API_KEY", "mock")
+    monkeypatch.setattr(news_app, "CAPTION_RETRY_BASE_SECONDS", 0.01)
+    monkeypatch.setattr(news_app, "CAPTION_REQUESTS_PER_MINUTE", 6000)
+
+    def run(server: MockOpenAIServer, scenario):
+        async def main():
+            monkeypatch.setattr(news_app, "OPENAI_BASE_URL", await server.start())
+            try:
+                generator = news_app.AdvancedContentGenerator()
+                assert generator.async_capable
+                return await scenario(generator)
+            finally:
+                await server.stop()
+        return asyncio.run(main())
+    return run
+
+def test_batches_requests_and_reuses_cache(caption_env):
+    server = MockOpenAIServer(latency=0.01)
+    news_list = _news("묶음", 21)
+    batch_size = 8
+
+    async def scenario(generator):
+        first = await generator.generate_captions(news_list, "viral", batch_size=batch_size)
+        requests_after_first = server.stats["requests"]
+        second = await generator.generate_captions(news_list, "viral", batch_size=batch_size)
+        return first, requests_after_first, second
+
+    first, requests_after_first, second = caption_env(server, scenario)
+    assert requests_after_first == math.ceil(len(news_list) / batch_size)
+    assert server.stats["max_batch"] == batch_size
+    assert [caption["source"] for caption in first] == ["openai"] * len(news_list)
+    # 같은 기사 재요청은 caption_cache에서 응답 (추가 API 요청 없음)
+    assert server.stats["requests"] == requests_after_first
+    assert [caption["source"] for caption in second] == ["cache"] * len(news_list)
+    assert [caption["caption"] for caption in second] == [caption["caption"] for caption in first]
+
+def test_retries_rate_limits_and_server_errors(caption_env, monkeypatch):
+    monkeypatch.setattr(news_app, "CAPTION_MAX_RETRIES", 20)
+    server = MockOpenAIServer(latency=0.0, rate_limit_rate=0.4, error_rate=0.3, retry_after=0.01, seed=7)
+    news_list = _news("재시도", 12)
+
+    async def scenario(generator):
+        captions = await generator.generate_captions(news_list, "viral", batch_size=4)
+        return captions, dict(generator.stats)
+
+    captions, stats = caption_env(server, scenario)
+    assert server.stats["rate_limited"] > 0
+    assert server.stats["errors"] > 0
+    assert stats["retries"] == server.stats["rate_limited"] + server.stats["errors"]
+    assert [caption["source"] for caption in captions] == ["openai"] * len(news_list)
+
+def test_timeout_falls_back_to_template(caption_env, monkeypatch):
+    monkeypatch.setattr(news_app, "CAPTION_TIMEOUT_SECONDS", 0.2)
+    server = MockOpenAIServer(latency=1.0)
+    news_list = _news("시간초과", 3)
+
+    async def scenario(generator):
+        captions = await generator.generate_captions(news_list, "viral", batch_size=8)
+        cached = await news_app.get_database().run_read(
+            generator._lookup_cached, [generator._title_hash(news) for news in news_list], "viral"
+        )
+        return captions, cached
+
+    captions, cached = caption_env(server, scenario)
+    assert [caption["source"] for caption in captions] == ["fallback"] * len(news_list)
+    assert all(news["title"] in caption["caption"] for news, caption in zip(news_list, captions))
+    # 폴백 캡션은 캐시하지 않음
+    assert cached == {}
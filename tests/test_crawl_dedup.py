@@ -0,0 +1,51 @@
+# tests/test_crawl_dedup.py - 크롤링이 저장된 기사와 유사한 제목을 제외하는지 확인
+import asyncio
+import re
+import time
+
+from rss_server import FeedServer
+
+import clean_news_automation as news_app
+
+def _store(title: str, category: str):
+    """다른 워커가 저장한 기사처럼 DB에만 기록"""
+    scraper = news_app.AdvancedNewsScrapingSystem()
+    news_app.get_database().execute_sync(
+        "INSERT INTO news_articles (title, title_hash, category, scraped_epoch) VALUES (?, ?, ?, ?)",
+        (title, scraper._generate_title_hash(title), category, time.time())
+    )
+
+def test_second_crawl_rejects_near_duplicate_of_stored_title(temp_database, monkeypatch):
+    monkeypatch.setattr(news_app, "_dedup_index", news_app.DedupIndex())
+    server = FeedServer(items=6, latency=0)
+    term = news_app.NEWS_CATEGORIES["technology"]["search_terms"][0]
+    feed_titles = [
+        title.split(" - ")[0]
+        for title in re.findall(r"<item><title>(.*?)</title>", server.render_feed(term, 0))
+    ]
+
+    async def crawl():
+        scraper = news_app.AdvancedNewsScrapingSystem()
+        try:
+            return [news["title"] for news in await scraper.scrape_latest_news("technology", max_articles=20)]
+        finally:
+            await scraper.close()
+
+    async def main():
+        monkeypatch.setattr(news_app, "GOOGLE_NEWS_RSS_URL", await server.start())
+        try:
+            first = await crawl()
+            # 첫 제목은 단어 하나를 더한 유사 제목, 둘째 제목은 그대로 저장
+            _store(f"단독 {feed_titles[0]}", "technology")
+            _store(feed_titles[1], "technology")
+            second = await crawl()
+        finally:
+            await server.stop()
+        return first, second
+
+    first, second = asyncio.run(main())
+    assert feed_titles[0] in first and feed_titles[1] in first
+    assert feed_titles[0] not in second
+    # 같은 제목은 relaxed 수집에서 그대로 반환
+    assert feed_titles[1] in second
+    assert set(feed_titles[2:]) <= set(second)
@@ -0,0 +1,33 @@
+# tests/test_crawl_sweep.py - "all" 수집이 피드 요청을 한 라운드에 모두 보내는지 확인
+import asyncio
+import time
+
+from rss_server import FeedServer
+
+import clean_news_automation as news_app
+
+def test_all_sweep_takes_about_one_feed_latency(temp_database, monkeypatch):
+    latency = 0.5
+    feed_count = sum(
+        min(len(info["search_terms"]), news_app.SEARCH_TERMS_PER_CATEGORY)
+        for info in news_app.NEWS_CATEGORIES.values()
+    )
+    assert news_app.FEED_FETCH_CONCURRENCY >= feed_count
+
+    async def main():
+        server = FeedServer(items=10, latency=latency)
+        monkeypatch.setattr(news_app, "GOOGLE_NEWS_RSS_URL", await server.start())
+        scraper = news_app.AdvancedNewsScrapingSystem()
+        try:
+            started = time.perf_counter()
+            result = await scraper.scrape_categories("all", max_articles=10)
+            return result, time.perf_counter() - started, server.stats
+        finally:
+            await scraper.close()
+            await server.stop()
+
+    result, elapsed, stats = asyncio.run(main())
+    assert stats["requests"] == feed_count
+    assert all(count > 0 for count in result["categories"].values())
+    # 두 라운드로 나뉘면 지연 시간의 두 배 이상 걸림
+    assert elapsed < latency * 1.6
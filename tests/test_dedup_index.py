@@ -0,0 +1,50 @@
+# tests/test_dedup_index.py - 중복 인덱스 갱신 스레드와 만료 순서 확인
+import asyncio
+import threading
+import time
+
+import clean_news_automation as news_app
+
+def _insert_articles(titles: list, epoch: float) -> list:
+    scraper = news_app.AdvancedNewsScrapingSystem()
+    return news_app.get_database().insert_many_sync(
+        "INSERT INTO news_articles (title, title_hash, category, scraped_epoch) VALUES (?, ?, ?, ?)",
+        [(title, scraper._generate_title_hash(title), "domestic", epoch) for title in titles]
+    )
+
+def test_refresh_applies_rows_on_event_loop(monkeypatch):
+    assert news_app.init_enhanced_db()
+    index = news_app.DedupIndex()
+    threads = []
+    original_add = news_app.DedupIndex.add
+
+    def recording_add(self, *args, **kwargs):
+        threads.append(threading.current_thread())
+        return original_add(self, *args, **kwargs)
+
+    monkeypatch.setattr(news_app.DedupIndex, "add", recording_add)
+    _insert_articles(["워밍 대상 기사 하나", "워밍 대상 기사 둘"], time.time())
+
+    async def main():
+        warmed = await index.refresh()
+        # 다른 워커가 저장한 것처럼 DB에만 추가
+        _insert_articles(["나중에 저장된 다른 워커 기사"], time.time())
+        synced = await index.refresh()
+        unchanged = await index.refresh()
+        return warmed, synced, unchanged
+
+    warmed, synced, unchanged = asyncio.run(main())
+    assert warmed >= 2 and synced == 1 and unchanged == 0
+    assert threads and all(thread is threading.main_thread() for thread in threads)
+    assert index.find_near_duplicate("domestic", "나중에 저장된 다른 워커 기사") is not None
+
+def test_entries_added_out_of_order_still_expire():
+    index = news_app.DedupIndex(window_hours=1)
+    now = time.time()
+    index.add("domestic", "recent", now, title="최근에 저장된 기사 제목")
+    # 다른 워커에서 늦게 따라잡은, 이미 윈도우를 벗어난 기사
+    index.add("domestic", "stale", now - 2 * 3600, title="오래전에 저장된 다른 기사")
+    assert not index.contains("domestic", "stale")
+    assert index.find_near_duplicate("domestic", "오래전에 저장된 다른 기사") is None
+    assert index.contains("domestic", "recent")
+    assert len(index) == 1
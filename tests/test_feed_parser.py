@@ -0,0 +1,148 @@
+# tests/test_feed_parser.py - 증분 피드 파서, feedparser 폴백, limit 조기 중단과 캐시 확인
+import asyncio
+import time
+
+from aiohttp import web
+
+import clean_news_automation as news_app
+
+def _rss_item(i: int) -> str:
+    return (
+        f"<item><title>테스트 기사 {i} - 연합뉴스</title><link>https://news.example.com/{i}</link>"
+        f"<pubDate>Tue, 14 Nov 2023 22:{i % 60:02d}:00 GMT</pubDate><description>요약 {i}</description>"
+        f"<source url=\"https://yna.example.com\">연합뉴스 소스 제목</source></item>"
+    )
+
+def _rss(items: str) -> bytes:
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        f"<title>채널 제목</title><link>https://news.google.com</link>{items}</channel></rss>"
+    ).encode("utf-8")
+
+ATOM = (
+    '<?xml version="1.0" encoding="utf-8"?><feed xmlns="http://www.w3.org/2005/Atom"><title>Atom 피드</title>'
+    '<entry><title>아톰 기사</title><link rel="alternate" href="https://atom.example.com/1"/>'
+    "<updated>2023-11-14T22:13:20Z</updated><summary>아톰 요약</summary></entry></feed>"
+).encode("utf-8")
+
+def _parse_in_chunks(body: bytes, limit=None, chunk_size: int = 7) -> news_app.StreamingFeedParser:
+    parser = news_app.StreamingFeedParser(limit)
+    for start in range(0, len(body), chunk_size):
+        parser.feed(body[start:start + chunk_size])
+        if parser.done:
+            return parser
+    parser.close()
+    return parser
+
+def test_rss_items_ignore_google_news_source():
+    parser = _parse_in_chunks(_rss(_rss_item(1) + _rss_item(2)))
+    assert parser.finished
+    assert [entry["title"] for entry in parser.entries] == ["테스트 기사 1 - 연합뉴스", "테스트 기사 2 - 연합뉴스"]
+    assert parser.entries[0] == {
+        "title": "테스트 기사 1 - 연합뉴스",
+        "link": "https://news.example.com/1",
+        "published": "Tue, 14 Nov 2023 22:01:00 GMT",
+        "summary": "요약 1"
+    }
+
+def test_atom_entry_uses_link_href():
+    parser = _parse_in_chunks(ATOM)
+    assert parser.entries == [{
+        "title": "아톰 기사",
+        "link": "https://atom.example.com/1",
+        "published": "2023-11-14T22:13:20Z",
+        "summary": "아톰 요약"
+    }]
+
+class _FeedApp:
+    """경로별 본문을 돌려주는 로컬 서버 (/slow는 조각마다 지연)"""
+    def __init__(self, bodies: dict, chunk_delay: float = 0.05, chunk_size: int = 2048):
+        self.bodies = bodies
+        self.chunk_delay = chunk_delay
+        self.chunk_size = chunk_size
+        self.requests = {}
+        self._runner = None
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        path = request.match_info["name"]
+        self.requests[path] = self.requests.get(path, 0) + 1
+        body = self.bodies[path]
+        if path != "slow":
+            return web.Response(body=body, content_type="application/rss+xml")
+
+        response = web.StreamResponse(headers={"Content-Type": "application/rss+xml"})
+        await response.prepare(request)
+        for start in range(0, len(body), self.chunk_size):
+            await response.write(body[start:start + self.chunk_size])
+            await asyncio.sleep(self.chunk_delay)
+        await response.write_eof()
+        return response
+
+    async def start(self) -> str:
+        app = web.Application()
+        app.router.add_get("/{name}", self.handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        return f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+
+    async def stop(self):
+        await self._runner.cleanup()
+
+def _run_with_feeds(bodies: dict, scenario, **kwargs):
+    async def main():
+        feeds = _FeedApp(bodies, **kwargs)
+        base_url = await feeds.start()
+        scraper = news_app.AdvancedNewsScrapingSystem()
+        session = await scraper._get_session()
+        try:
+            return await scenario(scraper, session, base_url, feeds)
+        finally:
+            await scraper.close()
+            await feeds.stop()
+    return asyncio.run(main())
+
+def test_malformed_feeds_fall_back_to_feedparser():
+    items = "".join(_rss_item(i) for i in range(3))
+    bodies = {
+        # XML에 정의되지 않은 HTML 엔티티
+        "entity": _rss(items.replace("요약 1", "요약&nbsp;1")),
+        # 채널이 닫히지 않은 채 끊긴 문서
+        "truncated": _rss(items).split(b"</channel>")[0] + _rss_item(3).encode("utf-8")[:40]
+    }
+
+    async def scenario(scraper, session, base_url, feeds):
+        return {name: await scraper._fetch_feed_entries(session, f"{base_url}/{name}") for name in bodies}
+
+    before = news_app.FEED_PARSES._values.get(("feedparser",), 0)
+    results = _run_with_feeds(bodies, scenario)
+    assert news_app.FEED_PARSES._values.get(("feedparser",), 0) - before == 2
+    for name, entries in results.items():
+        titles = [entry["title"] for entry in entries]
+        assert titles[:3] == [f"테스트 기사 {i} - 연합뉴스" for i in range(3)], name
+    assert "요약" in results["entity"][1]["summary"]
+
+def test_limit_stops_reading_and_partial_entry_is_not_a_full_cache_hit():
+    # 약 300개 항목을 2KB 조각마다 50ms씩 보내면 전체 전송에 수 초 걸림
+    bodies = {"slow": _rss("".join(_rss_item(i) for i in range(300)))}
+
+    async def scenario(scraper, session, base_url, feeds):
+        url = f"{base_url}/slow"
+        started = time.perf_counter()
+        limited = await scraper._fetch_feed_entries(session, url, limit=5)
+        limited_seconds = time.perf_counter() - started
+        cached = scraper.feed_cache.get(url)
+        # 같은 개수 이하는 캐시, 더 많이 또는 전체를 원하면 다시 요청
+        smaller = await scraper._fetch_feed_entries(session, url, limit=3)
+        requests_after_smaller = feeds.requests["slow"]
+        full = await scraper._fetch_feed_entries(session, url)
+        return limited, limited_seconds, cached, smaller, requests_after_smaller, full, feeds
+
+    limited, limited_seconds, cached, smaller, requests_after_smaller, full, feeds = _run_with_feeds(bodies, scenario)
+    assert len(limited) == 5
+    assert limited_seconds < 1.0
+    assert cached["complete"] is False
+    assert len(smaller) == 5 and requests_after_smaller == 1
+    assert feeds.requests["slow"] == 2
+    assert len(full) == 300
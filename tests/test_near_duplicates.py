@@ -0,0 +1,25 @@
+# tests/test_near_duplicates.py - 유사 제목 중복 제거 기준 확인
+import clean_news_automation as news_app
+
+SYNDICATED = ("삼성전자 급등…", "삼성전자 주가 급등")
+OPPOSITE = ("삼성전자 급락…", "삼성전자 급등…")
+
+def _filter(titles: tuple) -> list:
+    scraper = news_app.AdvancedNewsScrapingSystem()
+    news_list = [{"title": title, "category": "economy"} for title in titles]
+    return [news["title"] for news in scraper._filter_duplicate_news(news_list, relaxed=True)]
+
+def test_syndicated_story_is_dropped():
+    assert _filter(SYNDICATED) == [SYNDICATED[0]]
+
+def test_opposite_meaning_titles_are_kept():
+    assert _filter(OPPOSITE) == list(OPPOSITE)
+
+def test_index_similarity_around_threshold():
+    index = news_app.NearDuplicateIndex()
+    index.add("economy", SYNDICATED[0])
+    match = index.query("economy", SYNDICATED[1])
+    assert match is not None and match["similarity"] >= index.threshold
+    assert index.query("economy", OPPOSITE[0]) is None
+    # 다른 카테고리는 비교하지 않음
+    assert index.query("technology", SYNDICATED[1]) is None
@@ -0,0 +1,74 @@
+# tests/test_reels_batch.py - 일괄 릴스 제작의 음성/스크립트와 렌더 캐시 공유 확인
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import clean_news_automation as news_app
+
+def _fake_render(skip_titles=()):
+    """영상 대신 작은 파일을 쓰는 렌더 워커 (skip_titles는 결과 목록에서 빠짐)"""
+    def render(items, style):
+        results = []
+        for item in items:
+            if item["title"] in skip_titles:
+                continue
+            with open(item["output_path"], "wb") as f:
+                f.write(b"\0" * 1024)
+            results.append({"cache_key": item["cache_key"], "success": True, "frames": 1, "render_seconds": 0.01})
+        return results
+    return render
+
+@pytest.fixture
+def batch_env(temp_database, tmp_path, monkeypatch):
+    executor = ThreadPoolExecutor(max_workers=2)
+    monkeypatch.setattr(news_app, "get_render_executor", lambda: executor)
+    monkeypatch.setattr(news_app, "_render_cache", news_app.RenderCache())
+    monkeypatch.setattr(news_app, "_tts_service", news_app.TTSService(engine=news_app.StubTTSEngine(),
+                                                                       audio_dir=str(tmp_path)))
+    yield temp_database
+    executor.shutdown(wait=True)
+
+def _news(count: int):
+    database = news_app.get_database()
+    news = []
+    for i in range(count):
+        title = f"일괄 제작 테스트 기사 {i}"
+        news_id = database.execute_sync(
+            "INSERT INTO news_articles (title, category, viral_score) VALUES (?, 'trending', 5.0)", (title,)
+        )
+        news.append({"id": news_id, "title": title, "category": "trending", "viral_score": 5.0})
+    return news
+
+def test_batch_reels_have_audio_and_cache_hits_return_them(batch_env, monkeypatch):
+    monkeypatch.setattr(news_app, "_render_reel_batch_process", _fake_render())
+    news = _news(3)
+    producer = news_app.ReelsProductionSystem()
+
+    async def main():
+        batch = await producer.create_reels_batch(news)
+        job = await producer.start_reel_job(news[1])
+        return batch, job
+
+    batch, job = asyncio.run(main())
+    rows = batch_env.fetchall_sync("SELECT id, status, audio_path, script FROM news_reels ORDER BY id")
+    assert [row["status"] for row in rows] == ["created"] * 3
+    assert all(row["audio_path"] and row["script"] for row in rows)
+    assert news[1]["title"] in rows[1]["script"]
+
+    # 단건 요청이 일괄 제작 결과를 캐시로 받아도 음성이 있음
+    assert job["cached"] is True and job["job_id"] == rows[1]["id"]
+    assert all("news" not in item for item in batch["items"])
+
+def test_missing_worker_result_fails_only_that_item(batch_env, monkeypatch):
+    news = _news(3)
+    monkeypatch.setattr(news_app, "_render_reel_batch_process", _fake_render(skip_titles={news[2]["title"]}))
+    producer = news_app.ReelsProductionSystem()
+
+    asyncio.run(producer.create_reels_batch(news))
+    rows = batch_env.fetchall_sync("SELECT news_id, status FROM news_reels ORDER BY id")
+    assert [row["status"] for row in rows] == ["created", "created", "failed"]
+    # 실패한 항목은 캐시 선점을 풀어 다시 시도할 수 있음
+    cache_key = news_app.RenderCache.key_for(news[2]["title"], "trending", 15)
+    state, _ = news_app.get_render_cache().claim(cache_key)
+    assert state == "claimed"
@@ -0,0 +1,54 @@
+# tests/test_render_cache.py - 렌더 캐시 선점 하트비트 확인
+import asyncio
+
+import clean_news_automation as news_app
+
+def _render_caches(claim_timeout: float):
+    assert news_app.init_enhanced_db()
+    first = news_app.RenderCache(claim_timeout=claim_timeout, poll_interval=0.05)
+    second = news_app.RenderCache(claim_timeout=claim_timeout, poll_interval=0.05)
+    second.owner = first.owner + ":other"
+    return first, second
+
+def test_long_render_keeps_claim():
+    first, second = _render_caches(claim_timeout=0.3)
+    cache_key = first.key_for("하트비트 테스트 제목", "trending", 15)
+    states = []
+
+    async def render():
+        # 선점 만료 시간보다 오래 걸리는 렌더링 중 다른 프로세스가 선점 시도
+        for _ in range(4):
+            await asyncio.sleep(0.25)
+            state, _ = await news_app.get_database().run_write(second.claim, cache_key)
+            states.append(state)
+        return 1.0
+
+    async def main():
+        return await first.get_or_render(cache_key, "/tmp/heartbeat.mp4", None, render)
+
+    entry = asyncio.run(main())
+    assert entry["cached"] is False
+    assert states == ["busy"] * 4
+
+def test_batch_claims_stay_fresh_until_released():
+    first, second = _render_caches(claim_timeout=0.3)
+    cache_keys = [first.key_for(f"일괄 제목 {i}", "trending", 15) for i in range(3)]
+    database = news_app.get_database()
+
+    async def main():
+        claimed = set()
+        async with first.keep_claimed(claimed):
+            for cache_key in cache_keys:
+                assert (await database.run_write(first.claim, cache_key))[0] == "claimed"
+                claimed.add(cache_key)
+            await asyncio.sleep(0.8)
+            busy = [(await database.run_write(second.claim, key))[0] for key in cache_keys]
+            # 해제된 키는 더 이상 갱신하지 않음
+            claimed.discard(cache_keys[0])
+            await asyncio.sleep(0.8)
+            after_release = (await database.run_write(second.claim, cache_keys[0]))[0]
+        return busy, after_release
+
+    busy, after_release = asyncio.run(main())
+    assert busy == ["busy"] * 3
+    assert after_release == "claimed"
@@ -0,0 +1,96 @@
+# tests/test_render_queue.py - 영속 렌더링 큐 등록/우선순위/임대 만료 재시도/하트비트 확인
+import time
+
+import clean_news_automation as news_app
+
+def _article(database, title: str, viral_score: float, scraped_epoch: float) -> dict:
+    news_id = database.execute_sync(
+        "INSERT INTO news_articles (title, category, viral_score, scraped_epoch) VALUES (?, 'technology', ?, ?)",
+        (title, viral_score, scraped_epoch)
+    )
+    return {"id": news_id, "title": title, "viral_score": viral_score, "scraped_epoch": scraped_epoch}
+
+def _job(database, reel_id: int) -> dict:
+    return dict(database.fetchone_sync("SELECT * FROM render_jobs WHERE reel_id = ?", (reel_id,)))
+
+def _reel_status(database, reel_id: int) -> str:
+    return database.fetchone_sync("SELECT status FROM news_reels WHERE id = ?", (reel_id,))["status"]
+
+def test_enqueue_reuses_active_job(temp_database):
+    queue = news_app.RenderQueue()
+    news = _article(temp_database, "등록 중복 확인 기사", 10.0, time.time())
+
+    reel_id, created = queue.enqueue(news, "trending", 15)
+    assert created
+    assert queue.enqueue(news, "trending", 15) == (reel_id, False)
+    # 스타일이나 길이가 다르면 별도 작업
+    assert queue.enqueue(news, "news", 15)[1]
+    assert queue.enqueue(news, "trending", 30)[1]
+    assert queue.depth() == {"pending": 3}
+
+    # 완료된 작업은 재사용하지 않음
+    job = queue.lease(1)[0]
+    queue.complete(job, {"video_path": "/tmp/done.mp4", "file_size_mb": 1.0})
+    new_reel_id, created = queue.enqueue(news, job["style"], job["duration"])
+    assert created and new_reel_id != job["reel_id"]
+
+def test_lease_orders_by_viral_score_and_freshness(temp_database):
+    queue = news_app.RenderQueue()
+    now = time.time()
+    low = _article(temp_database, "낮은 점수 기사", 10.0, now)
+    high = _article(temp_database, "높은 점수 기사", 50.0, now)
+    # 점수는 낮지만 훨씬 최신 (0.5 x 100시간 = +50)
+    fresh = _article(temp_database, "최신 기사", 10.0, now + 100 * 3600)
+    reel_ids = {news["title"]: queue.enqueue(news, "trending", 15)[0] for news in (low, high, fresh)}
+
+    assert queue.lease(1)[0]["reel_id"] == reel_ids["최신 기사"]
+    assert [job["reel_id"] for job in queue.lease(5)] == [reel_ids["높은 점수 기사"], reel_ids["낮은 점수 기사"]]
+    assert queue.lease(5) == []
+
+def test_expired_lease_is_retried_until_attempt_cap(temp_database, monkeypatch):
+    news = _article(temp_database, "워커 중단 기사", 30.0, time.time())
+    crashed = news_app.RenderQueue()
+    reel_id, _ = crashed.enqueue(news, "trending", 15)
+    # 임대 직후 만료되도록 (워커가 하트비트 없이 죽은 상황)
+    monkeypatch.setattr(news_app, "RENDER_LEASE_SECONDS", -1)
+
+    for attempt in range(1, news_app.RENDER_MAX_ATTEMPTS + 1):
+        survivor = news_app.RenderQueue()
+        assert survivor.requeue_expired() == (1 if attempt > 1 else 0)
+        job = survivor.lease(1)[0]
+        assert job["reel_id"] == reel_id and job["attempts"] == attempt
+        assert job["news_data"]["title"] == "워커 중단 기사"
+        assert _reel_status(temp_database, reel_id) == "rendering"
+
+    # 최대 시도 횟수를 넘긴 작업은 실패 처리
+    assert news_app.RenderQueue().requeue_expired() == 0
+    assert _job(temp_database, reel_id)["status"] == "failed"
+    assert _reel_status(temp_database, reel_id) == "failed"
+
+def test_failed_render_returns_to_queue(temp_database):
+    queue = news_app.RenderQueue()
+    news = _article(temp_database, "렌더링 오류 기사", 30.0, time.time())
+    reel_id, _ = queue.enqueue(news, "trending", 15)
+
+    queue.fail(queue.lease(1)[0], "인코더 오류")
+    assert _job(temp_database, reel_id)["status"] == "pending"
+    assert _reel_status(temp_database, reel_id) == "queued"
+    assert queue.lease(1)[0]["attempts"] == 2
+
+def test_heartbeat_extends_only_own_lease(temp_database, monkeypatch):
+    queue = news_app.RenderQueue()
+    other = news_app.RenderQueue()
+    news = _article(temp_database, "하트비트 기사", 30.0, time.time())
+    reel_id, _ = queue.enqueue(news, "trending", 15)
+
+    monkeypatch.setattr(news_app, "RENDER_LEASE_SECONDS", 0.2)
+    job = queue.lease(1)[0]
+    monkeypatch.setattr(news_app, "RENDER_LEASE_SECONDS", 60)
+    other.heartbeat([job["id"]])
+    assert _job(temp_database, reel_id)["lease_expires_epoch"] < time.time() + 1
+
+    queue.heartbeat([job["id"]])
+    assert _job(temp_database, reel_id)["lease_expires_epoch"] > time.time() + 50
+    time.sleep(0.3)
+    assert other.requeue_expired() == 0
+    assert _job(temp_database, reel_id)["lease_owner"] == queue.owner
@@ -0,0 +1,57 @@
+# tests/test_response_cache.py - 조회 API 응답 캐시 무효화 조건 확인
+import time
+
+import clean_news_automation as news_app
+
+def _content_version() -> int:
+    return news_app.read_content_version()
+
+def test_content_version_ignores_unrelated_writes():
+    assert news_app.init_enhanced_db()
+    database = news_app.get_database()
+    before = _content_version()
+
+    # 리더 임대 갱신, 렌더 캐시 하트비트, 캡션 캐시 저장은 조회 결과와 무관
+    election = news_app.LeaderElection()
+    election.try_acquire()
+    render_cache = news_app.RenderCache()
+    cache_key = render_cache.key_for("카운터 테스트", "trending", 15)
+    assert render_cache.claim(cache_key)[0] == "claimed"
+    render_cache.heartbeat([cache_key])
+    database.execute_sync(
+        "INSERT INTO caption_cache (title_hash, style, caption, created_epoch) VALUES (?, ?, ?, ?)",
+        ("hash", "viral", "캡션", time.time())
+    )
+    assert _content_version() == before
+
+def test_content_version_tracks_articles_and_created_reels():
+    assert news_app.init_enhanced_db()
+    database = news_app.get_database()
+    before = _content_version()
+
+    news_id = database.insert_many_sync(
+        "INSERT INTO news_articles (title, category, viral_score, scraped_epoch) VALUES (?, ?, ?, ?)",
+        [("카운터 기사", "technology", 50.0, time.time())]
+    )[0]
+    after_article = _content_version()
+    assert after_article > before
+
+    reel_id = database.insert_many_sync(
+        "INSERT INTO news_reels (news_id, style, duration, status) VALUES (?, 'trending', 15, 'rendering')",
+        [(news_id,)]
+    )[0]
+    database.execute_sync("UPDATE news_reels SET frames_written = 10 WHERE id = ?", (reel_id,))
+    assert _content_version() == after_article
+
+    database.execute_sync("UPDATE news_reels SET status = 'created', created_epoch = ? WHERE id = ?",
+                          (time.time(), reel_id))
+    assert _content_version() > after_article
+
+def test_response_cache_invalidates_on_version_change():
+    cache = news_app.ResponseCache()
+    cache.sync(1)
+    cache.store(("news", None), b"{}")
+    cache.sync(1)
+    assert cache.get(("news", None)) is not None
+    cache.sync(2)
+    assert cache.get(("news", None)) is None
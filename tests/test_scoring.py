@@ -0,0 +1,52 @@
+# tests/test_scoring.py - 일괄 바이럴 점수와 제목별 점수 일치 확인
+import re
+
+import clean_news_automation as news_app
+
+TITLES = [
+    "İİİİİİ",
+    "속보 나옴",
+    "평범",
+    "ẞtraße BREAKING news 2024!",
+    "코스피 3% 급등, 반도체 수출 회복?",
+    "Ⅻ İstanbul 단독 보도",
+    "",
+    "평범한 제목입니다 그냥 일상 뉴스",
+    # 텍스트에서 겹치는 키워드 (surge + urgent)
+    "Insurgent forces surge near capital today",
+    "insurgents attack base at dawn"
+]
+
+def _reference_score(engine, title: str, category=None) -> float:
+    """키워드마다 포함 여부를 따로 확인하는 단순 구현"""
+    lowered = title.lower()
+    score = 1.0 + sum(weight for term, weight in engine._category_weights(category).items() if term in lowered)
+    if re.search(r'\d+[%억만$배]', lowered):
+        score += 1.5
+    if re.search(r'[?!]', lowered):
+        score += 1.0
+    if 15 <= len(title) <= 60:
+        score += 1.0
+    return round(score, 2)
+
+def test_score_batch_matches_per_title_score():
+    engine = news_app.ViralScoringEngine()
+    for category in (None, "technology", "economy"):
+        expected = [engine.score(title, category) for title in TITLES]
+        assert engine.score_batch(TITLES, category) == expected
+
+def test_score_batch_with_length_changing_lowercase():
+    engine = news_app.ViralScoringEngine()
+    titles = ["İİİİİİ", "속보 나옴", "평범"]
+    assert engine.score_batch(titles) == [engine.score(title) for title in titles]
+
+def test_score_batch_matches_keyword_containment():
+    engine = news_app.ViralScoringEngine()
+    for category in (None, *news_app.NEWS_CATEGORIES):
+        expected = [_reference_score(engine, title, category) for title in TITLES]
+        assert engine.score_batch(TITLES, category) == expected
+
+def test_overlapping_keywords_are_all_counted():
+    engine = news_app.ViralScoringEngine()
+    assert engine.score("Insurgent forces surge near capital today") == 6.0
+    assert engine.score("insurgents attack base at dawn") == 6.0
@@ -0,0 +1,42 @@
+# tests/test_search_index.py - trigram 없이 마이그레이션된 DB에 검색 인덱스 나중에 생성
+import sqlite3
+import time
+
+import clean_news_automation as news_app
+
+def _fts_exists(conn) -> bool:
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'news_articles_fts'"
+    ).fetchone() is not None
+
+def test_fts_created_after_sqlite_upgrade(tmp_path, monkeypatch):
+    conn = news_app.connect_db(str(tmp_path / "upgrade.db"))
+    conn.row_factory = sqlite3.Row
+    conn.isolation_level = None
+
+    # 예전 SQLite: v9가 기록되지만 검색 인덱스는 없음
+    monkeypatch.setattr(news_app, "_fts5_trigram_available", lambda cursor: False)
+    version = news_app.migrate_db(conn)
+    assert version == news_app.SCHEMA_MIGRATIONS[-1][0]
+    assert not news_app.ensure_articles_fts(conn)
+    conn.execute(
+        "INSERT INTO news_articles (title, summary, category, scraped_epoch) VALUES (?, ?, ?, ?)",
+        ("반도체 수출 회복세 뚜렷", "요약", "economy", time.time())
+    )
+
+    # 업그레이드 후 시작: 인덱스 생성 및 기존 기사 백필
+    monkeypatch.undo()
+    assert news_app.ensure_articles_fts(conn)
+    assert _fts_exists(conn)
+    rows = conn.execute("SELECT rowid FROM news_articles_fts WHERE news_articles_fts MATCH ?", ('"수출 회복"',)).fetchall()
+    assert len(rows) == 1
+
+    # 이후 저장되는 기사는 트리거로 반영
+    conn.execute(
+        "INSERT INTO news_articles (title, summary, category, scraped_epoch) VALUES (?, ?, ?, ?)",
+        ("수출 회복에 환율 하락", "요약", "economy", time.time())
+    )
+    rows = conn.execute("SELECT rowid FROM news_articles_fts WHERE news_articles_fts MATCH ?", ('"수출 회복"',)).fetchall()
+    assert len(rows) == 2
+    assert news_app.ensure_articles_fts(conn)
+    conn.close()
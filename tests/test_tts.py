@@ -0,0 +1,93 @@
+# tests/test_tts.py - 스텁 엔진으로 TTS 합치기/캐시/정리 확인
+import asyncio
+import os
+import threading
+import time
+
+import clean_news_automation as news_app
+
+class SlowStubEngine(news_app.StubTTSEngine):
+    """호출 횟수를 세고 합성을 지연시키는 스텁 엔진"""
+    def __init__(self, delay: float = 0.2):
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def synthesize(self, text: str, lang: str, speed: float, output_path: str):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        super().synthesize(text, lang, speed, output_path)
+
+def _service(tmp_path, engine=None, **kwargs) -> news_app.TTSService:
+    return news_app.TTSService(engine=engine or SlowStubEngine(), audio_dir=str(tmp_path), **kwargs)
+
+def test_concurrent_requests_are_coalesced(tmp_path):
+    service = _service(tmp_path)
+
+    async def main():
+        return await asyncio.gather(*(service.synthesize("같은 문장") for _ in range(5)))
+
+    results = asyncio.run(main())
+    assert service.engine.calls == 1
+    assert service.stats["coalesced"] == 4
+    assert len({result["audio_path"] for result in results}) == 1
+    assert sum(not result["cached"] for result in results) == 1
+    service.shutdown()
+
+def test_repeated_request_hits_cache(tmp_path):
+    service = _service(tmp_path, SlowStubEngine(delay=0))
+
+    async def main():
+        first = await service.synthesize("캐시 문장")
+        second = await service.synthesize("캐시 문장")
+        other_speed = await service.synthesize("캐시 문장", speed=1.2)
+        return first, second, other_speed
+
+    first, second, other_speed = asyncio.run(main())
+    assert first["cached"] is False and second["cached"] is True
+    assert second["audio_path"] == first["audio_path"]
+    assert other_speed["audio_path"] != first["audio_path"]
+    assert service.engine.calls == 2
+    assert service.stats["hits"] == 1
+    service.shutdown()
+
+def test_evict_keeps_file_count_and_size_limits(tmp_path):
+    service = _service(tmp_path, SlowStubEngine(delay=0), max_files=3)
+
+    async def main():
+        for i in range(6):
+            await service.synthesize(f"정리 문장 {i}")
+            # mtime 순서가 구분되도록
+            await asyncio.sleep(0.02)
+
+    asyncio.run(main())
+    files = sorted(name for name in os.listdir(tmp_path) if name.startswith("tts_"))
+    assert len(files) == 3
+    assert service.stats["evictions"] == 3
+    # 가장 최근 파일은 남음
+    latest = os.path.basename(service.cache_path(service.cache_key("정리 문장 5", "ko", 1.0)))
+    assert latest in files
+
+    # 용량 제한: 파일 하나 크기보다 작게 잡으면 모두 정리
+    service.max_bytes = 1
+    service._evict()
+    assert not [name for name in os.listdir(tmp_path) if name.startswith("tts_")]
+    service.shutdown()
+
+def test_waiters_recover_when_owner_is_cancelled(tmp_path):
+    service = _service(tmp_path, SlowStubEngine(delay=0.3))
+
+    async def main():
+        owner = asyncio.create_task(service.synthesize("hello"))
+        await asyncio.sleep(0.05)
+        waiter = asyncio.create_task(service.synthesize("hello"))
+        await asyncio.sleep(0.05)
+        owner.cancel()
+        result = await asyncio.wait_for(waiter, timeout=3)
+        return owner, result
+
+    owner, result = asyncio.run(main())
+    assert owner.cancelled()
+    assert os.path.exists(result["audio_path"])
+    service.shutdown()